@@ -0,0 +1,43 @@
+-- Tables the API expects. IF NOT EXISTS keeps this safe on databases that
+-- were set up by hand or by the old init_db.py.
+
+CREATE TABLE IF NOT EXISTS students (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    cgpa FLOAT NULL,
+    iq FLOAT NULL,
+    prev_sem_result FLOAT NULL,
+    academic_performance FLOAT NULL,
+    communication_skills FLOAT NULL,
+    extra_curricular_score FLOAT NULL,
+    projects_completed INT NOT NULL DEFAULT 0,
+    internship_experience BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS admins (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS predictions (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    student_id INT,
+    IQ FLOAT,
+    Prev_Sem_Result FLOAT,
+    CGPA FLOAT,
+    Academic_Performance FLOAT,
+    Extra_Curricular_Score FLOAT,
+    Communication_Skills FLOAT,
+    Projects_Completed INT,
+    Internship_Experience_Yes INT,
+    predicted_status VARCHAR(10) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE SET NULL,
+    INDEX idx_predicted_status (predicted_status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,7 @@
+-- Top performers (ORDER BY cgpa DESC LIMIT n) becomes a backward index scan,
+-- and email lookups/duplicate checks become unique-index lookups.
+-- Fails if existing rows share an email; de-duplicate them first.
+
+ALTER TABLE students ADD INDEX idx_students_cgpa (cgpa);
+
+ALTER TABLE students ADD UNIQUE INDEX uq_students_email (email);
@@ -0,0 +1,4 @@
+-- A student's prediction history (WHERE student_id = ? ORDER BY created_at DESC)
+-- is read straight from this index instead of filtering the whole table.
+
+ALTER TABLE predictions ADD INDEX idx_predictions_student_created (student_id, created_at);
@@ -0,0 +1,30 @@
+-- Resumable cohort re-scoring (services/rescore.py). A job walks students in id
+-- order; last_student_id is its checkpoint, committed with each chunk's
+-- predictions so a restarted job picks up exactly where it stopped.
+
+CREATE TABLE IF NOT EXISTS rescore_jobs (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    status VARCHAR(20) NOT NULL,
+    model_version VARCHAR(64) NULL,
+    chunk_size INT NOT NULL,
+    concurrency INT NOT NULL,
+    rate_limit FLOAT NOT NULL DEFAULT 0,
+    max_student_id INT NOT NULL,
+    total INT NOT NULL,
+    last_student_id INT NOT NULL DEFAULT 0,
+    scored INT NOT NULL DEFAULT 0,
+    skipped INT NOT NULL DEFAULT 0,
+    error TEXT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP NULL,
+    finished_at TIMESTAMP NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_rescore_jobs_status (status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Predictions written by a job carry its id. One row per student per job, so
+-- re-running a chunk overwrites instead of duplicating; ad-hoc predictions
+-- keep run_id NULL, which the unique key does not constrain.
+ALTER TABLE predictions ADD COLUMN run_id INT NULL;
+
+ALTER TABLE predictions ADD UNIQUE INDEX uq_predictions_student_run (student_id, run_id);
@@ -0,0 +1,6 @@
+-- The process currently running a rescoring job (a random token per run).
+-- Checkpoints and the final status only apply while the row still names that
+-- owner, so a run whose lease was taken over by another process stops instead
+-- of writing alongside it.
+
+ALTER TABLE rescore_jobs ADD COLUMN owner VARCHAR(32) NULL;
@@ -0,0 +1,406 @@
+"""
+End-to-end load benchmark for the FastAPI app.
+
+Boots the API (and, unless --ml-backend=local, the stub model server from
+scripts/stub_model_server.py), seeds students through the bulk import
+endpoint, then drives every route at each concurrency level and reports
+throughput and latency percentiles per route as JSON.
+
+The API connects to whatever MySQL/MariaDB the DB_* variables in .env point
+at; run scripts/init_db.py against it first. Seeded students use
+`bench-<run id>-<n>@example.com` emails and are deleted afterwards.
+
+Usage:
+    python scripts/benchmark.py --students 2000 --concurrency 1,8,32 --requests 200 \\
+        --output bench.json
+    python scripts/benchmark.py --base-url http://127.0.0.1:8000 --compare bench.json
+"""
+import argparse
+import asyncio
+import io
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BACKEND_DIR, "src")
+
+
+# ---------- process management ----------
+
+def _start(cmd, cwd, env, name):
+    print(f"🔄 Starting {name}: {' '.join(cmd)}", file=sys.stderr)
+    # stderr goes to a file, not a pipe: nobody reads a pipe during the run,
+    # and a chatty server would block once it filled
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=log)
+    proc.log = log
+    return proc
+
+
+def _log_tail(proc, size: int = 2000) -> str:
+    proc.log.seek(0)
+    return proc.log.read().decode(errors="replace")[-size:]
+
+
+async def _wait_until_up(url: str, proc, timeout: float = 120.0):
+    """Poll `url` until it answers 200 (for the API, /readyz: pools and model warm)."""
+    deadline = time.monotonic() + timeout
+    last = "no response"
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if proc is not None and proc.poll() is not None:
+                raise RuntimeError(f"Process for {url} exited: {_log_tail(proc)}")
+            try:
+                response = await client.get(url, timeout=1.0)
+                if response.status_code == 200:
+                    return
+                last = f"{response.status_code} {response.text[:500]}"
+            except httpx.HTTPError as e:
+                last = type(e).__name__
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"Timed out waiting for {url} (last: {last})")
+
+
+def _stop(proc):
+    if proc is None:
+        return
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    proc.log.close()
+
+
+# ---------- measurement ----------
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_scenario(client, name, method, make_request, concurrency, total_requests, on_response=None):
+    """
+    Issue `total_requests` calls with `concurrency` workers and summarize the
+    latencies. `on_response` is called with each successful response.
+    """
+    latencies = []
+    statuses = {}
+    errors = 0
+    counter = iter(range(total_requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            path, kwargs = make_request(i)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                code = str(response.status_code)
+                if response.status_code >= 400:
+                    errors += 1
+                elif on_response is not None:
+                    on_response(response)
+            except httpx.HTTPError as e:
+                code = type(e).__name__
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[code] = statuses.get(code, 0) + 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    return {
+        "route": name,
+        "method": method,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "status_codes": statuses,
+        "duration_s": round(wall, 4),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+# ---------- seeding ----------
+
+def _seed_csv(run_id: str, count: int) -> bytes:
+    rng = random.Random(run_id)
+    out = io.StringIO()
+    out.write("name,email,cgpa,iq,prev_sem_result,academic_performance,communication_skills,"
+              "extra_curricular_score,projects_completed,internship_experience\n")
+    for i in range(count):
+        out.write(
+            f"Bench Student {i},bench-{run_id}-{i}@example.com,"
+            f"{rng.uniform(5, 10):.2f},{rng.randint(70, 140)},{rng.uniform(5, 10):.2f},"
+            f"{rng.randint(1, 10)},{rng.randint(1, 10)},{rng.randint(0, 10)},"
+            f"{rng.randint(0, 5)},{rng.choice(['true', 'false'])}\n"
+        )
+    return out.getvalue().encode()
+
+
+async def seed_students(client, run_id: str, count: int) -> list:
+    response = await client.post(
+        "/admin/students/import",
+        files={"file": ("bench.csv", _seed_csv(run_id, count), "text/csv")},
+        params={"batch_size": 1000},
+        timeout=600,
+    )
+    response.raise_for_status()
+    report = response.json()
+    if report["failed"]:
+        print(f"⚠️  {report['failed']} seed rows failed: {report['errors'][:3]}", file=sys.stderr)
+    return await find_seeded_ids(client, run_id)
+
+
+async def find_seeded_ids(client, run_id: str) -> list:
+    prefix = f"bench-{run_id}-"
+    ids = []
+    async with client.stream(
+        "GET", "/admin/students", params={"format": "ndjson", "fields": "email"}, timeout=600
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.strip():
+                row = json.loads(line)
+                if str(row.get("email", "")).startswith(prefix):
+                    ids.append(row["id"])
+    return ids
+
+
+async def delete_students(client, ids: list, concurrency: int = 16):
+    queue = list(ids)
+
+    async def worker():
+        while queue:
+            await client.delete(f"/admin/students/{queue.pop()}")
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+
+# ---------- comparison ----------
+
+def compare(results: list, baseline_path: str, threshold: float) -> list:
+    """Return regressions where p95 grew or throughput fell by more than `threshold`."""
+    with open(baseline_path) as f:
+        baseline = {(r["route"], r["concurrency"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        base = baseline.get((r["route"], r["concurrency"]))
+        if not base:
+            continue
+        if base["p95_ms"] and r["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append({"route": r["route"], "concurrency": r["concurrency"], "metric": "p95_ms",
+                                "baseline": base["p95_ms"], "current": r["p95_ms"]})
+        if base["throughput_rps"] and r["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            regressions.append({"route": r["route"], "concurrency": r["concurrency"], "metric": "throughput_rps",
+                                "baseline": base["throughput_rps"], "current": r["throughput_rps"]})
+    return regressions
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+# ---------- main ----------
+
+async def main(args) -> int:
+    procs = []
+    base_url = args.base_url
+    try:
+        if not base_url:
+            env = dict(os.environ)
+            if args.ml_backend == "remote":
+                stub_port = args.port + 1
+                procs.append(_start(
+                    [sys.executable, os.path.join(BACKEND_DIR, "scripts", "stub_model_server.py"),
+                     "--port", str(stub_port), "--latency-ms", str(args.ml_latency_ms)],
+                    BACKEND_DIR, env, "stub model server",
+                ))
+                await _wait_until_up(f"http://127.0.0.1:{stub_port}/stats", procs[-1])
+                env.update(ML_BACKEND="remote", ML_API_URL=f"http://127.0.0.1:{stub_port}/predict")
+            else:
+                env.update(ML_BACKEND="local")
+            procs.append(_start(
+                [sys.executable, "-m", "uvicorn", "server:app", "--port", str(args.port),
+                 "--workers", str(args.workers), "--log-level", "warning"],
+                SRC_DIR, env, "API",
+            ))
+            base_url = f"http://127.0.0.1:{args.port}"
+            # Not just listening: the benchmark must never time a cold pool or model
+            await _wait_until_up(base_url + "/readyz", procs[-1])
+
+        limits = httpx.Limits(max_connections=max(args.concurrency) * 2)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            login = await client.post("/admin/login", data={"username": args.username, "password": args.password})
+            login.raise_for_status()
+            client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+            run_id = uuid.uuid4().hex[:8]
+            print(f"🔄 Seeding {args.students} students (run {run_id})...", file=sys.stderr)
+            seed_start = time.perf_counter()
+            ids = await seed_students(client, run_id, args.students)
+            seed_seconds = time.perf_counter() - seed_start
+            if not ids:
+                raise RuntimeError("Seeding produced no students")
+
+            rng = random.Random(run_id)
+            # Emails stay unique across scenarios and concurrency levels
+            seq = itertools.count()
+
+            def any_id(_):
+                return rng.choice(ids)
+
+            def new_student(i):
+                return {"name": f"Bench New {i}", "email": f"bench-{run_id}-new{next(seq)}@example.com",
+                        "cgpa": 7.5, "iq": 100}
+
+            # Students created by the POST scenario; the DELETE scenario removes
+            # these, never the seeded ones the other scenarios read
+            created = []
+
+            def remember_created(response):
+                created.append(response.json()["student_id"])
+
+            async def ensure_created(count):
+                """Top up `created` (untimed) if POST failed or was filtered out by --routes."""
+                shortfall = count - len(created)
+                if shortfall <= 0:
+                    return
+                responses = await asyncio.gather(*[
+                    client.post("/admin/students", json=new_student(i)) for i in range(shortfall)
+                ])
+                for response in responses:
+                    response.raise_for_status()
+                    remember_created(response)
+
+            scenarios = [
+                ("POST /admin/login", "POST",
+                 lambda i: ("/admin/login", {"data": {"username": args.username, "password": args.password}})),
+                ("GET /admin/students", "GET", lambda i: ("/admin/students", {"params": {"limit": 100}})),
+                ("GET /admin/students/{id}", "GET", lambda i: (f"/admin/students/{any_id(i)}", {})),
+                ("POST /admin/students", "POST", lambda i: ("/admin/students", {"json": new_student(i)}),
+                 {"on_response": remember_created}),
+                ("DELETE /admin/students/{id}", "DELETE", lambda i: (f"/admin/students/{created.pop()}", {}),
+                 {"before": ensure_created}),
+                ("PUT /admin/students/{id}", "PUT",
+                 lambda i: (f"/admin/students/{any_id(i)}",
+                            {"json": {"name": f"Bench Updated {i}", "email": f"bench-{run_id}-u{next(seq)}@example.com",
+                                      "cgpa": round(rng.uniform(5, 10), 2)}})),
+                ("GET /admin/performance/summary", "GET", lambda i: ("/admin/performance/summary", {})),
+                ("GET /admin/performance/top-performers", "GET", lambda i: ("/admin/performance/top-performers", {})),
+                ("GET /admin/performance/skill-distribution", "GET",
+                 lambda i: ("/admin/performance/skill-distribution", {})),
+                ("GET /predict/student/{id}", "GET", lambda i: (f"/predict/student/{any_id(i)}", {})),
+            ]
+
+            results = []
+            for concurrency in args.concurrency:
+                for name, method, make_request, *hooks in scenarios:
+                    if args.routes and not any(r in name for r in args.routes):
+                        continue
+                    hooks = hooks[0] if hooks else {}
+                    on_response = hooks.get("on_response")
+                    warmup = min(concurrency, 10)
+                    if "before" in hooks:
+                        await hooks["before"](warmup + args.requests)
+                    # Warm-up pass so connection setup isn't measured
+                    await run_scenario(client, name, method, make_request, concurrency, warmup, on_response)
+                    result = await run_scenario(client, name, method, make_request, concurrency, args.requests,
+                                                on_response)
+                    results.append(result)
+                    print(f"   {name:45s} c={concurrency:<4d} {result['throughput_rps']:>9.1f} rps  "
+                          f"p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms p99={result['p99_ms']:.1f}ms "
+                          f"errors={result['errors']}", file=sys.stderr)
+
+            if not args.keep_data:
+                print("🔄 Removing seeded students...", file=sys.stderr)
+                await delete_students(client, await find_seeded_ids(client, run_id))
+    finally:
+        for proc in reversed(procs):
+            _stop(proc)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "base_url": base_url,
+            "ml_backend": args.ml_backend,
+            "students": args.students,
+            "seed_seconds": round(seed_seconds, 3),
+            "requests_per_level": args.requests,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+        },
+        "results": results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        report["regressions"] = compare(results, args.compare, args.threshold)
+        if report["regressions"]:
+            print(f"❌ {len(report['regressions'])} regressions against {args.compare}", file=sys.stderr)
+            exit_code = 1
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"✅ Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return exit_code
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark for the placement API")
+    parser.add_argument("--base-url", help="Benchmark an already running API instead of booting one")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the booted API (stub uses port+1)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the booted API")
+    parser.add_argument("--ml-backend", choices=["local", "remote"], default="remote",
+                        help="remote boots the stub model server")
+    parser.add_argument("--ml-latency-ms", type=float, default=20.0, help="Artificial stub model latency")
+    parser.add_argument("--students", type=int, default=1000, help="Students to seed")
+    parser.add_argument("--concurrency", type=lambda s: [int(x) for x in s.split(",")], default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route per concurrency level")
+    parser.add_argument("--routes", nargs="*", help="Only run routes whose name contains one of these strings")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)")
+    parser.add_argument("--keep-data", action="store_true", help="Don't delete seeded students")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,107 @@
+"""
+Compile the pickled placement model into flat NumPy arrays.
+
+Reads the StandardScaler and DecisionTreeClassifier pickles (MODEL_PATH and
+SCALER_PATH, as used by the server), writes the arrays described in
+src/ml/compiled_tree.py to COMPILED_MODEL_DIR, then reloads them with mmap and
+checks that they give exactly the same predictions as scikit-learn on random
+rows and on rows sitting on either side of every split threshold.
+
+The server picks the compiled model up on its next start; re-run this after
+replacing either pickle (a stale compiled model is ignored with a warning).
+
+Usage:
+    python scripts/compile_model.py
+    python scripts/compile_model.py --out model/compiled --check-rows 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# ml.inference imports its siblings as top-level `ml.*` modules, like the server does
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+import pandas as pd
+
+from ml import compiled_tree, inference
+from ml.features import FEATURE_COLUMNS
+
+
+def check_rows(compiled, n: int, seed: int = 0) -> np.ndarray:
+    """Random rows around the training distribution, plus rows on and next to every threshold."""
+    rng = np.random.default_rng(seed)
+    mean, scale = np.asarray(compiled.mean), np.asarray(compiled.scale)
+    X = mean + rng.normal(0.0, 2.0, size=(n, len(mean))) * scale
+
+    edges = []
+    internal = np.flatnonzero(np.asarray(compiled.left) != np.arange(len(compiled.left)))
+    for node in internal:
+        f = compiled.feature[node]
+        raw = compiled.threshold[node] * scale[f] + mean[f]
+        for value in (np.nextafter(raw, -np.inf), raw, np.nextafter(raw, np.inf)):
+            row = X[rng.integers(n)].copy()
+            row[f] = value
+            edges.append(row)
+    return np.vstack([X] + edges) if edges else X
+
+
+def sklearn_predict(scaler, model, X: np.ndarray) -> np.ndarray:
+    return model.predict(scaler.transform(pd.DataFrame(X, columns=FEATURE_COLUMNS)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the placement model to NumPy arrays")
+    parser.add_argument("--model", default=inference.MODEL_PATH, help="DecisionTreeClassifier pickle")
+    parser.add_argument("--scaler", default=inference.SCALER_PATH, help="StandardScaler pickle")
+    parser.add_argument("--out", default=inference.COMPILED_MODEL_DIR or "model/compiled",
+                        help="Output directory (relative paths are under backend/)")
+    parser.add_argument("--check-rows", type=int, default=100000,
+                        help="Random rows to compare against scikit-learn")
+    args = parser.parse_args()
+
+    model_path = inference._resolve(args.model)
+    scaler_path = inference._resolve(args.scaler)
+    out = inference._resolve(args.out)
+
+    print(f"🔄 Loading {scaler_path.name} and {model_path.name}...")
+    scaler = inference._load_pickle(scaler_path)
+    model = inference._load_pickle(model_path)
+    version = inference._fingerprint(scaler_path, model_path)
+
+    arrays, manifest = compiled_tree.compile_estimators(scaler, model, version)
+    compiled_tree.save(out, arrays, manifest)
+    print(f"✅ Wrote model {version} to {out} "
+          f"({manifest['node_count']} nodes, depth {manifest['max_depth']})")
+
+    start = time.perf_counter()
+    compiled = compiled_tree.CompiledModel.load(out)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    X = check_rows(compiled, args.check_rows)
+    expected = sklearn_predict(scaler, model, X)
+    actual = compiled.predict(X)
+    mismatches = int(np.count_nonzero(expected != actual))
+    if mismatches:
+        print(f"❌ {mismatches} of {len(X)} predictions differ from scikit-learn")
+        sys.exit(1)
+    print(f"✅ Identical to scikit-learn on {len(X)} rows")
+
+    row = X[:1]
+    timings = {}
+    for name, fn in (("scikit-learn", lambda: sklearn_predict(scaler, model, row)),
+                     ("compiled", lambda: compiled.predict(row))):
+        fn()
+        start = time.perf_counter()
+        for _ in range(1000):
+            fn()
+        timings[name] = (time.perf_counter() - start) * 1000  # ms per 1000 calls == µs per call
+    print(f"   load {load_ms:.2f} ms; single row: scikit-learn {timings['scikit-learn']:.0f} µs, "
+          f"compiled {timings['compiled']:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Export students joined with their latest prediction (see src/services/export.py).
+
+Streams from the database in fixed-size batches, so memory use doesn't grow
+with the number of students. Arrow and Parquet need pyarrow.
+
+Usage:
+    python scripts/export_students.py students.csv
+    python scripts/export_students.py students.parquet --format parquet
+    python scripts/export_students.py - --format arrow > students.arrows
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The service imports its siblings as top-level modules (`db.*`, `models.*`), like the server does
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services import export
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export students with their latest prediction")
+    parser.add_argument("output", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=sorted(export.FORMATS),
+                        help="Defaults to the output file's extension, else csv")
+    parser.add_argument("--batch-size", type=int, default=export.EXPORT_BATCH_SIZE,
+                        help="Rows per batch (Arrow record batch / Parquet row group)")
+    args = parser.parse_args()
+
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output)[1].lstrip(".").lower()
+        fmt = {"arrows": "arrow", "arrow": "arrow", "parquet": "parquet"}.get(ext, "csv")
+    try:
+        export.check_format(fmt)
+    except export.ExportUnavailable as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    written = 0
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for chunk in export.export_chunks(fmt, args.batch_size):
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    print(f"✅ Exported {written / 1e6:.1f} MB of {fmt} in {time.perf_counter() - start:.1f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """
 Database Initialization Script
-Creates the admins table and sets up default admin user
+Applies schema migrations (scripts/migrate.py) and sets up default admin user
 """
 import sys
 import os
@@ -11,39 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.db.connection import get_connection
 from src.auth.hashing import hash_password
 from mysql.connector import Error
-
-def create_admins_table():
-    """Create the admins table if it doesn't exist"""
-    conn = get_connection()
-    if not conn:
-        print("❌ Failed to connect to database")
-        return False
-    
-    try:
-        cur = conn.cursor()
-        
-        # Create admins table
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS admins (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            username VARCHAR(50) UNIQUE NOT NULL,
-            hashed_password VARCHAR(255) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-        """
-        
-        cur.execute(create_table_query)
-        conn.commit()
-        print("✅ Admins table created or already exists")
-        cur.close()
-        conn.close()
-        return True
-        
-    except Error as e:
-        print(f"❌ Error creating admins table: {e}")
-        conn.close()
-        return False
+from scripts.migrate import migrate
 
 def create_default_admin(username: str = "admin", password: str = "admin123", force_recreate: bool = False):
     """Create default admin user if it doesn't exist"""
@@ -106,89 +74,16 @@ def create_default_admin(username: str = "admin", password: str = "admin123", fo
         conn.close()
         return False
 
-def create_predictions_table():
-    """Create the predictions table if it doesn't exist"""
-    conn = get_connection()
-    if not conn:
-        print("❌ Failed to connect to database")
-        return False
-    
-    try:
-        cur = conn.cursor()
-        
-        # Create predictions table
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS predictions (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            student_id INT,
-            IQ FLOAT,
-            Prev_Sem_Result FLOAT,
-            CGPA FLOAT,
-            Academic_Performance FLOAT,
-            Extra_Curricular_Score FLOAT,
-            Communication_Skills FLOAT,
-            Projects_Completed INT,
-            Internship_Experience_Yes INT,
-            predicted_status VARCHAR(10) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE SET NULL,
-            INDEX idx_predicted_status (predicted_status)
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-        """
-        
-        cur.execute(create_table_query)
-        conn.commit()
-        print("✅ Predictions table created or already exists")
-        cur.close()
-        conn.close()
-        return True
-        
-    except Error as e:
-        # If foreign key constraint fails, create table without foreign key
-        try:
-            cur = conn.cursor()
-            create_table_query = """
-            CREATE TABLE IF NOT EXISTS predictions (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                student_id INT,
-                IQ FLOAT,
-                Prev_Sem_Result FLOAT,
-                CGPA FLOAT,
-                Academic_Performance FLOAT,
-                Extra_Curricular_Score FLOAT,
-                Communication_Skills FLOAT,
-                Projects_Completed INT,
-                Internship_Experience_Yes INT,
-                predicted_status VARCHAR(10) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                INDEX idx_predicted_status (predicted_status)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-            """
-            cur.execute(create_table_query)
-            conn.commit()
-            print("✅ Predictions table created or already exists (without foreign key)")
-            cur.close()
-            conn.close()
-            return True
-        except Error as e2:
-            print(f"❌ Error creating predictions table: {e2}")
-            conn.close()
-            return False
-
 def init_database(force_recreate: bool = False):
     """Initialize database - create tables and default admin"""
     print("🔄 Initializing database...")
     print("-" * 50)
     
-    # Create admins table
-    if not create_admins_table():
-        print("❌ Failed to create admins table")
+    # Create or upgrade students, admins and predictions
+    if not migrate():
+        print("❌ Failed to apply schema migrations")
         return False
     
-    # Create predictions table
-    if not create_predictions_table():
-        print("⚠️  Failed to create predictions table (continuing anyway)")
-    
     # Create default admin user
     if not create_default_admin(force_recreate=force_recreate):
         print("❌ Failed to create default admin user")
@@ -0,0 +1,200 @@
+"""
+Versioned schema migrations.
+
+Migrations are the numbered .sql files in backend/migrations
+(NNNN_description.sql), applied in order. Each applied version is recorded in
+`schema_migrations` with a checksum of the file, so a migration runs once per
+database and edits to an applied file are reported.
+
+ALTER TABLE statements are first tried as online DDL
+(ALGORITHM=INPLACE, LOCK=NONE) so reads and writes continue while an index is
+built; if the server cannot do a change in place it falls back to a plain ALTER.
+MySQL commits DDL implicitly, so a migration that failed halfway is re-run from
+the top: "already exists" errors from the statements that did succeed are
+skipped rather than treated as failures.
+
+Usage:
+    python scripts/migrate.py            # apply pending migrations
+    python scripts/migrate.py --status   # list applied and pending versions
+    python scripts/migrate.py --dry-run  # print what would run
+    python scripts/migrate.py --to 2     # apply up to and including version 2
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db.connection import get_connection
+from mysql.connector import Error
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+# Errors meaning the statement's effect is already in place
+ALREADY_APPLIED_ERRORS = {
+    1050,  # ER_TABLE_EXISTS_ERROR
+    1060,  # ER_DUP_FIELDNAME
+    1061,  # ER_DUP_KEYNAME
+    1091,  # ER_CANT_DROP_FIELD_OR_KEY
+    1826,  # ER_FK_DUP_NAME
+}
+# The requested ALGORITHM/LOCK is not supported for this change
+ONLINE_DDL_UNSUPPORTED_ERRORS = {1845, 1846}
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum CHAR(64) NOT NULL,
+    duration_ms INT NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> list:
+    """[(version, name, sql, checksum)] sorted by version."""
+    migrations = []
+    seen = {}
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in seen:
+            raise ValueError(f"Duplicate migration version {version}: {seen[version]} and {filename}")
+        seen[version] = filename
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            sql = f.read()
+        checksum = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        migrations.append((version, match.group(2), sql, checksum))
+    return sorted(migrations)
+
+
+def split_statements(sql: str) -> list:
+    """Split a migration file on `;`, dropping `--` comment lines."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [s.strip() for s in "\n".join(lines).split(";") if s.strip()]
+
+
+def applied_versions(cur) -> dict:
+    cur.execute("SELECT version, name, checksum, applied_at FROM schema_migrations ORDER BY version")
+    return {row[0]: row for row in cur.fetchall()}
+
+
+def _execute_online(cur, statement: str):
+    if not statement.upper().startswith("ALTER TABLE") or "ALGORITHM" in statement.upper():
+        cur.execute(statement)
+        return
+    try:
+        cur.execute(f"{statement}, ALGORITHM=INPLACE, LOCK=NONE")
+    except Error as e:
+        if e.errno not in ONLINE_DDL_UNSUPPORTED_ERRORS:
+            raise
+        print(f"   ⚠️  Online DDL not supported here ({e.msg}); running a locking ALTER")
+        cur.execute(statement)
+
+
+def apply_migration(conn, version: int, name: str, sql: str, checksum: str):
+    cur = conn.cursor()
+    try:
+        start = time.perf_counter()
+        for statement in split_statements(sql):
+            try:
+                _execute_online(cur, statement)
+            except Error as e:
+                if e.errno not in ALREADY_APPLIED_ERRORS:
+                    raise
+                print(f"   ℹ️  Skipping, already in place: {e.msg}")
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        cur.execute(
+            "INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (%s, %s, %s, %s)",
+            (version, name, checksum, duration_ms),
+        )
+        conn.commit()
+        return duration_ms
+    finally:
+        cur.close()
+
+
+def migrate(target=None, dry_run: bool = False) -> bool:
+    """Apply pending migrations up to `target` (all if None). Returns False on failure."""
+    conn = get_connection()
+    if not conn:
+        print("❌ Failed to connect to database")
+        return False
+    try:
+        cur = conn.cursor()
+        cur.execute(CREATE_MIGRATIONS_TABLE)
+        applied = applied_versions(cur)
+        cur.close()
+
+        pending = []
+        for version, name, sql, checksum in load_migrations():
+            if version in applied:
+                if applied[version][2] != checksum:
+                    print(f"⚠️  Migration {version:04d}_{name} changed after it was applied")
+                continue
+            if target is not None and version > target:
+                break
+            pending.append((version, name, sql, checksum))
+
+        if not pending:
+            print("✅ Schema is up to date")
+            return True
+
+        for version, name, sql, checksum in pending:
+            if dry_run:
+                print(f"🔎 Would apply {version:04d}_{name}:")
+                for statement in split_statements(sql):
+                    print(f"   {statement};")
+                continue
+            print(f"🔄 Applying {version:04d}_{name}...")
+            try:
+                duration_ms = apply_migration(conn, version, name, sql, checksum)
+            except Error as e:
+                print(f"❌ Migration {version:04d}_{name} failed: {e}")
+                return False
+            print(f"✅ Applied {version:04d}_{name} in {duration_ms} ms")
+        return True
+    finally:
+        conn.close()
+
+
+def print_status() -> bool:
+    conn = get_connection()
+    if not conn:
+        print("❌ Failed to connect to database")
+        return False
+    try:
+        cur = conn.cursor()
+        cur.execute(CREATE_MIGRATIONS_TABLE)
+        applied = applied_versions(cur)
+        cur.close()
+    finally:
+        conn.close()
+
+    for version, name, _, checksum in load_migrations():
+        row = applied.get(version)
+        if row is None:
+            print(f"   pending  {version:04d}_{name}")
+        else:
+            changed = "  (file changed since applied)" if row[2] != checksum else ""
+            print(f"   applied  {version:04d}_{name}  {row[3]}{changed}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations")
+    parser.add_argument("--dry-run", action="store_true", help="print pending migrations without running them")
+    parser.add_argument("--to", type=int, default=None, help="apply migrations up to this version")
+    args = parser.parse_args()
+
+    ok = print_status() if args.status else migrate(target=args.to, dry_run=args.dry_run)
+    sys.exit(0 if ok else 1)
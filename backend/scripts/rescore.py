@@ -0,0 +1,77 @@
+"""
+Re-score every student and store the predictions (see src/services/rescore.py).
+
+Run it after replacing the model or importing a semester's grades, by hand or
+from cron. Progress is checkpointed after every chunk; an interrupted run
+(Ctrl-C, crash, deploy) continues from the last checkpoint with --resume.
+
+Usage:
+    python scripts/rescore.py                       # new job over every student
+    python scripts/rescore.py --chunk-size 2000 --concurrency 4 --rate-limit 500
+    python scripts/rescore.py --resume              # continue the newest unfinished job
+    python scripts/rescore.py --resume 7            # continue job 7
+    python scripts/rescore.py --status              # list recent jobs
+"""
+import argparse
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The service imports its siblings as top-level modules (`db.*`, `ml.*`), like the server does
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services import rescore
+
+
+def print_status():
+    jobs = rescore.list_jobs()
+    if not jobs:
+        print("No rescoring jobs yet.")
+        return
+    for job in jobs:
+        status = rescore.job_status(job)
+        print(
+            f"  #{job['id']:<4} {job['status']:<10} {status['progress'] * 100:5.1f}%  "
+            f"scored {job['scored']}, skipped {job['skipped']} of {job['total']}  "
+            f"(model {job['model_version'] or '-'}, created {job['created_at']})"
+        )
+        if job["error"]:
+            print(f"         error: {job['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score every student")
+    parser.add_argument("--chunk-size", type=int, help="Students per chunk")
+    parser.add_argument("--concurrency", type=int, help="Chunks scored at once")
+    parser.add_argument("--rate-limit", type=float, help="Max students per second (0 = unlimited)")
+    parser.add_argument("--resume", nargs="?", const=0, type=int, metavar="JOB_ID",
+                        help="Resume a job (default: the newest unfinished one)")
+    parser.add_argument("--status", action="store_true", help="List recent jobs and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+        return
+
+    if args.resume is not None:
+        job_id = args.resume or rescore.latest_unfinished_job()
+        if not job_id:
+            print("❌ No unfinished job to resume")
+            sys.exit(1)
+    else:
+        job_id = rescore.create_job(args.chunk_size, args.concurrency, args.rate_limit)
+        print(f"✅ Created rescoring job {job_id}")
+
+    try:
+        status = rescore.runner.run(job_id)
+    except (rescore.JobNotFound, rescore.JobFinished, rescore.JobBusy) as e:
+        print(f"❌ Cannot run job {job_id}: {type(e).__name__} {e}")
+        sys.exit(1)
+    if status == "cancelled":
+        print(f"ℹ️  Stopped; resume with: python scripts/rescore.py --resume {job_id}")
+    sys.exit(0 if status in ("completed", "cancelled") else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Local stand-in for the remote /predict service.
+
+Implements the same contract (a list of feature records in, {"input_count",
+"predictions"} out) with a fixed rule and optional artificial latency, so the
+async client and micro-batcher can be exercised without the real model host.
+With --singular it answers like the original API instead: {"prediction"} for
+the first record only.
+
+Usage:
+    python scripts/stub_model_server.py --port 9000 --latency-ms 50
+    python scripts/stub_model_server.py --port 9000 --singular
+    ML_BACKEND=remote ML_API_URL=http://127.0.0.1:9000/predict uvicorn server:app
+"""
+import argparse
+import asyncio
+from typing import List
+
+from fastapi import Body, FastAPI
+import uvicorn
+
+app = FastAPI(title="Stub Placement Model")
+app.state.latency = 0.0
+app.state.singular = False
+app.state.drop = 0  # leave off this many predictions, to exercise client error handling
+app.state.requests = 0
+app.state.records = 0
+
+
+def _label(record: dict) -> str:
+    """Deterministic stand-in for the decision tree."""
+    placed = record.get("CGPA", 0) >= 7.5 and record.get("Communication_Skills", 0) >= 5
+    return "Yes" if placed else "No"
+
+
+@app.post("/predict")
+async def predict(records: List[dict] = Body(...)):
+    app.state.requests += 1
+    app.state.records += len(records)
+    if app.state.latency:
+        await asyncio.sleep(app.state.latency)
+    if app.state.singular:
+        return {"prediction": _label(records[0])}
+    predictions = [_label(r) for r in records]
+    if app.state.drop:
+        predictions = predictions[:-app.state.drop]
+    return {"input_count": len(records), "predictions": predictions}
+
+
+@app.get("/stats")
+def stats():
+    return {"requests": app.state.requests, "records": app.state.records}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub placement model server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--singular", action="store_true", help='Answer {"prediction"} like the original API')
+    parser.add_argument("--drop", type=int, default=0, help="Leave off the last N predictions")
+    args = parser.parse_args()
+    app.state.latency = args.latency_ms / 1000
+    app.state.singular = args.singular
+    app.state.drop = args.drop
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
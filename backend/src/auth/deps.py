@@ -1,14 +1,57 @@
 # src/auth/deps.py
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
-from auth.jwt_handler import decode_access_token
-from models.admin_model import get_admin_by_username
+from auth.jwt_handler import decode_access_token_claims, decode_stream_ticket_claims
+from auth.principal_cache import token_cache, admin_cache, used_ticket_cache
+from models.async_admin_model import get_admin_by_username
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login", auto_error=False)
 
-def get_current_admin(token: str = Depends(oauth2_scheme)):
-    username = decode_access_token(token)  # should raise HTTPException on invalid token
-    admin = get_admin_by_username(username)
-    if not admin:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin")
+# Audience of the one-time tickets accepted by the dashboard stream
+STREAM_TICKET_AUDIENCE = "/admin/performance/stream"
+
+async def _load_admin(username: str):
+    admin = admin_cache.get(username)
+    if admin is None:
+        admin = await get_admin_by_username(username)
+        if not admin:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin")
+        admin_cache.set(username, admin)
     return admin
+
+async def get_current_admin(token: str = Depends(oauth2_scheme)):
+    # Verified tokens are remembered until they expire
+    username = token_cache.get(token)
+    if username is None:
+        claims = decode_access_token_claims(token)  # raises HTTPException on invalid token
+        username = claims.get("sub")
+        if not username:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        token_cache.set(token, username, expires_at=claims.get("exp"))
+    return await _load_admin(username)
+
+async def get_stream_admin(
+    header_token: Optional[str] = Depends(optional_oauth2_scheme),
+    ticket: Optional[str] = Query(default=None, description="One-time ticket from POST /admin/performance/stream/ticket"),
+):
+    """
+    Admin for the dashboard stream: a bearer header, or a ticket in the URL for
+    EventSource, which can't set headers. Tickets live 30 seconds and work once;
+    access tokens are never accepted from the query string.
+    """
+    if header_token:
+        return await get_current_admin(header_token)
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = decode_stream_ticket_claims(ticket, STREAM_TICKET_AUDIENCE)
+    # No await between the check and the set, so a ticket can't be redeemed twice
+    if used_ticket_cache.get(claims["jti"]) is not None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Ticket already used")
+    used_ticket_cache.set(claims["jti"], claims["sub"], expires_at=claims["exp"])
+    return await _load_admin(claims["sub"])
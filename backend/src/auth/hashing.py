@@ -1,4 +1,35 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import bcrypt
+from prometheus_client import Counter, Histogram
+
+# bcrypt work factor for new hashes; stored hashes with a different cost are
+# transparently re-hashed on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Password work runs in a dedicated process pool so a burst of logins cannot
+# occupy the request threadpool
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", str(min(2, os.cpu_count() or 1))))
+HASH_POOL_MAX_PENDING = int(os.getenv("HASH_POOL_MAX_PENDING", "16"))
+HASH_TIMEOUT = float(os.getenv("HASH_TIMEOUT", "5"))
+
+
+PASSWORD_SECONDS = Histogram(
+    "password_hash_duration_seconds", "Time from submitting a bcrypt job to its result, queueing included",
+    ["operation"], buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+)
+PASSWORD_REJECTED = Counter("password_pool_rejected_total", "bcrypt jobs refused because the pool was full")
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the hashing pool already has HASH_POOL_MAX_PENDING jobs queued."""
+
 
 def hash_password(password: str) -> str:
     """
@@ -11,7 +42,7 @@ def hash_password(password: str) -> str:
         password_bytes = password_bytes[:72]
     
     # Generate salt and hash
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -45,3 +76,77 @@ def verify_password(plain: str, hashed: str) -> bool:
         import traceback
         traceback.print_exc()
         return False
+
+def hash_cost(hashed: str) -> int:
+    """Work factor encoded in a bcrypt hash ($2b$<cost>$...), or 0 if unparseable."""
+    try:
+        return int(hashed.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+def needs_rehash(hashed: str) -> bool:
+    return hash_cost(hashed) != BCRYPT_ROUNDS
+
+
+# ---------- process pool ----------
+
+_executor = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(HASH_POOL_MAX_PENDING)
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(
+                    max_workers=HASH_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _executor
+
+async def _run_in_pool(fn, *args):
+    if not _slots.acquire(blocking=False):
+        PASSWORD_REJECTED.inc()
+        raise PasswordPoolBusy("Too many password operations in progress")
+    start = time.perf_counter()
+    try:
+        future = _get_executor().submit(fn, *args)
+    except Exception:
+        _slots.release()
+        raise
+    # The slot is freed when the worker finishes, even if the caller timed out
+    future.add_done_callback(lambda _: _slots.release())
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=HASH_TIMEOUT)
+    finally:
+        PASSWORD_SECONDS.labels(fn.__name__).observe(time.perf_counter() - start)
+
+async def hash_password_async(password: str) -> str:
+    """hash_password() in the hashing pool. Raises PasswordPoolBusy or asyncio.TimeoutError."""
+    return await _run_in_pool(hash_password, password)
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """verify_password() in the hashing pool. Raises PasswordPoolBusy or asyncio.TimeoutError."""
+    return await _run_in_pool(verify_password, plain, hashed)
+
+def _ready() -> bool:
+    return True
+
+async def warm_hash_pool():
+    """Start every hashing worker now, so the first logins don't wait for process spawn."""
+    executor = _get_executor()
+    try:
+        futures = [executor.submit(_ready) for _ in range(HASH_POOL_WORKERS)]
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+    except BrokenProcessPool:
+        # Startup retries this phase; make sure the retry spawns fresh workers
+        shutdown_hash_pool()
+        raise
+
+def shutdown_hash_pool():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
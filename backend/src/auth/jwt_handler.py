@@ -1,10 +1,12 @@
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from fastapi import HTTPException
+import uuid
 
 SECRET_KEY = "supersecretkey"  # 🔐 change for production
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+STREAM_TICKET_EXPIRE_SECONDS = 30
 
 def create_access_token(data: dict):
     to_encode = data.copy()
@@ -12,9 +14,32 @@ def create_access_token(data: dict):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def decode_access_token(token: str):
+def decode_access_token_claims(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+def decode_access_token(token: str):
+    return decode_access_token_claims(token).get("sub")
+
+def create_stream_ticket(username: str, audience: str) -> str:
+    """
+    Short-lived, single-purpose token for clients that can only authenticate
+    through the URL (EventSource). The `aud` claim makes decode_access_token_claims
+    reject it, so it can't stand in for an access token.
+    """
+    expire = datetime.utcnow() + timedelta(seconds=STREAM_TICKET_EXPIRE_SECONDS)
+    claims = {"sub": username, "aud": audience, "exp": expire, "jti": uuid.uuid4().hex}
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+def decode_stream_ticket_claims(ticket: str, audience: str) -> dict:
+    try:
+        claims = jwt.decode(ticket, SECRET_KEY, algorithms=[ALGORITHM], audience=audience)
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired ticket")
+    # jose accepts a token without `aud` even when an audience is given; an
+    # ordinary access token must never be usable from a URL
+    if claims.get("aud") != audience or not claims.get("jti") or not claims.get("sub"):
+        raise HTTPException(status_code=401, detail="Invalid ticket")
+    return claims
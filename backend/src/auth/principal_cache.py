@@ -0,0 +1,78 @@
+# src/auth/principal_cache.py
+"""
+In-memory caches used by get_current_admin.
+
+- token_cache maps a bearer token to its username until the token's `exp`, so
+  a token is only signature-checked once.
+- admin_cache maps a username to its admin row for a short TTL, so protected
+  routes don't query `admins` on every request. Writes to an admin row must
+  call invalidate_admin().
+- used_ticket_cache remembers redeemed stream tickets (by `jti`) until they
+  expire, so each one works once. It is per process, like the other caches.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+ADMIN_CACHE_TTL = float(os.getenv("ADMIN_CACHE_TTL", "30"))
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries carry an absolute expiry (epoch seconds)."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expires_at: Optional[float] = None):
+        if expires_at is None:
+            expires_at = time.time() + (self.ttl or 0)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+token_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE)
+admin_cache = TTLCache(maxsize=1000, ttl=ADMIN_CACHE_TTL)
+used_ticket_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE)
+
+
+def invalidate_admin(username: str):
+    """Forget the cached row for `username`; the next request re-reads it."""
+    admin_cache.pop(username)
@@ -1,59 +1,60 @@
-from fastapi import APIRouter, Form, HTTPException, Depends
+import asyncio
+from fastapi import APIRouter, BackgroundTasks, Form, HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
-from auth.hashing import verify_password
+from auth.hashing import (
+    verify_password_async, hash_password_async, needs_rehash, PasswordPoolBusy,
+)
 from auth.jwt_handler import create_access_token, decode_access_token
-from models.admin_model import get_admin_by_username
+from models.async_admin_model import get_admin_by_username, update_admin_password
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
+async def _rehash_password(username: str, password: str):
+    """Re-hash a password stored with an outdated bcrypt cost."""
+    try:
+        new_hash = await hash_password_async(password)
+        await update_admin_password(username, new_hash)
+        print(f"🔐 Re-hashed password for '{username}' with the current bcrypt cost")
+    except Exception as e:
+        print(f"❌ Password re-hash failed for '{username}': {e}")
+
 @router.post("/login")
-def login(username: str = Form(...), password: str = Form(...)):
-    # Debug logging (remove in production)
-    print(f"🔍 Login attempt - Username: {username}, Password length: {len(password)}")
-    
-    admin = get_admin_by_username(username)
+async def login(background_tasks: BackgroundTasks, username: str = Form(...), password: str = Form(...)):
+    admin = await get_admin_by_username(username)
     if not admin:
         print(f"❌ User '{username}' not found in database")
         raise HTTPException(status_code=400, detail="Invalid username")
 
-    print(f"✅ User found: {admin.get('username')}")
-    print(f"🔐 Stored hash (first 50 chars): {admin['hashed_password'][:50]}...")
-    print(f"🔐 Verifying password...")
-    
-    # Verify password with better error handling
+    # bcrypt runs in the dedicated hashing pool, not in the request worker
+    stored_hash = admin["hashed_password"]
     try:
-        stored_hash = admin["hashed_password"]
-        print(f"   Input password: '{password}'")
-        print(f"   Stored hash: {stored_hash[:50]}...")
-        
-        is_valid = verify_password(password, stored_hash)
-        print(f"   Verification result: {is_valid}")
-        
-        if not is_valid:
-            print(f"❌ Password verification failed for user '{username}'")
-            print(f"   Trying to understand why...")
-            
-            # Try to hash the input password and compare
-            from src.auth.hashing import hash_password
-            test_hash = hash_password(password)
-            print(f"   New hash of input password: {test_hash[:50]}...")
-            print(f"   Hashes match: {stored_hash == test_hash}")
-            
-            raise HTTPException(status_code=400, detail="Invalid password")
-        print(f"✅ Password verified successfully")
-    except HTTPException:
-        raise
+        is_valid = await verify_password_async(password, stored_hash)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts in progress, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Password verification timed out")
     except Exception as e:
         print(f"❌ Password verification error: {e}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=400, detail="Invalid password")
 
+    if not is_valid:
+        print(f"❌ Password verification failed for user '{username}'")
+        raise HTTPException(status_code=400, detail="Invalid password")
+
+    if needs_rehash(stored_hash):
+        background_tasks.add_task(_rehash_password, username, password)
+
     token = create_access_token({"sub": username})
     return {"access_token": token, "token_type": "bearer"}
 
 @router.get("/dashboard")
-def dashboard(token: str = Depends(oauth2_scheme)):
+async def dashboard(token: str = Depends(oauth2_scheme)):
     username = decode_access_token(token)
     return {"message": f"Welcome, {username}! You are authenticated~"}
@@ -0,0 +1,119 @@
+"""
+asyncio MySQL access through aiomysql.
+
+The async pool runs with autocommit on, so reads never leave a transaction
+open on a pooled connection; writes wrap their statements in transaction().
+Pool checkouts wait at most DB_POOL_TIMEOUT seconds, like the sync pool.
+"""
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+import aiomysql
+from dotenv import load_dotenv
+
+from .connection import POOL_ACQUIRE_SECONDS, QUERY_ROWS, timed_query
+from .pool import PoolTimeout
+
+load_dotenv()
+
+_pool = None
+_pool_lock = None
+
+
+async def get_async_pool():
+    """Return the process-wide aiomysql pool, creating it on first use."""
+    global _pool, _pool_lock
+    if _pool is None:
+        if _pool_lock is None:
+            _pool_lock = asyncio.Lock()
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await aiomysql.create_pool(
+                    host=os.getenv("DB_HOST", "localhost"),
+                    user=os.getenv("DB_USER", "root"),
+                    password=os.getenv("DB_PASS", "root"),
+                    db=os.getenv("DB_NAME", "student_placement"),
+                    # minsize connections are opened up front, before the first request
+                    minsize=int(os.getenv("DB_ASYNC_POOL_MIN", "5")),
+                    maxsize=int(os.getenv("DB_ASYNC_POOL_MAX", "50")),
+                    pool_recycle=int(float(os.getenv("DB_POOL_RECYCLE", "3600"))),
+                    autocommit=True,
+                )
+    return _pool
+
+
+@asynccontextmanager
+async def async_connection():
+    """Check out a pooled aiomysql connection and always give it back."""
+    pool = await get_async_pool()
+    start = time.perf_counter()
+    try:
+        conn = await asyncio.wait_for(
+            pool.acquire(), timeout=float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        )
+    except asyncio.TimeoutError:
+        raise PoolTimeout("Timed out waiting for an async database connection")
+    finally:
+        POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - start)
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+@asynccontextmanager
+async def transaction(conn):
+    """BEGIN ... COMMIT on `conn`, rolling back if the body raises."""
+    await conn.begin()
+    try:
+        yield
+    except BaseException:
+        await conn.rollback()
+        raise
+    await conn.commit()
+
+
+async def timed_execute_async(cur, name: str, sql: str, params=(), fetch=None):
+    """Async counterpart of db.connection.timed_execute()."""
+    with timed_query(name):
+        await cur.execute(sql, params)
+        if fetch == "all":
+            result = await cur.fetchall()
+            rows = len(result)
+        elif fetch == "one":
+            result = await cur.fetchone()
+            rows = 1 if result else 0
+        else:
+            result = None
+            rows = max(cur.rowcount, 0)
+    QUERY_ROWS.labels(name).inc(rows)
+    return result
+
+
+async def timed_executemany_async(cur, name: str, sql: str, seq_params):
+    """Async counterpart of db.connection.timed_executemany()."""
+    with timed_query(name):
+        await cur.executemany(sql, seq_params)
+    QUERY_ROWS.labels(name).inc(max(cur.rowcount, 0))
+
+
+def async_pool_stats() -> dict:
+    if _pool is None:
+        return {"open": 0, "idle": 0, "checked_out": 0}
+    return {
+        "minsize": _pool.minsize,
+        "maxsize": _pool.maxsize,
+        "open": _pool.size,
+        "idle": _pool.freesize,
+        "checked_out": _pool.size - _pool.freesize,
+    }
+
+
+async def close_async_pool():
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        pool.close()
+        await pool.wait_closed()
@@ -1,19 +1,149 @@
 import mysql.connector
 from mysql.connector import Error
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from prometheus_client import Counter, Histogram
+import threading
+import time
 import os
 
+from .pool import ConnectionPool, PoolTimeout
+
 load_dotenv()
 
+_pool = None
+_pool_lock = threading.Lock()
+
+# ---------- query metrics (exposed on /metrics) ----------
+
+QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds", "Time spent executing and fetching a named query", ["query"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+QUERY_ROWS = Counter("db_query_rows_total", "Rows returned (reads) or affected (writes) by a named query", ["query"])
+QUERY_ERRORS = Counter("db_query_errors_total", "Named queries that raised", ["query"])
+POOL_ACQUIRE_SECONDS = Histogram(
+    "db_pool_acquire_duration_seconds", "Time spent waiting to check out a pooled connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+
+def _connect():
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("DB_PASS", "root"),
+        database=os.getenv("DB_NAME", "student_placement"),
+        # Pooled connections are reused, so drain any unread rows automatically
+        consume_results=True,
+    )
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _connect,
+                    size=int(os.getenv("DB_POOL_SIZE", "5")),
+                    max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    recycle=float(os.getenv("DB_POOL_RECYCLE", "3600")),
+                    idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+                    pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+                )
+    return _pool
+
+
 def get_connection():
+    """
+    Check out a pooled connection. Calling close() on it returns it to the pool.
+    Returns None if no connection could be obtained.
+    """
     try:
-        connection = mysql.connector.connect(
-            host=os.getenv("DB_HOST", "localhost"),
-            user=os.getenv("DB_USER", "root"),
-            password=os.getenv("DB_PASS", "root"),
-            database=os.getenv("DB_NAME", "student_placement")
-        )
-        return connection
-    except Error as e:
+        return _acquire()
+    except (Error, PoolTimeout) as e:
         print(f"❌ Database connection error: {e}")
         return None
+
+
+@contextmanager
+def connection():
+    """
+    Context manager that checks out a pooled connection and always returns it,
+    even if the body raises. Raises instead of yielding None on failure.
+    """
+    conn = _acquire()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _acquire():
+    start = time.perf_counter()
+    try:
+        return get_pool().acquire()
+    finally:
+        POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - start)
+
+
+@contextmanager
+def timed_query(name: str):
+    """
+    Time the body as query `name`. Use directly for cursors that are consumed
+    incrementally; timed_execute() covers the usual execute-then-fetch case.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        QUERY_ERRORS.labels(name).inc()
+        raise
+    finally:
+        QUERY_SECONDS.labels(name).observe(time.perf_counter() - start)
+
+
+def timed_execute(cur, name: str, sql: str, params=(), fetch=None):
+    """
+    Execute `sql` on `cur` and optionally fetch ("one" or "all"), recording the
+    duration and row count under the query name. Returns the fetched result.
+    """
+    with timed_query(name):
+        cur.execute(sql, params)
+        if fetch == "all":
+            result = cur.fetchall()
+            rows = len(result)
+        elif fetch == "one":
+            result = cur.fetchone()
+            rows = 1 if result else 0
+        else:
+            result = None
+            rows = max(cur.rowcount, 0)
+    QUERY_ROWS.labels(name).inc(rows)
+    return result
+
+
+def timed_executemany(cur, name: str, sql: str, seq_params):
+    """executemany() counterpart of timed_execute(); counts affected rows."""
+    with timed_query(name):
+        cur.executemany(sql, seq_params)
+    QUERY_ROWS.labels(name).inc(max(cur.rowcount, 0))
+
+
+def prefill_pool() -> int:
+    return get_pool().prefill()
+
+
+def pool_stats() -> dict:
+    return get_pool().stats()
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
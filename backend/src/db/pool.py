@@ -0,0 +1,284 @@
+# src/db/pool.py
+"""
+Thread-safe MySQL connection pool.
+
+Connections handed out by the pool are wrapped in a PooledConnection proxy.
+Calling close() on the proxy returns the connection to the pool instead of
+tearing down the socket, so existing `conn.close()` call sites keep working.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection could be checked out within the timeout."""
+
+
+class _PoolRecord:
+    __slots__ = ("raw", "created_at", "last_used_at")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class PooledConnection:
+    """Proxy around a raw connection; close() releases it back to the pool."""
+
+    def __init__(self, pool: "ConnectionPool", record: _PoolRecord):
+        self._pool = pool
+        self._record = record
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._record.raw, name)
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool._release(self._record)
+
+    def invalidate(self):
+        """Drop the underlying connection instead of returning it to the pool."""
+        if not self._released:
+            self._released = True
+            self._pool._discard(self._record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool with bounded overflow.
+
+    - `size` connections are kept open between requests.
+    - Up to `max_overflow` extra connections are opened under load and closed
+      again when they are returned while the pool is already full.
+    - Connections older than `recycle` seconds, or idle for longer than
+      `idle_timeout` seconds, are replaced on checkout.
+    - With `pre_ping`, a connection idle for more than `ping_interval` seconds
+      is pinged before being handed out; dead connections are replaced.
+    """
+
+    def __init__(
+        self,
+        factory: Callable,
+        size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        recycle: float = 3600.0,
+        idle_timeout: float = 300.0,
+        pre_ping: bool = True,
+        ping_interval: float = 1.0,
+    ):
+        self._factory = factory
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+
+        self._idle = deque()
+        self._lock = threading.Condition()
+        self._open = 0          # connections currently open (idle + checked out)
+        self._checked_out = 0
+        self._waiting = 0
+        self._closed = False
+
+        # Counters for stats()
+        self._created = 0
+        self._recycled = 0
+        self._failed_pings = 0
+        self._timeouts = 0
+        self._checkouts = 0
+
+    # ---------- checkout / release ----------
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check out a healthy connection, waiting up to `timeout` seconds."""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            record = None
+            create = False
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                while not self._idle and self._open >= self.size + self.max_overflow:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(
+                            f"Timed out after {timeout}s waiting for a database connection"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._lock.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                if self._idle:
+                    record = self._idle.pop()  # LIFO keeps hot connections hot
+                else:
+                    self._open += 1
+                    create = True
+                self._checked_out += 1
+
+            if create:
+                try:
+                    record = _PoolRecord(self._factory())
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                        self._checked_out -= 1
+                        self._lock.notify()
+                    raise
+                with self._lock:
+                    self._created += 1
+                    self._checkouts += 1
+                return PooledConnection(self, record)
+
+            if self._is_usable(record):
+                record.last_used_at = time.monotonic()
+                with self._lock:
+                    self._checkouts += 1
+                return PooledConnection(self, record)
+
+            # Stale or dead: drop it and try again
+            self._discard(record)
+
+    def _is_usable(self, record: _PoolRecord) -> bool:
+        now = time.monotonic()
+        if self.recycle and now - record.created_at > self.recycle:
+            with self._lock:
+                self._recycled += 1
+            return False
+        idle_for = now - record.last_used_at
+        if self.idle_timeout and idle_for > self.idle_timeout:
+            with self._lock:
+                self._recycled += 1
+            return False
+        if self.pre_ping and idle_for > self.ping_interval:
+            try:
+                record.raw.ping(reconnect=False)
+            except Exception:
+                with self._lock:
+                    self._failed_pings += 1
+                return False
+        return True
+
+    def _release(self, record: _PoolRecord):
+        raw = record.raw
+        try:
+            # Never hand the next caller an open transaction or a stale snapshot
+            if raw.in_transaction:
+                raw.rollback()
+        except Exception:
+            self._discard(record)
+            return
+
+        record.last_used_at = time.monotonic()
+        with self._lock:
+            self._checked_out -= 1
+            if self._closed or len(self._idle) >= self.size:
+                self._open -= 1
+                self._lock.notify()
+                keep = False
+            else:
+                self._idle.append(record)
+                self._lock.notify()
+                keep = True
+        if not keep:
+            self._close_raw(raw)
+
+    def _discard(self, record: _PoolRecord):
+        with self._lock:
+            self._checked_out -= 1
+            self._open -= 1
+            self._lock.notify()
+        self._close_raw(record.raw)
+
+    @staticmethod
+    def _close_raw(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    # ---------- maintenance ----------
+
+    def prune(self):
+        """Close idle connections that have passed their lifetime or idle limit."""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            keep = deque()
+            for record in self._idle:
+                too_old = self.recycle and now - record.created_at > self.recycle
+                too_idle = self.idle_timeout and now - record.last_used_at > self.idle_timeout
+                if too_old or too_idle:
+                    expired.append(record)
+                    self._open -= 1
+                    self._recycled += 1
+                else:
+                    keep.append(record)
+            self._idle = keep
+            if expired:
+                self._lock.notify(len(expired))
+        for record in expired:
+            self._close_raw(record.raw)
+        return len(expired)
+
+    def prefill(self, count: Optional[int] = None) -> int:
+        """
+        Open connections until `count` (default: `size`) are idle, so the first
+        requests don't pay for connect(). Returns the number now idle.
+        """
+        count = self.size if count is None else min(count, self.size)
+        conns = []
+        try:
+            for _ in range(count):
+                conns.append(self.acquire())
+        finally:
+            for conn in conns:
+                conn.close()
+        with self._lock:
+            return len(self._idle)
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._lock.notify_all()
+        for record in idle:
+            self._close_raw(record.raw)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "open": self._open,
+                "idle": len(self._idle),
+                "checked_out": self._checked_out,
+                "overflow": max(0, self._open - self.size),
+                "waiting": self._waiting,
+                "total_checkouts": self._checkouts,
+                "total_created": self._created,
+                "total_recycled": self._recycled,
+                "failed_pings": self._failed_pings,
+                "timeouts": self._timeouts,
+            }
@@ -0,0 +1 @@
+# Placement model: feature building, in-process inference and remote client
@@ -0,0 +1,120 @@
+# src/ml/cache.py
+"""
+LRU + TTL cache of placement predictions.
+
+Entries are keyed by a hash of the model version and the eight feature values,
+so a prediction is reused for as long as neither the model nor the student's
+features change. Each entry also remembers which student it was computed for,
+so student writes can drop the entries they made obsolete.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from ml.features import FEATURE_COLUMNS
+
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", "3600"))
+
+
+def make_key(values, model_version: str) -> str:
+    """
+    Canonical cache key. `values` is either a feature record or a sequence of
+    feature values in FEATURE_COLUMNS order; both produce the same key.
+    """
+    if isinstance(values, dict):
+        values = [values[c] for c in FEATURE_COLUMNS]
+    canonical = model_version + "|" + ",".join(repr(float(v)) for v in values)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class PredictionCache:
+    def __init__(self, maxsize: int = PREDICTION_CACHE_SIZE, ttl: float = PREDICTION_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (value, expires_at, student_id)
+        self._by_student = {}           # student_id -> set of keys
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, student_id = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value, student_id: Optional[int] = None):
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, student_id)
+            if student_id is not None:
+                self._by_student.setdefault(student_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_student(self, student_id: int):
+        with self._lock:
+            keys = self._by_student.pop(student_id, ())
+            for key in keys:
+                if key in self._entries:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_student.clear()
+
+    def _remove(self, key: str):
+        _, _, student_id = self._entries.pop(key)
+        if student_id is not None:
+            keys = self._by_student.get(student_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_student[student_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+prediction_cache = PredictionCache()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    """student_model write listener: drop predictions made from the old row."""
+    if op != "insert":
+        prediction_cache.invalidate_student(student_id)
@@ -0,0 +1,163 @@
+# src/ml/client.py
+"""
+Async client for the remote /predict service.
+
+A single httpx.AsyncClient keeps connections alive across requests, and a
+micro-batcher coalesces single-record predictions that arrive within
+ML_BATCH_MAX_WAIT_MS of each other into one list payload.
+"""
+import asyncio
+import os
+from typing import Optional
+
+import httpx
+
+from ml.predictor import ML_API_URL, ML_TIMEOUT, observe_call
+
+ML_MAX_CONNECTIONS = int(os.getenv("ML_MAX_CONNECTIONS", "20"))
+ML_MAX_KEEPALIVE = int(os.getenv("ML_MAX_KEEPALIVE", "10"))
+ML_BATCH_MAX_SIZE = int(os.getenv("ML_BATCH_MAX_SIZE", "32"))
+ML_BATCH_MAX_WAIT_MS = float(os.getenv("ML_BATCH_MAX_WAIT_MS", "5"))
+
+
+class MicroBatcher:
+    """
+    Collects single records and sends them together.
+
+    A batch is flushed when it reaches `max_batch_size` records or when the
+    oldest record has waited `max_wait` seconds, whichever comes first. Each
+    caller gets back the prediction at its own position in the batch.
+    """
+
+    def __init__(self, send_batch, max_batch_size: int, max_wait: float):
+        self._send_batch = send_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self._pending = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight = set()
+        self.batches_sent = 0
+        self.records_sent = 0
+
+    async def submit(self, record: dict):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((record, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list):
+        self.batches_sent += 1
+        self.records_sent += len(batch)
+        try:
+            predictions = await self._send_batch([record for record, _ in batch])
+            if len(predictions) != len(batch):
+                raise ValueError(
+                    f"Model returned {len(predictions)} predictions for {len(batch)} records"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), prediction in zip(batch, predictions):
+            if not future.done():
+                future.set_result(prediction)
+
+    async def drain(self):
+        """Send anything still pending and wait for in-flight batches."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+
+class AsyncModelClient:
+    def __init__(
+        self,
+        url: str = ML_API_URL,
+        timeout: float = ML_TIMEOUT,
+        max_connections: int = ML_MAX_CONNECTIONS,
+        max_keepalive: int = ML_MAX_KEEPALIVE,
+        max_batch_size: int = ML_BATCH_MAX_SIZE,
+        max_wait_ms: float = ML_BATCH_MAX_WAIT_MS,
+    ):
+        self.url = url
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+            ),
+        )
+        self._batcher = MicroBatcher(self._predict_labels, max_batch_size, max_wait_ms / 1000)
+        # Set once the host turns out to return a single "prediction" per request
+        self.singular = False
+
+    async def predict(self, records: list) -> dict:
+        """Post a list of records straight to /predict."""
+        with observe_call("remote", "http_async", len(records)):
+            response = await self._http.post(self.url, json=records)
+            response.raise_for_status()
+            return response.json()
+
+    async def _predict_labels(self, records: list) -> list:
+        result = await self.predict(records)
+        if "predictions" in result:
+            return list(result["predictions"])
+        if "prediction" not in result:
+            return []
+        # Hosts still on the original API answer {"prediction": label} for one record
+        if len(records) == 1:
+            return [result["prediction"]]
+        # Stop batching for this host and score the records one request each
+        self.singular = True
+        self._batcher.max_batch_size = 1
+        labels = await asyncio.gather(*(self._predict_labels([r]) for r in records))
+        return [label for (label,) in labels]
+
+    async def predict_one(self, record: dict) -> str:
+        """Predict a single record, sharing a request with concurrent callers."""
+        return await self._batcher.submit(record)
+
+    def stats(self) -> dict:
+        return {
+            "batches_sent": self._batcher.batches_sent,
+            "records_sent": self._batcher.records_sent,
+            "singular": self.singular,
+        }
+
+    async def aclose(self):
+        await self._batcher.drain()
+        await self._http.aclose()
+
+
+_client: Optional[AsyncModelClient] = None
+
+
+def get_client() -> AsyncModelClient:
+    """Return the shared client; must be called from inside the event loop."""
+    global _client
+    if _client is None:
+        _client = AsyncModelClient()
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,112 @@
+# src/ml/compiled_tree.py
+"""
+The placement model compiled to flat NumPy arrays.
+
+scripts/compile_model.py turns the pickled StandardScaler and
+DecisionTreeClassifier into a directory of .npy files plus a small
+manifest.json:
+
+    mean.npy, scale.npy     scaler parameters, float64, one per feature
+    feature.npy             feature tested at each node (int64)
+    threshold.npy           split threshold at each node (float64)
+    left.npy, right.npy     child node indices (int64)
+    leaf_class.npy          index into classes.npy of each node's majority class
+    classes.npy             class labels of the tree (int64)
+
+Leaves point both children at themselves with an infinite threshold, so every
+row can take exactly `max_depth` steps with no per-row branching. Loading is
+np.load(mmap_mode="r") and needs nothing but numpy, so the serving path never
+imports scikit-learn, pandas or joblib.
+
+The evaluator reproduces scikit-learn bit for bit: the scaler subtracts and
+divides in float64, and the tree compares float32 features against float64
+thresholds, as sklearn's Tree.apply() does.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+ARRAYS = ("mean", "scale", "feature", "threshold", "left", "right", "leaf_class", "classes")
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+# sklearn.tree._tree.TREE_LEAF
+_TREE_LEAF = -1
+
+
+class CompiledModel:
+    def __init__(self, arrays: dict, manifest: dict):
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.max_depth = int(manifest["max_depth"])
+        self.feature_names = list(manifest["feature_names"])
+        self.version = manifest["version"]
+        self.manifest = manifest
+
+    @classmethod
+    def load(cls, directory) -> "CompiledModel":
+        """Map a compiled model directory into memory. Raises FileNotFoundError or ValueError."""
+        directory = Path(directory)
+        manifest = json.loads((directory / MANIFEST).read_text())
+        if manifest.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled model format {manifest.get('format')!r}")
+        # Plain ndarray views of the mapped files: np.memmap adds overhead to every operation
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r").view(np.ndarray) for name in ARRAYS
+        }
+        return cls(arrays, manifest)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Class label of each row of an (n, n_features) float64 matrix."""
+        X = np.asarray(X, dtype=np.float64)
+        # Same operations, in the same order, as StandardScaler.transform()
+        scaled = ((X - self.mean) / self.scale).astype(np.float32)
+        rows = np.arange(len(X))
+        node = np.zeros(len(X), dtype=np.int64)
+        for _ in range(self.max_depth):
+            go_left = scaled[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.classes[self.leaf_class[node]]
+
+
+def compile_estimators(scaler, model, version: str) -> tuple:
+    """(arrays, manifest) for a fitted StandardScaler and single-output DecisionTreeClassifier."""
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Only single-output trees can be compiled")
+    tree = model.tree_
+    n_features = int(model.n_features_in_)
+    is_leaf = tree.children_left == _TREE_LEAF
+    nodes = np.arange(tree.node_count, dtype=np.int64)
+
+    mean = scaler.mean_ if scaler.mean_ is not None and scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.scale_ is not None and scaler.with_std else np.ones(n_features)
+    arrays = {
+        "mean": np.ascontiguousarray(mean, dtype=np.float64),
+        "scale": np.ascontiguousarray(scale, dtype=np.float64),
+        "feature": np.where(is_leaf, 0, tree.feature).astype(np.int64),
+        "threshold": np.where(is_leaf, np.inf, tree.threshold).astype(np.float64),
+        "left": np.where(is_leaf, nodes, tree.children_left).astype(np.int64),
+        "right": np.where(is_leaf, nodes, tree.children_right).astype(np.int64),
+        # DecisionTreeClassifier.predict() takes the argmax of the leaf's class values
+        "leaf_class": np.argmax(tree.value[:, 0, :], axis=1).astype(np.int64),
+        "classes": np.asarray(model.classes_).astype(np.int64),
+    }
+    feature_names = getattr(scaler, "feature_names_in_", None)
+    manifest = {
+        "format": FORMAT_VERSION,
+        "version": version,
+        "max_depth": int(tree.max_depth),
+        "node_count": int(tree.node_count),
+        "n_features": n_features,
+        "feature_names": [str(n) for n in feature_names] if feature_names is not None else [],
+    }
+    return arrays, manifest
+
+
+def save(directory, arrays: dict, manifest: dict):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in ARRAYS:
+        np.save(directory / f"{name}.npy", arrays[name])
+    (directory / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
@@ -0,0 +1,90 @@
+# src/ml/features.py
+"""
+Mapping between `students` rows and the feature records the placement model expects.
+
+numpy is imported inside the matrix helpers so importing this module (which
+every prediction route does) stays cheap at server start.
+"""
+
+# Column order the scaler and tree were trained on
+FEATURE_COLUMNS = [
+    "IQ",
+    "Prev_Sem_Result",
+    "CGPA",
+    "Academic_Performance",
+    "Extra_Curricular_Score",
+    "Communication_Skills",
+    "Projects_Completed",
+    "Internship_Experience_Yes",
+]
+
+# Student columns holding each feature, in FEATURE_COLUMNS order
+FEATURE_FIELDS = (
+    "iq", "prev_sem_result", "cgpa", "academic_performance",
+    "extra_curricular_score", "communication_skills", "projects_completed",
+    "internship_experience",
+)
+
+# Student columns that must be present before a prediction can be made
+REQUIRED_FIELDS = [
+    'iq', 'prev_sem_result', 'cgpa', 'academic_performance',
+    'communication_skills', 'extra_curricular_score',
+    'projects_completed', 'internship_experience'
+]
+
+
+def missing_fields(student: dict) -> list:
+    return [f for f in REQUIRED_FIELDS if student.get(f) is None]
+
+
+def build_features(student: dict) -> dict:
+    """Build the model input record for a single student row."""
+    return dict(zip(FEATURE_COLUMNS, feature_row(student)))
+
+
+def feature_row(student: dict) -> tuple:
+    """Feature values for one student, in FEATURE_COLUMNS order."""
+    return (
+        float(student['iq']),
+        float(student['prev_sem_result']),
+        float(student['cgpa']),
+        float(student['academic_performance']),
+        float(student['extra_curricular_score']),
+        float(student['communication_skills']),
+        int(student['projects_completed']),
+        1 if student['internship_experience'] else 0,
+    )
+
+
+# Typical values, used to warm the model up at startup
+WARMUP_RECORD = {
+    "IQ": 105.0,
+    "Prev_Sem_Result": 7.5,
+    "CGPA": 7.5,
+    "Academic_Performance": 7.0,
+    "Extra_Curricular_Score": 5.0,
+    "Communication_Skills": 6.0,
+    "Projects_Completed": 2,
+    "Internship_Experience_Yes": 1,
+}
+
+
+def build_matrix(students: list):
+    """Stack complete student rows into an (n, 8) float64 feature matrix."""
+    import numpy as np
+
+    X = np.empty((len(students), len(FEATURE_COLUMNS)), dtype=np.float64)
+    for i, student in enumerate(students):
+        X[i] = feature_row(student)
+    return X
+
+
+def matrix_to_records(X) -> list:
+    """Turn a feature matrix back into /predict records."""
+    records = []
+    for row in X:
+        record = dict(zip(FEATURE_COLUMNS, (float(v) for v in row)))
+        record["Projects_Completed"] = int(record["Projects_Completed"])
+        record["Internship_Experience_Yes"] = int(record["Internship_Experience_Yes"])
+        records.append(record)
+    return records
@@ -0,0 +1,187 @@
+# src/ml/inference.py
+"""
+In-process placement inference.
+
+Loads the StandardScaler and DecisionTreeClassifier from backend/model/ once and
+scores feature records locally. Responses use the same shape as the remote
+/predict service: {"input_count": n, "predictions": ["Yes" | "No", ...]}.
+
+If scripts/compile_model.py has written a compiled copy of the pickles to
+COMPILED_MODEL_DIR, that is loaded instead and scored with plain NumPy (see
+ml/compiled_tree.py); scikit-learn, pandas and joblib are then never imported.
+"""
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from ml.features import FEATURE_COLUMNS
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+MODEL_PATH = os.getenv("MODEL_PATH", "model/decision_tree_model.pkl")
+SCALER_PATH = os.getenv("SCALER_PATH", "model/Scaler_Model.pkl")
+# Set to an empty string to always score with the pickled estimators
+COMPILED_MODEL_DIR = os.getenv("COMPILED_MODEL_DIR", "model/compiled")
+
+# Class 1 of the tree means "placed"
+LABELS = {0: "No", 1: "Yes"}
+
+_lock = threading.Lock()
+_scaler = None
+_model = None
+_compiled = None
+_version = None
+
+
+def _resolve(path: str) -> Path:
+    p = Path(path)
+    return p if p.is_absolute() else BASE_DIR / p
+
+
+def _load_pickle(path: Path):
+    import joblib
+
+    try:
+        estimator = joblib.load(path)
+    except ValueError as e:
+        # Trees pickled with scikit-learn < 1.3 lack the `missing_go_to_left`
+        # node field and are rejected by newer releases.
+        if "missing_go_to_left" not in str(e):
+            raise
+        estimator = _load_legacy_tree_pickle(path)
+    # Hyperparameters added after the model was pickled (e.g. `monotonic_cst`)
+    # take their defaults, which is what the original release behaved like.
+    for name, default in type(estimator)().get_params(deep=False).items():
+        if not hasattr(estimator, name):
+            setattr(estimator, name, default)
+    return estimator
+
+
+def _load_legacy_tree_pickle(path: Path):
+    from joblib.numpy_pickle import NumpyUnpickler
+    from sklearn.tree._tree import Tree
+
+    class _LegacyTree(Tree):
+        def __setstate__(self, state):
+            nodes = state["nodes"]
+            if "missing_go_to_left" not in nodes.dtype.names:
+                upgraded = np.zeros(nodes.shape, dtype=_node_dtype())
+                for name in nodes.dtype.names:
+                    upgraded[name] = nodes[name]
+                state = dict(state, nodes=upgraded)
+            super().__setstate__(state)
+
+    class _Unpickler(NumpyUnpickler):
+        def find_class(self, module, name):
+            if module == "sklearn.tree._tree" and name == "Tree":
+                return _LegacyTree
+            return super().find_class(module, name)
+
+    with open(path, "rb") as f:
+        return _Unpickler(str(path), f, ensure_native_byte_order=True).load()
+
+
+def _node_dtype():
+    from sklearn.tree._tree import NODE_DTYPE
+    return NODE_DTYPE
+
+
+def _fingerprint(*paths: Path) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(p.read_bytes())
+    return h.hexdigest()[:12]
+
+
+def _load_compiled(version: str):
+    """The compiled model for these pickles, or None if there isn't an up-to-date one."""
+    if not COMPILED_MODEL_DIR:
+        return None
+    directory = _resolve(COMPILED_MODEL_DIR)
+    if not directory.is_dir():
+        return None
+    from ml.compiled_tree import CompiledModel
+    try:
+        compiled = CompiledModel.load(directory)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️  Ignoring compiled model in {directory}: {e}")
+        return None
+    if compiled.version != version:
+        print(f"⚠️  Compiled model {compiled.version} is stale (pickles are {version}); "
+              f"re-run scripts/compile_model.py")
+        return None
+    return compiled
+
+
+def load_model():
+    """Load the scaler and tree once; subsequent calls are no-ops."""
+    global _scaler, _model, _compiled, _version
+    if _version is not None:
+        return
+    with _lock:
+        if _version is not None:
+            return
+        start = time.perf_counter()
+        scaler_path = _resolve(SCALER_PATH)
+        model_path = _resolve(MODEL_PATH)
+        version = _fingerprint(scaler_path, model_path)
+        compiled = _load_compiled(version)
+        if compiled is not None:
+            _compiled = compiled
+            kind = "compiled"
+        else:
+            _scaler = _load_pickle(scaler_path)
+            _model = _load_pickle(model_path)
+            kind = "scikit-learn"
+        _version = version
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"✅ Loaded placement model {_version} ({kind}) in {elapsed:.1f} ms")
+
+
+def warm_up(batch_size: int = 64):
+    """
+    Load the model and score a dummy batch and a single row, so the first real
+    request doesn't pay for lazy initialisation in NumPy or scikit-learn.
+    """
+    from ml.features import WARMUP_RECORD
+
+    load_model()
+    predict_records([WARMUP_RECORD] * batch_size)
+    predict_records([WARMUP_RECORD])
+
+
+def model_version() -> str:
+    load_model()
+    return _version
+
+
+def to_matrix(records: list) -> np.ndarray:
+    """Stack feature records into an (n, 8) float64 matrix in training column order."""
+    return np.array(
+        [[r[c] for c in FEATURE_COLUMNS] for r in records],
+        dtype=np.float64,
+    ).reshape(len(records), len(FEATURE_COLUMNS))
+
+
+def predict_matrix(X: np.ndarray) -> list:
+    """Score an (n, 8) feature matrix and return "Yes"/"No" labels."""
+    load_model()
+    if len(X) == 0:
+        return []
+    if _compiled is not None:
+        classes = _compiled.predict(X)
+    else:
+        import pandas as pd
+        scaled = _scaler.transform(pd.DataFrame(X, columns=FEATURE_COLUMNS))
+        classes = _model.predict(scaled)
+    return [LABELS[int(c)] for c in classes]
+
+
+def predict_records(records: list) -> dict:
+    """Score a list of feature records, mirroring the remote /predict response."""
+    predictions = predict_matrix(to_matrix(records))
+    return {"input_count": len(records), "predictions": predictions}
@@ -0,0 +1,191 @@
+# src/ml/predictor.py
+"""
+Backend selection for placement predictions.
+
+ML_BACKEND=local  (default) scores in-process with ml.inference.
+ML_BACKEND=remote posts the records to the external /predict service at ML_API_URL.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from dotenv import load_dotenv
+from prometheus_client import Counter, Histogram
+
+load_dotenv()
+
+ML_BACKEND = os.getenv("ML_BACKEND", "local").lower()
+ML_API_URL = os.getenv("ML_API_URL", "https://mudfish-complete-luckily.ngrok-free.app/predict")
+ML_TIMEOUT = float(os.getenv("ML_TIMEOUT", "15"))
+# Identifies the remote model for cache keys; bump when the remote model is redeployed
+ML_MODEL_VERSION = os.getenv("ML_MODEL_VERSION", "remote")
+
+# Set once the remote host turns out to return a single "prediction" per request
+_remote_singular = False
+
+
+ML_CALL_SECONDS = Histogram(
+    "ml_call_duration_seconds", "Latency of model scoring calls", ["backend", "operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 15),
+)
+ML_CALL_ERRORS = Counter("ml_call_errors_total", "Model scoring calls that failed", ["backend", "operation"])
+ML_RECORDS = Counter("ml_records_scored_total", "Feature records sent to the model", ["backend"])
+
+
+@contextmanager
+def observe_call(backend: str, operation: str, records: int = 0):
+    """Record latency, errors and record count of one model call."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        ML_CALL_ERRORS.labels(backend, operation).inc()
+        raise
+    finally:
+        ML_CALL_SECONDS.labels(backend, operation).observe(time.perf_counter() - start)
+    ML_RECORDS.labels(backend).inc(records)
+
+
+class PredictionError(Exception):
+    """Raised when the configured model backend fails to score a request."""
+
+
+def use_local_model() -> bool:
+    return ML_BACKEND == "local"
+
+
+def model_version() -> str:
+    if use_local_model():
+        from ml import inference
+        return inference.model_version()
+    return ML_MODEL_VERSION
+
+
+def predict(records: list) -> dict:
+    """Score feature records; returns {"input_count": n, "predictions": [...]}."""
+    if use_local_model():
+        from ml import inference
+        try:
+            with observe_call("local", "predict_records", len(records)):
+                return inference.predict_records(records)
+        except Exception as e:
+            raise PredictionError(f"Local model failed: {e}") from e
+
+    import requests
+
+    try:
+        with observe_call("remote", "http_sync", len(records)):
+            response = requests.post(ML_API_URL, json=records, timeout=ML_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+    except requests.RequestException as e:
+        raise PredictionError(f"ML model request failed: {e}") from e
+
+
+async def predict_one_async(record: dict) -> str:
+    """
+    Score one feature record without blocking the event loop. Remote calls go
+    through the shared async client, which micro-batches concurrent callers.
+    """
+    if use_local_model():
+        return first_prediction(predict([record]))
+
+    from ml.client import get_client
+    try:
+        return await get_client().predict_one(record)
+    except Exception as e:
+        raise PredictionError(f"ML model request failed: {e}") from e
+
+
+def predict_matrix(X) -> list:
+    """Score an (n, 8) feature matrix in one call; returns one label per row."""
+    if len(X) == 0:
+        return []
+    if use_local_model():
+        from ml import inference
+        try:
+            with observe_call("local", "predict_matrix", len(X)):
+                return inference.predict_matrix(X)
+        except Exception as e:
+            raise PredictionError(f"Local model failed: {e}") from e
+
+    from ml.features import matrix_to_records
+    predictions = _remote_labels(matrix_to_records(X))
+    if len(predictions) != len(X):
+        raise PredictionError(f"Model returned {len(predictions)} predictions for {len(X)} records")
+    return predictions
+
+
+def _remote_labels(records: list) -> list:
+    """One label per record from the remote service, whichever response shape it uses."""
+    global _remote_singular
+    if _remote_singular and len(records) > 1:
+        return [label for r in records for label in _remote_labels([r])]
+    result = predict(records)
+    if "predictions" in result:
+        return list(result["predictions"])
+    if "prediction" not in result:
+        raise PredictionError("ML model response has no predictions")
+    # Hosts still on the original API answer {"prediction": label} for one record
+    if len(records) == 1:
+        return [result["prediction"]]
+    # Stop batching for this host and score the records one request each
+    _remote_singular = True
+    return [label for r in records for label in _remote_labels([r])]
+
+
+async def warm_up():
+    """Score a dummy batch through the configured backend, bypassing the cache."""
+    from ml.features import WARMUP_RECORD
+
+    if use_local_model():
+        from fastapi.concurrency import run_in_threadpool
+        from ml import inference
+        await run_in_threadpool(inference.warm_up)
+        return
+    # Opens the keep-alive connection to the remote service. Best effort: the
+    # remote API being down shouldn't keep this process out of rotation.
+    try:
+        await predict_one_async(dict(WARMUP_RECORD))
+    except PredictionError as e:
+        print(f"⚠️  Remote model warm-up failed: {e}")
+
+
+async def predict_student_async(student_id: int, record: dict) -> str:
+    """predict_one_async() behind the prediction cache."""
+    from ml.cache import prediction_cache, make_key
+
+    key = make_key(record, model_version())
+    cached = prediction_cache.get(key)
+    if cached is not None:
+        return cached
+    prediction = await predict_one_async(record)
+    prediction_cache.set(key, prediction, student_id=student_id)
+    return prediction
+
+
+def predict_students_matrix(X, student_ids: list) -> list:
+    """
+    predict_matrix() behind the prediction cache: rows already cached are
+    answered from memory and only the misses are scored, in one call.
+    """
+    from ml.cache import prediction_cache, make_key
+
+    version = model_version()
+    keys = [make_key(row, version) for row in X]
+    labels = [prediction_cache.get(k) for k in keys]
+    misses = [i for i, label in enumerate(labels) if label is None]
+    if misses:
+        scored = predict_matrix(X[misses])
+        for i, label in zip(misses, scored):
+            labels[i] = label
+            prediction_cache.set(keys[i], label, student_id=student_ids[i])
+    return labels
+
+
+def first_prediction(ml_response: dict) -> str:
+    """Pull the single label out of a /predict response."""
+    predictions = ml_response.get("predictions")
+    if predictions:
+        return predictions[0]
+    return ml_response.get("prediction", "Unknown")
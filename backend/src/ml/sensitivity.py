@@ -0,0 +1,140 @@
+# src/ml/sensitivity.py
+"""
+What-if analysis: which feature changes would flip a student's prediction.
+
+Every candidate is a copy of the student's feature row with one feature (or a
+pair of features) moved to a grid value. All candidates are stacked into one
+matrix and scored with a single predictor.predict_matrix() call, so a sweep of
+thousands of points costs one model call, not one per point.
+
+Changes are ranked by size relative to each feature's range (moving CGPA by
+1.0 counts the same as moving IQ by 12), so "smallest" means least effort
+across features.
+"""
+import itertools
+
+import numpy as np
+
+from ml import predictor
+from ml.features import FEATURE_COLUMNS
+
+# feature: (student column, low, high, step)
+FEATURE_GRID = {
+    "IQ": ("iq", 40.0, 160.0, 1.0),
+    "Prev_Sem_Result": ("prev_sem_result", 0.0, 10.0, 0.1),
+    "CGPA": ("cgpa", 0.0, 10.0, 0.1),
+    "Academic_Performance": ("academic_performance", 0.0, 10.0, 0.1),
+    "Extra_Curricular_Score": ("extra_curricular_score", 0.0, 10.0, 0.1),
+    "Communication_Skills": ("communication_skills", 0.0, 10.0, 0.1),
+    "Projects_Completed": ("projects_completed", 0.0, 10.0, 1.0),
+    "Internship_Experience_Yes": ("internship_experience", 0.0, 1.0, 1.0),
+}
+
+# Values per feature in the two-feature sweep (about 8k points over the 28 pairs)
+PAIR_GRID_POINTS = 21
+MAX_PAIR_RESULTS = 10
+
+
+def _grid(feature: str, points=None) -> np.ndarray:
+    _, low, high, step = FEATURE_GRID[feature]
+    values = np.round(np.arange(low, high + step / 2, step), 6)
+    if points is not None and len(values) > points:
+        values = values[np.unique(np.linspace(0, len(values) - 1, points).round().astype(int))]
+    return values
+
+
+def _span(feature: str) -> float:
+    _, low, high, _ = FEATURE_GRID[feature]
+    return high - low
+
+
+def _change(feature: str, current: float, value: float) -> dict:
+    return {
+        "feature": feature,
+        "column": FEATURE_GRID[feature][0],
+        "current": current,
+        "value": float(value),
+        "delta": round(float(value) - current, 6),
+    }
+
+
+def what_if(row: tuple, pairs: bool = True) -> dict:
+    """
+    Sweep each feature of `row` (FEATURE_COLUMNS order) across its grid and,
+    if `pairs`, every pair of features across a coarser grid. Returns the
+    current prediction, the smallest single-feature change per feature that
+    flips it, and the cheapest two-feature changes that flip it with less
+    total change than either feature alone.
+    Raises predictor.PredictionError.
+    """
+    base = np.asarray(row, dtype=np.float64)
+    blocks = [base[None, :]]
+    singles = []   # (feature index, values) per block after the base row
+    for i, feature in enumerate(FEATURE_COLUMNS):
+        values = _grid(feature)
+        values = values[values != base[i]]
+        X = np.repeat(base[None, :], len(values), axis=0)
+        X[:, i] = values
+        blocks.append(X)
+        singles.append((i, values))
+
+    pair_blocks = []   # (i, j, values_i, values_j) per block
+    if pairs:
+        coarse = [_grid(f, PAIR_GRID_POINTS) for f in FEATURE_COLUMNS]
+        for i, j in itertools.combinations(range(len(FEATURE_COLUMNS)), 2):
+            vi = coarse[i][coarse[i] != base[i]]
+            vj = coarse[j][coarse[j] != base[j]]
+            gi, gj = np.meshgrid(vi, vj, indexing="ij")
+            X = np.repeat(base[None, :], gi.size, axis=0)
+            X[:, i] = gi.ravel()
+            X[:, j] = gj.ravel()
+            blocks.append(X)
+            pair_blocks.append((i, j, gi.ravel(), gj.ravel()))
+
+    X = np.vstack(blocks)
+    labels = np.asarray(predictor.predict_matrix(X))
+    current = str(labels[0])
+    flipped = labels != current
+
+    spans = np.array([_span(f) for f in FEATURE_COLUMNS])
+    offset = 1
+    single_changes = []
+    single_cost = {}   # feature index -> cost of its smallest flipping change
+    for i, values in singles:
+        hits = values[flipped[offset:offset + len(values)]]
+        offset += len(values)
+        if len(hits):
+            best = hits[np.argmin(np.abs(hits - base[i]))]
+            single_cost[i] = abs(best - base[i]) / spans[i]
+            single_changes.append((single_cost[i], _change(FEATURE_COLUMNS[i], float(base[i]), best)))
+    single_changes.sort(key=lambda c: c[0])
+
+    pair_changes = []
+    for i, j, vi, vj in pair_blocks:
+        hit = flipped[offset:offset + len(vi)]
+        offset += len(vi)
+        if not hit.any():
+            continue
+        cost = np.abs(vi - base[i]) / spans[i] + np.abs(vj - base[j]) / spans[j]
+        cost = np.where(hit, cost, np.inf)
+        k = int(np.argmin(cost))
+        # Only worth suggesting if it beats moving either feature on its own
+        if cost[k] >= min(single_cost.get(i, np.inf), single_cost.get(j, np.inf)):
+            continue
+        pair_changes.append((float(cost[k]), [
+            _change(FEATURE_COLUMNS[i], float(base[i]), vi[k]),
+            _change(FEATURE_COLUMNS[j], float(base[j]), vj[k]),
+        ]))
+    pair_changes.sort(key=lambda c: c[0])
+
+    return {
+        "prediction": current,
+        "points_scored": len(X),
+        "single_feature_changes": [
+            {**change, "relative_change": round(float(cost), 4)} for cost, change in single_changes
+        ],
+        "two_feature_changes": [
+            {"changes": changes, "relative_change": round(cost, 4)}
+            for cost, changes in pair_changes[:MAX_PAIR_RESULTS]
+        ],
+    }
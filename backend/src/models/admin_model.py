@@ -1,12 +1,35 @@
-from db.connection import get_connection
+from db.connection import get_connection, timed_execute
+from auth.principal_cache import invalidate_admin
 
 def get_admin_by_username(username: str):
     conn = get_connection()
     if not conn:
         return None
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT * FROM admins WHERE username = %s", (username,))
-    admin = cur.fetchone()
-    cur.close()
-    conn.close()
-    return admin
+    try:
+        cur = conn.cursor(dictionary=True)
+        admin = timed_execute(
+            cur, "admins.by_username", "SELECT * FROM admins WHERE username = %s", (username,), fetch="one"
+        )
+        cur.close()
+        return admin
+    finally:
+        conn.close()
+
+def update_admin_password(username: str, hashed_password: str):
+    conn = get_connection()
+    if not conn:
+        return False
+    try:
+        cur = conn.cursor()
+        timed_execute(
+            cur, "admins.update_password",
+            "UPDATE admins SET hashed_password = %s WHERE username = %s",
+            (hashed_password, username),
+        )
+        conn.commit()
+        updated = cur.rowcount > 0
+        cur.close()
+    finally:
+        conn.close()
+    invalidate_admin(username)
+    return updated
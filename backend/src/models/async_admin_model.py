@@ -0,0 +1,24 @@
+import aiomysql
+
+from db.async_connection import async_connection, transaction, timed_execute_async
+from auth.principal_cache import invalidate_admin
+
+async def get_admin_by_username(username: str):
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            return await timed_execute_async(
+                cur, "admins.by_username", "SELECT * FROM admins WHERE username = %s", (username,), fetch="one"
+            )
+
+async def update_admin_password(username: str, hashed_password: str):
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_execute_async(
+                    cur, "admins.update_password",
+                    "UPDATE admins SET hashed_password = %s WHERE username = %s",
+                    (hashed_password, username),
+                )
+            updated = cur.rowcount > 0
+    invalidate_admin(username)
+    return updated
@@ -0,0 +1,119 @@
+# src/models/async_skill_model.py
+"""
+Skills and student-skill membership (tables from migrations/0004_skills.sql).
+
+Like student_model, committed writes are reported to listeners as
+listener(op, skill_id, payload):
+    "skill_created"  payload = skill name
+    "skill_deleted"  payload = None (memberships are removed by ON DELETE CASCADE)
+    "assigned"       payload = student ids now holding the skill
+    "unassigned"     payload = student ids that no longer hold it
+"""
+import aiomysql
+
+from db.async_connection import (
+    async_connection, transaction, timed_execute_async, timed_executemany_async,
+)
+from models.async_student_model import stream_query
+
+_listeners = []
+
+def add_listener(listener):
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+def _notify(op: str, skill_id: int, payload):
+    for listener in _listeners:
+        try:
+            listener(op, skill_id, payload)
+        except Exception as e:
+            print(f"❌ Skill write listener {getattr(listener, '__name__', listener)} failed: {e}")
+
+def _in_list(ids: list) -> str:
+    return ",".join(["%s"] * len(ids))
+
+async def get_skills():
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            return await timed_execute_async(
+                cur, "skills.all", "SELECT id, name FROM skills ORDER BY name", fetch="all"
+            )
+
+async def add_skill(name: str):
+    """Create a skill. Raises aiomysql.IntegrityError if the name is taken."""
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_execute_async(cur, "skills.insert", "INSERT INTO skills (name) VALUES (%s)", (name,))
+            skill_id = cur.lastrowid
+    _notify("skill_created", skill_id, name)
+    return skill_id
+
+async def delete_skill(skill_id: int):
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_execute_async(cur, "skills.delete", "DELETE FROM skills WHERE id = %s", (skill_id,))
+            deleted = cur.rowcount > 0
+    if deleted:
+        _notify("skill_deleted", skill_id, None)
+    return deleted
+
+async def assign_skill(skill_id: int, student_ids: list):
+    """
+    Give `skill_id` to each student. Ids of students that do not exist are
+    skipped (INSERT IGNORE turns the foreign key error into a warning).
+    Returns the ids that hold the skill afterwards, or None if the skill does not exist.
+    """
+    ids = list(dict.fromkeys(student_ids))
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                exists = await timed_execute_async(
+                    cur, "skills.lock", "SELECT id FROM skills WHERE id = %s FOR UPDATE", (skill_id,), fetch="one"
+                )
+                if not exists:
+                    return None
+                if not ids:
+                    return []
+                await timed_executemany_async(
+                    cur, "student_skills.insert_bulk",
+                    "INSERT IGNORE INTO student_skills (student_id, skill_id) VALUES (%s, %s)",
+                    [(student_id, skill_id) for student_id in ids],
+                )
+                rows = await timed_execute_async(
+                    cur, "student_skills.assigned",
+                    f"SELECT student_id FROM student_skills WHERE skill_id = %s AND student_id IN ({_in_list(ids)})",
+                    (skill_id, *ids), fetch="all",
+                )
+    assigned = [row[0] for row in rows]
+    if assigned:
+        _notify("assigned", skill_id, assigned)
+    return assigned
+
+async def unassign_skill(skill_id: int, student_ids: list):
+    """Take `skill_id` away from each student. Returns the number of memberships removed."""
+    ids = list(dict.fromkeys(student_ids))
+    if not ids:
+        return 0
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_execute_async(
+                    cur, "student_skills.delete",
+                    f"DELETE FROM student_skills WHERE skill_id = %s AND student_id IN ({_in_list(ids)})",
+                    (skill_id, *ids),
+                )
+            removed = cur.rowcount
+    if removed:
+        _notify("unassigned", skill_id, ids)
+    return removed
+
+def iter_memberships(batch_size: int = 5000):
+    """Every (skill_id, student_id) membership, streamed."""
+    return stream_query(
+        "SELECT skill_id, student_id FROM student_skills", batch_size=batch_size, name="student_skills.stream"
+    )
+
+def iter_student_ids(batch_size: int = 5000):
+    return stream_query("SELECT id FROM students", batch_size=batch_size, name="students.ids_stream")
@@ -0,0 +1,171 @@
+# src/models/async_student_model.py
+"""
+asyncio versions of the student_model operations, on the aiomysql pool.
+
+Queries, projections and write listeners are shared with student_model, so
+both layers return the same rows and keep the same in-memory state in sync.
+"""
+import aiomysql
+
+from db.async_connection import (
+    async_connection, transaction, timed_execute_async, timed_executemany_async,
+)
+from db.connection import QUERY_ROWS, timed_query
+from models.student_model import (
+    INSERT_STUDENT_SQL, PREDICTION_COLUMNS, _inserted_ids_sql, _inserted_row, _matching_sql, _notify,
+    _notify_inserted, _page_result, _page_sql, _select_list, _student_params, _update_sql,
+)
+
+async def add_student(student: dict):
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_execute_async(cur, "students.insert", INSERT_STUDENT_SQL, _student_params(student))
+            new_id = cur.lastrowid
+    _notify("insert", new_id, None, _inserted_row(new_id, student))
+    return new_id
+
+async def add_students_bulk(students: list):
+    """Insert many students in one multi-row INSERT and one transaction (see student_model)."""
+    if not students:
+        return 0
+    async with async_connection() as conn:
+        async with conn.cursor() as cur:
+            async with transaction(conn):
+                await timed_executemany_async(
+                    cur, "students.insert_bulk", INSERT_STUDENT_SQL, [_student_params(s) for s in students]
+                )
+                # aiomysql splits large batches into several statements, so
+                # lastrowid doesn't locate them; read the ids back instead
+                sql, params = _inserted_ids_sql(students)
+                rows = await timed_execute_async(cur, "students.inserted_ids", sql, params, fetch="all")
+    _notify_inserted(students, rows)
+    return len(students)
+
+async def get_all_students():
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            return await timed_execute_async(
+                cur, "students.all", "SELECT * FROM students ORDER BY id DESC", fetch="all"
+            )
+
+async def get_students_page(limit: int, before_id=None, fields=None):
+    """Keyset page of students, newest first. Returns (rows, next_cursor)."""
+    sql, params = _page_sql(limit, before_id, fields)
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            rows = await timed_execute_async(cur, "students.page", sql, params, fetch="all")
+    return _page_result(rows, limit)
+
+async def stream_query(sql: str, params=(), batch_size: int = 500, name: str = "students.stream"):
+    """Async generator over `sql` through an unbuffered cursor (see student_model.stream_query)."""
+    async with async_connection() as conn:
+        finished = False
+        cur = await conn.cursor(aiomysql.SSDictCursor)
+        try:
+            with timed_query(name):
+                await cur.execute(sql, params)
+            while True:
+                with timed_query(name):
+                    rows = await cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                QUERY_ROWS.labels(name).inc(len(rows))
+                for row in rows:
+                    yield row
+            finished = True
+        finally:
+            if finished:
+                await cur.close()
+            else:
+                # Abandoned mid-stream: drop the connection rather than drain the result set
+                conn.close()
+
+def iter_students(fields=None, batch_size: int = 500):
+    """Every student, newest first, streamed from the server."""
+    select = _select_list(fields)
+    return stream_query(f"SELECT {select} FROM students ORDER BY id DESC", batch_size=batch_size)
+
+async def get_student_by_id(student_id: int):
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            return await timed_execute_async(
+                cur, "students.by_id", "SELECT * FROM students WHERE id = %s", (student_id,), fetch="one"
+            )
+
+async def update_student(student_id: int, updates: dict):
+    sql, values = _update_sql(student_id, updates)
+    if sql is None:
+        return False
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            async with transaction(conn):
+                # Lock the row so listeners see exactly the values this update replaced
+                before = await timed_execute_async(
+                    cur, "students.lock_row", "SELECT * FROM students WHERE id = %s FOR UPDATE",
+                    (student_id,), fetch="one",
+                )
+                if not before:
+                    return False
+                await timed_execute_async(cur, "students.update", sql, values)
+                changed = cur.rowcount > 0
+    if changed:
+        _notify("update", student_id, before, {**before, **updates})
+    return changed
+
+async def delete_student(student_id: int):
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            async with transaction(conn):
+                before = await timed_execute_async(
+                    cur, "students.lock_row", "SELECT * FROM students WHERE id = %s FOR UPDATE",
+                    (student_id,), fetch="one",
+                )
+                if not before:
+                    return False
+                await timed_execute_async(cur, "students.delete", "DELETE FROM students WHERE id = %s", (student_id,))
+                deleted = cur.rowcount > 0
+    if deleted:
+        _notify("delete", student_id, before, None)
+    return deleted
+
+async def get_student_for_prediction(student_id: int):
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            return await timed_execute_async(
+                cur, "students.for_prediction",
+                f"SELECT {PREDICTION_COLUMNS} FROM students WHERE id = %s", (student_id,), fetch="one",
+            )
+
+async def get_students_by_ids(student_ids: list, chunk_size: int = 1000):
+    """Prediction columns for many students, in chunked `WHERE id IN (...)` queries."""
+    rows = []
+    ids = list(dict.fromkeys(student_ids))
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i:i + chunk_size]
+                placeholders = ",".join(["%s"] * len(chunk))
+                rows.extend(await timed_execute_async(
+                    cur, "students.by_ids",
+                    f"SELECT {PREDICTION_COLUMNS} FROM students WHERE id IN ({placeholders}) ORDER BY id",
+                    tuple(chunk), fetch="all",
+                ))
+    return rows
+
+async def get_students_matching(filters: dict, chunk_size: int = 1000):
+    """Prediction columns for every student matching `filters`, in keyset-ordered chunks."""
+    sql, params = _matching_sql(filters)
+    rows = []
+    last_id = 0
+    async with async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            while True:
+                chunk = await timed_execute_async(
+                    cur, "students.matching", sql, (last_id, *params, chunk_size), fetch="all"
+                )
+                rows.extend(chunk)
+                if len(chunk) < chunk_size:
+                    break
+                last_id = chunk[-1]["id"]
+    return rows
@@ -1,49 +1,201 @@
 # src/models/student_model.py
-from db.connection import get_connection
+from db.connection import (
+    connection, get_pool, QUERY_ROWS, timed_query, timed_execute, timed_executemany,
+)
 
-def add_student(student: dict):
-    conn = get_connection()
-    cur = conn.cursor()
-    sql = """
+# Callbacks run after every committed write as listener(op, student_id, before, after),
+# where op is "insert", "update" or "delete" and before/after are full rows (or None).
+# In-memory caches and indexes use these to stay in sync with the table.
+_listeners = []
+
+def add_listener(listener):
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+def _notify(op: str, student_id: int, before, after):
+    for listener in _listeners:
+        try:
+            listener(op, student_id, before, after)
+        except Exception as e:
+            print(f"❌ Student write listener {getattr(listener, '__name__', listener)} failed: {e}")
+
+# Columns that may be requested through `fields=` projections
+STUDENT_FIELDS = (
+    "id", "name", "email", "cgpa", "iq", "prev_sem_result", "academic_performance",
+    "communication_skills", "extra_curricular_score", "projects_completed",
+    "internship_experience",
+)
+
+INSERT_STUDENT_SQL = """
     INSERT INTO students
     (name, email, cgpa, iq, prev_sem_result, academic_performance,
      communication_skills, extra_curricular_score, projects_completed, internship_experience)
     VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
     """
-    params = (
+
+def _student_params(student: dict):
+    return (
         student.get("name"), student.get("email"), student.get("cgpa"), student.get("iq"),
         student.get("prev_sem_result"), student.get("academic_performance"),
         student.get("communication_skills"), student.get("extra_curricular_score"),
         student.get("projects_completed", 0), student.get("internship_experience", False)
     )
-    cur.execute(sql, params)
-    conn.commit()
-    new_id = cur.lastrowid
-    cur.close()
-    conn.close()
+
+def _inserted_row(student_id: int, student: dict) -> dict:
+    params = _student_params(student)
+    row = dict(zip(STUDENT_FIELDS[1:], params))
+    row["id"] = student_id
+    return row
+
+def add_student(student: dict):
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            timed_execute(cur, "students.insert", INSERT_STUDENT_SQL, _student_params(student))
+            conn.commit()
+            new_id = cur.lastrowid
+        finally:
+            cur.close()
+    _notify("insert", new_id, None, _inserted_row(new_id, student))
     return new_id
 
+def _inserted_ids_sql(students: list):
+    """Look up the ids of just-inserted students by their (unique) email."""
+    emails = [s.get("email") for s in students]
+    placeholders = ",".join(["%s"] * len(emails))
+    return f"SELECT id, email FROM students WHERE email IN ({placeholders})", emails
+
+def _notify_inserted(students: list, rows):
+    ids = {email: student_id for student_id, email in rows}
+    for student in students:
+        student_id = ids.get(student.get("email"))
+        if student_id is not None:
+            _notify("insert", student_id, None, _inserted_row(student_id, student))
+
+def add_students_bulk(students: list):
+    """
+    Insert many students in a single transaction. executemany() rewrites the
+    INSERT into multi-row VALUES statements. On error the whole batch is
+    rolled back and the exception propagates.
+    """
+    if not students:
+        return 0
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            timed_executemany(
+                cur, "students.insert_bulk", INSERT_STUDENT_SQL, [_student_params(s) for s in students]
+            )
+            # lastrowid can't be trusted for the whole batch (the driver may
+            # split it into several statements, and auto_increment_increment
+            # may be > 1), so read the new ids back inside the transaction
+            sql, params = _inserted_ids_sql(students)
+            rows = timed_execute(cur, "students.inserted_ids", sql, params, fetch="all")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+    _notify_inserted(students, rows)
+    return len(students)
+
 def get_all_students():
-    conn = get_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT * FROM students ORDER BY id DESC")
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            return timed_execute(cur, "students.all", "SELECT * FROM students ORDER BY id DESC", fetch="all")
+        finally:
+            cur.close()
+
+def _select_list(fields=None):
+    """SELECT list for a projection; `id` is always included for keyset paging."""
+    if not fields:
+        return "*"
+    unknown = [f for f in fields if f not in STUDENT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown student fields: {', '.join(unknown)}")
+    cols = ["id"] + [f for f in dict.fromkeys(fields) if f != "id"]
+    return ", ".join(cols)
+
+def _page_sql(limit: int, before_id=None, fields=None):
+    """Query for one keyset page; fetches one extra row to detect the last page."""
+    select = _select_list(fields)
+    if before_id is None:
+        return f"SELECT {select} FROM students ORDER BY id DESC LIMIT %s", (limit + 1,)
+    sql = f"SELECT {select} FROM students WHERE id < %s ORDER BY id DESC LIMIT %s"
+    return sql, (before_id, limit + 1)
+
+def _page_result(rows: list, limit: int):
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1]["id"]
+    return rows, None
+
+def get_students_page(limit: int, before_id=None, fields=None):
+    """
+    One page of students, newest first, using keyset pagination on id.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    sql, params = _page_sql(limit, before_id, fields)
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            rows = timed_execute(cur, "students.page", sql, params, fetch="all")
+        finally:
+            cur.close()
+    return _page_result(rows, limit)
+
+def stream_query(sql: str, params=(), batch_size: int = 500, name: str = "students.stream",
+                 dictionary: bool = True):
+    """
+    Yield rows of `sql` through an unbuffered (server-side) cursor so only
+    `batch_size` rows are held in memory at a time. Metrics record the time
+    spent in MySQL (execute and each fetch), not time spent by the consumer.
+    Rows are dicts, or tuples in SELECT order with dictionary=False.
+    """
+    conn = get_pool().acquire()
+    finished = False
+    try:
+        cur = conn.cursor(dictionary=dictionary, buffered=False)
+        try:
+            with timed_query(name):
+                cur.execute(sql, params)
+            while True:
+                with timed_query(name):
+                    rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                QUERY_ROWS.labels(name).inc(len(rows))
+                for row in rows:
+                    yield row
+            finished = True
+        finally:
+            if finished:
+                cur.close()
+    finally:
+        if finished:
+            conn.close()
+        else:
+            # Abandoned mid-stream: drop the connection rather than drain the result set
+            conn.invalidate()
+
+def iter_students(fields=None, batch_size: int = 500):
+    """Every student, newest first, streamed from the server (see stream_query)."""
+    select = _select_list(fields)
+    return stream_query(f"SELECT {select} FROM students ORDER BY id DESC", batch_size=batch_size)
 
 def get_student_by_id(student_id: int):
-    conn = get_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT * FROM students WHERE id = %s", (student_id,))
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
-    return row
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            return timed_execute(
+                cur, "students.by_id", "SELECT * FROM students WHERE id = %s", (student_id,), fetch="one"
+            )
+        finally:
+            cur.close()
 
-def update_student(student_id: int, updates: dict):
-    conn = get_connection()
-    cur = conn.cursor()
+def _update_sql(student_id: int, updates: dict):
     # Build update query dynamically but safely (parameterized)
     fields = []
     values = []
@@ -51,22 +203,148 @@ def update_student(student_id: int, updates: dict):
         fields.append(f"{k} = %s")
         values.append(v)
     if not fields:
-        cur.close(); conn.close(); return False
-    sql = "UPDATE students SET " + ", ".join(fields) + " WHERE id = %s"
+        return None, None
     values.append(student_id)
-    cur.execute(sql, tuple(values))
-    conn.commit()
-    affected = cur.rowcount
-    cur.close()
-    conn.close()
-    return affected > 0
+    return "UPDATE students SET " + ", ".join(fields) + " WHERE id = %s", tuple(values)
+
+def update_student(student_id: int, updates: dict):
+    sql, values = _update_sql(student_id, updates)
+    if sql is None:
+        return False
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            # Lock the row so listeners see exactly the values this update replaced
+            before = timed_execute(
+                cur, "students.lock_row", "SELECT * FROM students WHERE id = %s FOR UPDATE",
+                (student_id,), fetch="one",
+            )
+            if not before:
+                conn.rollback()
+                return False
+            timed_execute(cur, "students.update", sql, values)
+            conn.commit()
+            changed = cur.rowcount > 0
+        finally:
+            cur.close()
+    if changed:
+        _notify("update", student_id, before, {**before, **updates})
+    return changed
 
 def delete_student(student_id: int):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM students WHERE id = %s", (student_id,))
-    conn.commit()
-    affected = cur.rowcount
-    cur.close()
-    conn.close()
-    return affected > 0
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            before = timed_execute(
+                cur, "students.lock_row", "SELECT * FROM students WHERE id = %s FOR UPDATE",
+                (student_id,), fetch="one",
+            )
+            if not before:
+                conn.rollback()
+                return False
+            timed_execute(cur, "students.delete", "DELETE FROM students WHERE id = %s", (student_id,))
+            conn.commit()
+            deleted = cur.rowcount > 0
+        finally:
+            cur.close()
+    if deleted:
+        _notify("delete", student_id, before, None)
+    return deleted
+
+# Columns needed to score a student
+PREDICTION_COLUMNS = (
+    "id, name, email, iq, prev_sem_result, cgpa, academic_performance, "
+    "communication_skills, extra_curricular_score, projects_completed, internship_experience"
+)
+
+def get_student_for_prediction(student_id: int):
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            return timed_execute(
+                cur, "students.for_prediction",
+                f"SELECT {PREDICTION_COLUMNS} FROM students WHERE id = %s", (student_id,), fetch="one",
+            )
+        finally:
+            cur.close()
+
+def get_students_by_ids(student_ids: list, chunk_size: int = 1000):
+    """Fetch prediction columns for many students with chunked `WHERE id IN (...)` queries."""
+    rows = []
+    ids = list(dict.fromkeys(student_ids))
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i:i + chunk_size]
+                placeholders = ",".join(["%s"] * len(chunk))
+                rows.extend(timed_execute(
+                    cur, "students.by_ids",
+                    f"SELECT {PREDICTION_COLUMNS} FROM students WHERE id IN ({placeholders}) ORDER BY id",
+                    tuple(chunk), fetch="all",
+                ))
+        finally:
+            cur.close()
+    return rows
+
+def get_student_contacts(student_ids: list, chunk_size: int = 1000) -> dict:
+    """{id: {"name", "email"}} for many students, in chunked `WHERE id IN (...)` queries."""
+    contacts = {}
+    ids = list(dict.fromkeys(student_ids))
+    if not ids:
+        return contacts
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i:i + chunk_size]
+                placeholders = ",".join(["%s"] * len(chunk))
+                for row in timed_execute(
+                    cur, "students.contacts",
+                    f"SELECT id, name, email FROM students WHERE id IN ({placeholders})",
+                    tuple(chunk), fetch="all",
+                ):
+                    contacts[row["id"]] = row
+        finally:
+            cur.close()
+    return contacts
+
+def _matching_sql(filters: dict):
+    """Keyset chunk query for get_students_matching(); params exclude (last_id, ..., chunk_size)."""
+    conditions = []
+    params = []
+    for key, clause in (
+        ("min_cgpa", "cgpa >= %s"),
+        ("max_cgpa", "cgpa <= %s"),
+        ("min_iq", "iq >= %s"),
+        ("max_iq", "iq <= %s"),
+        ("internship_experience", "internship_experience = %s"),
+    ):
+        if filters.get(key) is not None:
+            conditions.append(clause)
+            params.append(filters[key])
+    where = "".join(f" AND {c}" for c in conditions)
+    sql = f"SELECT {PREDICTION_COLUMNS} FROM students WHERE id > %s{where} ORDER BY id LIMIT %s"
+    return sql, params
+
+def get_students_matching(filters: dict, chunk_size: int = 1000):
+    """
+    Fetch prediction columns for every student matching `filters`, walking the
+    table in keyset-ordered chunks. Supported filters: min_cgpa, max_cgpa,
+    min_iq, max_iq, internship_experience.
+    """
+    sql, params = _matching_sql(filters)
+    rows = []
+    last_id = 0
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            while True:
+                chunk = timed_execute(cur, "students.matching", sql, (last_id, *params, chunk_size), fetch="all")
+                rows.extend(chunk)
+                if len(chunk) < chunk_size:
+                    break
+                last_id = chunk[-1]["id"]
+        finally:
+            cur.close()
+    return rows
@@ -0,0 +1,44 @@
+# src/routes/export_routes.py
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from auth.deps import get_current_admin
+from services import export
+from services.table_versions import conditional_get
+
+router = APIRouter(prefix="/admin/export", tags=["Export"])
+
+MAX_EXPORT_BATCH_SIZE = 100000
+
+@router.get("/students", summary="Export students with their latest prediction")
+def export_students(
+    request: Request,
+    response: Response,
+    format: str = Query("csv", pattern="^(csv|arrow|parquet)$"),
+    batch_size: int = Query(export.EXPORT_BATCH_SIZE, ge=100, le=MAX_EXPORT_BATCH_SIZE),
+    admin=Depends(get_current_admin),
+):
+    """
+    Streams every student, joined with their most recent prediction, as CSV,
+    an Arrow IPC stream or a Parquet file. Rows are read from a server-side
+    cursor and encoded `batch_size` at a time (one Arrow record batch or
+    Parquet row group each), so the export runs in constant memory.
+    Arrow and Parquet need pyarrow installed on the server (501 otherwise).
+    """
+    try:
+        export.check_format(format)
+    except export.ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    not_modified = conditional_get(request, response, "students", "predictions")
+    if not_modified:
+        return not_modified
+    media_type, extension = export.FORMATS[format]
+    filename = f"students-{date.today().isoformat()}.{extension}"
+    return StreamingResponse(
+        export.export_chunks(format, batch_size),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            **{k: response.headers[k] for k in ("ETag", "Cache-Control")},
+        },
+    )
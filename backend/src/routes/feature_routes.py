@@ -0,0 +1,56 @@
+# src/routes/feature_routes.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from auth.deps import get_current_admin
+from ml import predictor
+from services import feature_store
+from services.feature_store import store as features
+
+router = APIRouter(prefix="/admin/features", tags=["Features"])
+
+def _require_store():
+    if not features.loaded:
+        raise HTTPException(status_code=503, detail="Feature store is still loading")
+
+@router.get("", summary="Feature store size and freshness")
+def get_store_stats(admin=Depends(get_current_admin)):
+    return features.stats()
+
+@router.get("/summary", summary="Distribution of each model feature")
+def get_feature_summary(admin=Depends(get_current_admin)):
+    """Count, mean, std, min, quartiles and max of each feature, computed in memory."""
+    _require_store()
+    ids, X = features.snapshot(complete_only=False)
+    return {"students": len(ids), "features": feature_store.summary(X)}
+
+@router.get("/forecast", summary="Predicted placement rate of a cohort")
+def get_forecast(
+    min_cgpa: Optional[float] = None,
+    max_cgpa: Optional[float] = None,
+    min_iq: Optional[float] = None,
+    max_iq: Optional[float] = None,
+    internship_experience: Optional[bool] = None,
+    admin=Depends(get_current_admin),
+):
+    """
+    Scores every matching student with complete features straight from the
+    feature store, in one batch, with no database queries. Filters match
+    `POST /predict/students`.
+    """
+    _require_store()
+    ids, X = features.snapshot()
+    mask = feature_store.filter_mask(
+        X, min_cgpa=min_cgpa, max_cgpa=max_cgpa, min_iq=min_iq, max_iq=max_iq,
+        internship_experience=internship_experience,
+    )
+    try:
+        labels = predictor.predict_matrix(X[mask])
+    except predictor.PredictionError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    placed = sum(1 for label in labels if label == "Yes")
+    return {
+        "students": len(labels),
+        "placed": placed,
+        "not_placed": len(labels) - placed,
+        "placement_rate": round(placed / len(labels) * 100, 2) if labels else 0.0,
+    }
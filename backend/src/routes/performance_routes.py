@@ -1,81 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException
-from auth.deps import get_current_admin
-from db.connection import get_connection
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+import aiomysql
+from auth.deps import STREAM_TICKET_AUDIENCE, get_current_admin, get_stream_admin
+from auth.jwt_handler import STREAM_TICKET_EXPIRE_SECONDS, create_stream_ticket
+from db.async_connection import async_connection, timed_execute_async
+from db.pool import PoolTimeout
+from services import live_feed
+from services.aggregates import store as aggregate_store
+from services.rankings import store as ranking_store
+from services.skill_index import index as skill_index
+from services.table_versions import conditional_get
 
 router = APIRouter(prefix="/admin/performance", tags=["Performance"])
 
+# Failures to reach MySQL at all, as opposed to errors in a query
+DB_UNAVAILABLE = (PoolTimeout, aiomysql.OperationalError)
+
 @router.get("/summary")
-def get_performance_summary(admin=Depends(get_current_admin)):
-    conn = get_connection()
-    if not conn:
-        raise HTTPException(status_code=500, detail="Database connection failed")
-    
-    cur = conn.cursor(dictionary=True)
+async def get_performance_summary(request: Request, response: Response, admin=Depends(get_current_admin)):
+    not_modified = conditional_get(request, response, "students", "predictions")
+    if not_modified:
+        return not_modified
+
+    # Answer from the incrementally maintained aggregates once they are loaded
+    if aggregate_store.loaded:
+        return aggregate_store.summary()
 
     try:
-        # Get average CGPA and IQ from students table
-        cur.execute("SELECT AVG(CGPA) AS avg_cgpa, AVG(IQ) AS avg_iq FROM students")
-        averages = cur.fetchone()
+        async with async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                # Get average CGPA and IQ from students table
+                averages = await timed_execute_async(
+                    cur, "performance.averages",
+                    "SELECT AVG(CGPA) AS avg_cgpa, AVG(IQ) AS avg_iq FROM students", fetch="one",
+                )
 
-        # Get placement rate from predictions table (if it exists)
-        placement_rate = 0
-        try:
-            cur.execute("SELECT COUNT(*) AS total, SUM(CASE WHEN predicted_status='Yes' THEN 1 ELSE 0 END) AS placed FROM predictions")
-            placement = cur.fetchone()
-            if placement and placement["total"] and placement["total"] > 0:
-                placement_rate = round((placement["placed"] / placement["total"] * 100), 2)
-        except Exception:
-            # predictions table doesn't exist yet, use 0 as default
-            placement_rate = 0
-
-        summary = {
-            "average_cgpa": round(averages["avg_cgpa"], 2) if averages and averages["avg_cgpa"] else 0,
-            "average_iq": round(averages["avg_iq"], 2) if averages and averages["avg_iq"] else 0,
-            "placement_rate": placement_rate
-        }
-
-        return summary
-    finally:
-        cur.close()
-        conn.close()
+                # Get placement rate from predictions table (if it exists)
+                placement_rate = 0
+                try:
+                    placement = await timed_execute_async(
+                        cur, "performance.placement",
+                        "SELECT COUNT(*) AS total, SUM(CASE WHEN predicted_status='Yes' THEN 1 ELSE 0 END) AS placed FROM predictions",
+                        fetch="one",
+                    )
+                    if placement and placement["total"] and placement["total"] > 0:
+                        placement_rate = round((placement["placed"] / placement["total"] * 100), 2)
+                except aiomysql.ProgrammingError:
+                    # predictions table doesn't exist yet, use 0 as default
+                    placement_rate = 0
+    except DB_UNAVAILABLE:
+        raise HTTPException(status_code=500, detail="Database connection failed")
+
+    summary = {
+        "average_cgpa": round(averages["avg_cgpa"], 2) if averages and averages["avg_cgpa"] else 0,
+        "average_iq": round(averages["avg_iq"], 2) if averages and averages["avg_iq"] else 0,
+        "placement_rate": placement_rate
+    }
+
+    return summary
 
 @router.get("/top-performers")
-def get_top_performers(admin=Depends(get_current_admin)):
-    conn = get_connection()
-    if not conn:
-        raise HTTPException(status_code=500, detail="Database connection failed")
-    
-    cur = conn.cursor(dictionary=True)
+async def get_top_performers(request: Request, response: Response, admin=Depends(get_current_admin)):
+    not_modified = conditional_get(request, response, "students")
+    if not_modified:
+        return not_modified
+
+    # Read from the in-memory CGPA ranking once it is loaded
+    if ranking_store.loaded:
+        top = ranking_store.top("cgpa", 5)["students"]
+        return {"top_performers": [{"id": s["student_id"], "name": s["name"], "CGPA": s["cgpa"]} for s in top]}
+
     try:
-        cur.execute("SELECT id, name, CGPA FROM students WHERE CGPA IS NOT NULL ORDER BY CGPA DESC LIMIT 5")
-        top_students = cur.fetchall()
-        return {"top_performers": top_students}
-    finally:
-        cur.close()
-        conn.close()
+        async with async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                top_students = await timed_execute_async(
+                    cur, "performance.top_performers",
+                    "SELECT id, name, CGPA FROM students WHERE CGPA IS NOT NULL ORDER BY CGPA DESC LIMIT 5",
+                    fetch="all",
+                )
+    except DB_UNAVAILABLE:
+        raise HTTPException(status_code=500, detail="Database connection failed")
+    return {"top_performers": top_students}
 
 @router.get("/skill-distribution")
-def get_skill_distribution(admin=Depends(get_current_admin)):
-    conn = get_connection()
-    if not conn:
-        raise HTTPException(status_code=500, detail="Database connection failed")
-    
-    cur = conn.cursor(dictionary=True)
+async def get_skill_distribution(request: Request, response: Response, admin=Depends(get_current_admin)):
+    # Deleting a student also removes its memberships, so "students" is included
+    not_modified = conditional_get(request, response, "skills", "student_skills", "students")
+    if not_modified:
+        return not_modified
+
+    # Count from the in-memory bitmap index once it is loaded
+    if skill_index.loaded:
+        return {"skill_distribution": skill_index.distribution()}
+
     try:
-        # Try to get skill distribution if tables exist
+        async with async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                # Try to get skill distribution if tables exist
+                try:
+                    data = await timed_execute_async(cur, "performance.skill_distribution", """
+                        SELECT s.name AS skill, COUNT(ss.student_id) AS count
+                        FROM skills s
+                        LEFT JOIN student_skills ss ON s.id = ss.skill_id
+                        GROUP BY s.name
+                    """, fetch="all")
+                except aiomysql.ProgrammingError:
+                    # Skills tables don't exist, return empty array
+                    data = []
+    except DB_UNAVAILABLE:
+        raise HTTPException(status_code=500, detail="Database connection failed")
+
+    return {"skill_distribution": data}
+
+@router.post("/stream/ticket", summary="One-time ticket for the dashboard stream")
+async def issue_stream_ticket(admin=Depends(get_current_admin)):
+    """
+    EventSource can't send an Authorization header, so it passes this ticket as
+    ?ticket= instead. It is valid for one connection within 30 seconds and for
+    nothing but the stream, so the URL never carries the access token.
+    """
+    return {
+        "ticket": create_stream_ticket(admin["username"], STREAM_TICKET_AUDIENCE),
+        "expires_in": STREAM_TICKET_EXPIRE_SECONDS,
+    }
+
+@router.get("/stream", summary="Live dashboard updates (Server-Sent Events)")
+async def stream_dashboard(request: Request, admin=Depends(get_stream_admin)):
+    """
+    A `snapshot` event with the summary, top performers and counts, then a `delta`
+    event with just the changed sections after each burst of student or prediction
+    writes. Authenticate with a bearer header or ?ticket= from POST /stream/ticket.
+    """
+    queue = live_feed.feed.subscribe()
+
+    async def events():
         try:
-            cur.execute("""
-                SELECT s.name AS skill, COUNT(ss.student_id) AS count
-                FROM skills s
-                LEFT JOIN student_skills ss ON s.id = ss.skill_id
-                GROUP BY s.name
-            """)
-            data = cur.fetchall()
-        except Exception:
-            # Skills tables don't exist, return empty array
-            data = []
-        
-        return {"skill_distribution": data}
-    finally:
-        cur.close()
-        conn.close()
+            yield f"retry: {int(live_feed.LIVE_FEED_DEBOUNCE_SECONDS * 1000) + 2000}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=live_feed.LIVE_FEED_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    # Comment line: keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    return  # dropped for falling behind, or shutting down
+                yield event
+        finally:
+            live_feed.feed.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/stream/stats", summary="Live dashboard feed state")
+async def get_stream_stats(admin=Depends(get_current_admin)):
+    return live_feed.feed.stats()
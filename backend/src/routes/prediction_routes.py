@@ -0,0 +1,173 @@
+# src/routes/prediction_routes.py
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from auth.deps import get_current_admin
+import models.student_model as student_model
+from ml.features import missing_fields, build_matrix, feature_row, matrix_to_records
+from ml import predictor
+from ml.cache import prediction_cache
+from services import feature_store
+from services.prediction_writer import prediction_writer
+
+router = APIRouter(prefix="/predict", tags=["Prediction"])
+
+MAX_BATCH_IDS = 50000
+
+class StudentFilter(BaseModel):
+    min_cgpa: Optional[float] = None
+    max_cgpa: Optional[float] = None
+    min_iq: Optional[float] = None
+    max_iq: Optional[float] = None
+    internship_experience: Optional[bool] = None
+
+class BatchPredictIn(BaseModel):
+    student_ids: Optional[List[int]] = Field(default=None, max_length=MAX_BATCH_IDS)
+    filter: Optional[StudentFilter] = None
+    all_students: bool = False
+
+@router.post("/students", summary="Predict placement for many students at once")
+def predict_students(payload: BatchPredictIn, admin=Depends(get_current_admin)):
+    """
+    Score a cohort in one pass: students are selected by id list, by filter, or
+    all at once; complete rows are stacked into one feature matrix and scored in
+    a single vectorized call. Incomplete rows are reported with `missing_fields`.
+    """
+    selectors = sum([payload.student_ids is not None, payload.filter is not None, payload.all_students])
+    if selectors != 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide exactly one of student_ids, filter or all_students=true",
+        )
+
+    # Features come from the in-memory store once it is loaded; only names and
+    # emails of the scored students are read from MySQL
+    if feature_store.store.loaded:
+        ids, X, not_found = _select_from_store(payload)
+        incomplete = []
+        complete = []
+        for i, (student_id, values) in enumerate(zip(ids.tolist(), X)):
+            missing = feature_store.missing_fields(values)
+            if missing:
+                incomplete.append({
+                    "student_id": student_id,
+                    "error": "Student data incomplete",
+                    "missing_fields": missing,
+                })
+            else:
+                complete.append(i)
+        complete_ids = ids[complete].tolist()
+        X = X[complete]
+        contacts = student_model.get_student_contacts(complete_ids)
+        input_count = len(ids)
+    else:
+        students, not_found = _select_from_db(payload)
+        complete = []
+        incomplete = []
+        for s in students:
+            missing = missing_fields(s)
+            if missing:
+                incomplete.append({
+                    "student_id": s["id"],
+                    "error": "Student data incomplete",
+                    "missing_fields": missing,
+                })
+            else:
+                complete.append(s)
+        complete_ids = [s["id"] for s in complete]
+        X = build_matrix(complete)
+        contacts = {s["id"]: s for s in complete}
+        input_count = len(students)
+
+    try:
+        labels = predictor.predict_students_matrix(X, complete_ids)
+    except predictor.PredictionError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    for student_id, features, label in zip(complete_ids, matrix_to_records(X), labels):
+        prediction_writer.enqueue(student_id, features, label)
+
+    results = [
+        {
+            "student_id": student_id,
+            "student_name": contacts.get(student_id, {}).get("name"),
+            "student_email": contacts.get(student_id, {}).get("email"),
+            "prediction": label,
+        }
+        for student_id, label in zip(complete_ids, labels)
+    ]
+
+    return {
+        "input_count": input_count,
+        "predicted_count": len(results),
+        "results": results,
+        "incomplete": incomplete,
+        "not_found": not_found,
+    }
+
+def _select_from_store(payload: BatchPredictIn):
+    """(ids, X, not_found) for the selected students, from the feature store."""
+    if payload.student_ids is not None:
+        ids, X = feature_store.store.rows_of(payload.student_ids)
+        found = set(ids.tolist())
+        return ids, X, [i for i in dict.fromkeys(payload.student_ids) if i not in found]
+    ids, X = feature_store.store.snapshot(complete_only=False)
+    if payload.filter:
+        mask = feature_store.filter_mask(X, **payload.filter.dict())
+        ids, X = ids[mask], X[mask]
+    return ids, X, []
+
+def _select_from_db(payload: BatchPredictIn):
+    """(student rows, not_found) for the selected students, from MySQL."""
+    if payload.student_ids is not None:
+        students = student_model.get_students_by_ids(payload.student_ids)
+        found = {s["id"] for s in students}
+        return students, [i for i in dict.fromkeys(payload.student_ids) if i not in found]
+    filters = payload.filter.dict() if payload.filter else {}
+    return student_model.get_students_matching(filters), []
+
+@router.get("/student/{student_id}/what-if", summary="Smallest feature changes that flip a prediction")
+def what_if(student_id: int, pairs: bool = True, admin=Depends(get_current_admin)):
+    """
+    Sweeps each of the eight model features across a grid (and, with `pairs`,
+    every pair of features across a coarser grid), scores every candidate in
+    one batch, and returns the smallest changes that flip the current
+    prediction, smallest first.
+    """
+    try:
+        if feature_store.store.loaded:
+            # Features from memory; only the name is read from MySQL
+            row = feature_store.store.features_of(student_id)
+            found = row is not None
+            missing = feature_store.missing_fields(row) if found else []
+            name = student_model.get_student_contacts([student_id]).get(student_id, {}).get("name") if found else None
+        else:
+            student = student_model.get_student_for_prediction(student_id)
+            found = student is not None
+            missing = missing_fields(student) if found else []
+            row = feature_row(student) if found and not missing else None
+            name = student["name"] if found else None
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database connection failed: {e}")
+    if not found:
+        raise HTTPException(status_code=404, detail=f"Student with ID {student_id} not found")
+    if missing:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": "Student data incomplete", "missing_fields": missing},
+        )
+
+    from ml import sensitivity  # numpy; kept off the server import path
+    try:
+        result = sensitivity.what_if(row, pairs=pairs)
+    except predictor.PredictionError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"student_id": student_id, "student_name": name, **result}
+
+@router.get("/cache/stats", summary="Prediction cache statistics")
+def get_cache_stats(admin=Depends(get_current_admin)):
+    return prediction_cache.stats()
+
+@router.get("/history/stats", summary="Prediction history write queue statistics")
+def get_history_stats(admin=Depends(get_current_admin)):
+    return prediction_writer.stats()
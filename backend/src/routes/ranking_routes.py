@@ -0,0 +1,42 @@
+# src/routes/ranking_routes.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from auth.deps import get_current_admin
+from services.rankings import store as ranking_store, RANKED_METRICS
+
+router = APIRouter(prefix="/admin/rankings", tags=["Rankings"])
+
+MAX_RANK_PAGE = 1000
+
+def _check(metric: str):
+    if metric not in RANKED_METRICS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown metric '{metric}'. Ranked metrics: {', '.join(RANKED_METRICS)}",
+        )
+    if not ranking_store.loaded:
+        raise HTTPException(status_code=503, detail="Rankings are still loading")
+
+@router.get("/{metric}", summary="Students by rank on a metric")
+async def get_ranking(
+    metric: str,
+    limit: int = Query(10, ge=1, le=MAX_RANK_PAGE),
+    offset: int = Query(0, ge=0, description="Number of ranks to skip; offset=99&limit=51 gives ranks 100-150"),
+    admin=Depends(get_current_admin),
+):
+    """Highest value first; ties are ordered by student id."""
+    _check(metric)
+    return ranking_store.top(metric, limit, offset)
+
+@router.get("/{metric}/percentile", summary="Rank and percentile of a value")
+async def get_value_percentile(metric: str, value: float = Query(...), admin=Depends(get_current_admin)):
+    _check(metric)
+    return ranking_store.percentile_of(metric, value)
+
+@router.get("/{metric}/students/{student_id}", summary="Rank and percentile of a student")
+async def get_student_rank(metric: str, student_id: int, admin=Depends(get_current_admin)):
+    """`rank` is 1 + the number of students with a strictly higher value; ties share a rank."""
+    _check(metric)
+    result = ranking_store.student(metric, student_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Student not found or has no {metric}")
+    return result
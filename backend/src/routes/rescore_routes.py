@@ -0,0 +1,57 @@
+# src/routes/rescore_routes.py
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import Optional
+from auth.deps import get_current_admin
+from services import rescore
+
+router = APIRouter(prefix="/admin/rescore", tags=["Rescoring"])
+
+class RescoreJobIn(BaseModel):
+    chunk_size: Optional[int] = Field(default=None, ge=1, le=50000)
+    concurrency: Optional[int] = Field(default=None, ge=1, le=32)
+    rate_limit: Optional[float] = Field(default=None, ge=0, description="Students per second, 0 for no limit")
+
+def _start(job_id: int):
+    try:
+        rescore.runner.start(job_id)
+    except rescore.JobNotFound:
+        raise HTTPException(status_code=404, detail="Job not found")
+    except rescore.JobFinished:
+        raise HTTPException(status_code=400, detail="Job already completed")
+    except rescore.JobBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@router.post("/jobs", status_code=202, summary="Start re-scoring every student")
+def start_job(payload: RescoreJobIn, admin=Depends(get_current_admin)):
+    """
+    Creates a job over every current student and runs it in the background.
+    Unset options fall back to RESCORE_CHUNK_SIZE, RESCORE_CONCURRENCY and RESCORE_RATE_LIMIT.
+    """
+    if rescore.runner.active():
+        raise HTTPException(status_code=409, detail=f"Job {rescore.runner.job_id} is already running")
+    job_id = rescore.create_job(payload.chunk_size, payload.concurrency, payload.rate_limit)
+    _start(job_id)
+    return {"job_id": job_id}
+
+@router.get("/jobs", summary="Recent re-scoring jobs")
+def list_jobs(admin=Depends(get_current_admin)):
+    return [rescore.job_status(job) for job in rescore.list_jobs()]
+
+@router.get("/jobs/{job_id}", summary="Progress of a re-scoring job")
+def get_job(job_id: int, admin=Depends(get_current_admin)):
+    job = rescore.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return rescore.job_status(job)
+
+@router.post("/jobs/{job_id}/resume", status_code=202, summary="Resume a job from its checkpoint")
+def resume_job(job_id: int, admin=Depends(get_current_admin)):
+    _start(job_id)
+    return {"job_id": job_id}
+
+@router.post("/jobs/{job_id}/cancel", summary="Stop a job after its in-flight chunks")
+def cancel_job(job_id: int, admin=Depends(get_current_admin)):
+    if rescore.runner.job_id != job_id or not rescore.runner.stop("cancelled"):
+        raise HTTPException(status_code=409, detail="Job is not running in this process")
+    return rescore.job_status(rescore.get_job(job_id))
@@ -0,0 +1,104 @@
+# src/routes/skill_routes.py
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import aiomysql
+from auth.deps import get_current_admin
+import models.async_skill_model as skill_model
+from services.skill_index import index as skill_index
+
+router = APIRouter(prefix="/admin/skills", tags=["Skills"])
+
+MAX_ASSIGN_IDS = 1000
+MAX_QUERY_PAGE = 10000
+
+class SkillIn(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+
+class SkillStudentsIn(BaseModel):
+    student_ids: List[int] = Field(min_length=1, max_length=MAX_ASSIGN_IDS)
+
+def _require_index():
+    if not skill_index.loaded:
+        raise HTTPException(status_code=503, detail="Skill index is still loading")
+
+def _parse_ids(value: Optional[str], param: str) -> list:
+    if not value:
+        return []
+    try:
+        return [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{param} must be comma-separated skill ids")
+
+@router.get("", summary="List skills with student counts")
+async def list_skills(admin=Depends(get_current_admin)):
+    _require_index()
+    counts = {d["skill"]: d["count"] for d in skill_index.distribution()}
+    return [{**s, "students": counts.get(s["name"], 0)} for s in skill_index.skills()]
+
+@router.post("", summary="Create a skill")
+async def add_skill(payload: SkillIn, admin=Depends(get_current_admin)):
+    try:
+        skill_id = await skill_model.add_skill(payload.name.strip())
+    except aiomysql.IntegrityError:
+        raise HTTPException(status_code=409, detail="A skill with this name already exists")
+    return {"skill_id": skill_id}
+
+@router.delete("/{skill_id}", summary="Delete a skill and its memberships")
+async def delete_skill(skill_id: int, admin=Depends(get_current_admin)):
+    ok = await skill_model.delete_skill(skill_id)
+    if not ok:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return {"message": "deleted"}
+
+@router.post("/{skill_id}/students", summary="Give a skill to students")
+async def assign_skill(skill_id: int, payload: SkillStudentsIn, admin=Depends(get_current_admin)):
+    """Unknown student ids are skipped and reported in `not_found`."""
+    assigned = await skill_model.assign_skill(skill_id, payload.student_ids)
+    if assigned is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    found = set(assigned)
+    return {
+        "assigned": len(assigned),
+        "not_found": [i for i in dict.fromkeys(payload.student_ids) if i not in found],
+    }
+
+@router.delete("/{skill_id}/students/{student_id}", summary="Take a skill away from a student")
+async def unassign_skill(skill_id: int, student_id: int = Path(ge=1), admin=Depends(get_current_admin)):
+    removed = await skill_model.unassign_skill(skill_id, [student_id])
+    if not removed:
+        raise HTTPException(status_code=404, detail="Student does not have this skill")
+    return {"message": "removed"}
+
+@router.get("/students/{student_id}", summary="Skills of a student")
+async def get_student_skills(student_id: int = Path(ge=1), admin=Depends(get_current_admin)):
+    _require_index()
+    skills = skill_index.student_skills(student_id)
+    if skills is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return {"student_id": student_id, "skills": skills}
+
+@router.get("/query", summary="Students by skill combination")
+async def query_students(
+    all_of: Optional[str] = Query(None, description="Comma-separated skill ids the student must have"),
+    any_of: Optional[str] = Query(None, description="Comma-separated skill ids, at least one required"),
+    none_of: Optional[str] = Query(None, description="Comma-separated skill ids the student must not have"),
+    limit: int = Query(100, ge=1, le=MAX_QUERY_PAGE),
+    offset: int = Query(0, ge=0),
+    admin=Depends(get_current_admin),
+):
+    """
+    e.g. `?all_of=1,2&none_of=3` returns students with skills 1 AND 2 but NOT 3,
+    in ascending id order, plus the total `count`. Answered from the bitmap index.
+    """
+    _require_index()
+    try:
+        return skill_index.query(
+            all_of=_parse_ids(all_of, "all_of"),
+            any_of=_parse_ids(any_of, "any_of"),
+            none_of=_parse_ids(none_of, "none_of"),
+            offset=offset,
+            limit=limit,
+        )
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Skill {e.args[0]} not found")
@@ -1,12 +1,27 @@
 # src/routes/student_routes.py
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, EmailStr
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, EmailStr, ValidationError
 from typing import Optional
+import codecs
+import csv
+import json
+import os
 from auth.deps import get_current_admin
-import models.student_model as student_model
+import models.async_student_model as student_model
+from services.table_versions import conditional_get
 
 router = APIRouter(prefix="/admin/students", tags=["Students"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+MAX_IMPORT_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+
 class StudentIn(BaseModel):
     name: str
     email: EmailStr
@@ -20,35 +35,187 @@ class StudentIn(BaseModel):
     internship_experience: Optional[bool] = False
 
 @router.post("", summary="Add a new student")
-def add_student(payload: StudentIn, admin=Depends(get_current_admin)):
+async def add_student(payload: StudentIn, admin=Depends(get_current_admin)):
     student = payload.dict()
     try:
-        new_id = student_model.add_student(student)
+        new_id = await student_model.add_student(student)
         return {"student_id": new_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _iter_upload_rows(upload: UploadFile, fmt: str):
+    """
+    Yield (row_number, raw_dict, parse_error) from a CSV or NDJSON upload
+    without reading the whole file into memory.
+    """
+    text = codecs.getreader("utf-8-sig")(upload.file)
+    if fmt == "csv":
+        for i, row in enumerate(csv.DictReader(text), start=1):
+            # Blank cells fall back to the model defaults
+            yield i, {k.strip(): v for k, v in row.items() if k and v is not None and v.strip() != ""}, None
+    else:
+        for i, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield i, json.loads(line), None
+            except json.JSONDecodeError as e:
+                yield i, None, f"Invalid JSON: {e}"
+
+def _import_format(upload: UploadFile, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    name = (upload.filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in (upload.content_type or ""):
+        return "ndjson"
+    return "csv"
+
+class _ImportReport:
+    def __init__(self):
+        self.total = 0
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []
+
+    def error(self, row_number: int, messages: list):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row_number, "errors": messages})
+
+    def as_dict(self) -> dict:
+        return {
+            "total_rows": self.total,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+async def _insert_batch(batch: list, report: _ImportReport):
+    """Insert one batch; if it fails, retry row by row to pin the error on specific rows."""
+    try:
+        report.inserted += await student_model.add_students_bulk([student for _, student in batch])
+    except Exception:
+        for row_number, student in batch:
+            try:
+                await student_model.add_student(student)
+                report.inserted += 1
+            except Exception as e:
+                report.error(row_number, [str(e)])
+
+def _next_batch(rows, batch_size: int, report: _ImportReport):
+    """
+    Read and validate upload rows until `batch_size` are valid or the file ends.
+    Returns (batch, done). Blocking: file reads and pydantic validation.
+    """
+    batch = []
+    try:
+        for row_number, raw, parse_error in rows:
+            report.total += 1
+            if parse_error:
+                report.error(row_number, [parse_error])
+                continue
+            try:
+                batch.append((row_number, StudentIn(**raw).dict()))
+            except ValidationError as e:
+                report.error(row_number, [
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                ])
+            except TypeError:
+                report.error(row_number, ["Row is not an object"])
+            if len(batch) >= batch_size:
+                return batch, False
+    except (UnicodeDecodeError, csv.Error) as e:
+        # Unreadable file: keep what was already committed and report where it stopped
+        report.error(report.total + 1, [f"Could not read file: {e}"])
+    return batch, True
+
+@router.post("/import", summary="Bulk import students from CSV or NDJSON")
+async def import_students(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=MAX_IMPORT_BATCH_SIZE),
+    admin=Depends(get_current_admin),
+):
+    """
+    Rows are validated against StudentIn as they are read and inserted in
+    batches of `batch_size`, one transaction per batch. Invalid rows are
+    skipped and reported by row number (1-based, excluding the CSV header).
+    """
+    report = _ImportReport()
+    rows = _iter_upload_rows(file, _import_format(file, format))
+    done = False
+    while not done:
+        # Parse and validate each batch in the threadpool so a large upload
+        # doesn't hold up the event loop between inserts
+        batch, done = await run_in_threadpool(_next_batch, rows, batch_size, report)
+        if batch:
+            await _insert_batch(batch, report)
+
+    return report.as_dict()
+
+def _parse_fields(fields: Optional[str]):
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(",") if f.strip()]
+
 @router.get("", summary="List students")
-def list_students(admin=Depends(get_current_admin)):
-    return student_model.get_all_students()
+async def list_students(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="Return students with id below this cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return"),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    admin=Depends(get_current_admin),
+):
+    """
+    Newest-first page of students. The cursor for the next page is returned in
+    the `X-Next-Cursor` header (absent on the last page). `format=ndjson`
+    streams every student, one JSON object per line, ignoring limit/cursor.
+    """
+    not_modified = conditional_get(request, response, "students")
+    if not_modified:
+        return not_modified
+    projection = _parse_fields(fields)
+    try:
+        if format == "ndjson":
+            rows = student_model.iter_students(projection)
+            # Same encoding as the JSON page response (ISO datetimes, Decimals as numbers)
+            lines = (json.dumps(jsonable_encoder(row)) + "\n" async for row in rows)
+            return StreamingResponse(
+                lines, media_type="application/x-ndjson",
+                headers={k: response.headers[k] for k in ("ETag", "Cache-Control")},
+            )
+
+        rows, next_cursor = await student_model.get_students_page(limit, cursor, projection)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return rows
 
 @router.get("/{student_id}", summary="Get student by id")
-def get_student(student_id: int, admin=Depends(get_current_admin)):
-    s = student_model.get_student_by_id(student_id)
+async def get_student(student_id: int, request: Request, response: Response, admin=Depends(get_current_admin)):
+    not_modified = conditional_get(request, response, "students")
+    if not_modified:
+        return not_modified
+    s = await student_model.get_student_by_id(student_id)
     if not s:
         raise HTTPException(status_code=404, detail="Student not found")
     return s
 
 @router.put("/{student_id}", summary="Update student")
-def update_student(student_id: int, payload: StudentIn, admin=Depends(get_current_admin)):
-    ok = student_model.update_student(student_id, payload.dict(exclude_unset=True))
+async def update_student(student_id: int, payload: StudentIn, admin=Depends(get_current_admin)):
+    ok = await student_model.update_student(student_id, payload.dict(exclude_unset=True))
     if not ok:
         raise HTTPException(status_code=404, detail="Student not found or no changes")
     return {"message": "updated"}
 
 @router.delete("/{student_id}", summary="Delete student")
-def delete_student(student_id: int, admin=Depends(get_current_admin)):
-    ok = student_model.delete_student(student_id)
+async def delete_student(student_id: int, admin=Depends(get_current_admin)):
+    ok = await student_model.delete_student(student_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Student not found")
     return {"message": "deleted"}
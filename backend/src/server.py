@@ -1,24 +1,105 @@
-from fastapi import FastAPI, HTTPException
+import time
+_imports_started = time.perf_counter()
+
+from fastapi import FastAPI, HTTPException, Depends, Response
+from fastapi.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
-from db.connection import get_connection
+import asyncio
+from db.connection import close_pool, pool_stats
+from db.async_connection import close_async_pool, async_pool_stats
+from auth.deps import get_current_admin
+from auth.hashing import shutdown_hash_pool
 from auth.routes import router as admin_router
-import requests
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
 from routes.student_routes import router as student_router
 from routes.performance_routes import router as performance_router
+from routes.prediction_routes import router as prediction_router
+from routes.ranking_routes import router as ranking_router
+from routes.skill_routes import router as skill_router
+from routes.rescore_routes import router as rescore_router
+from routes.export_routes import router as export_router
+from routes.feature_routes import router as feature_router
+from ml.features import missing_fields, build_features
+from ml import predictor
+from ml.cache import on_student_write as invalidate_cached_predictions
+from services import (
+    aggregates, feature_store, live_feed, metrics, rankings, rescore, skill_index, startup,
+    table_versions,
+)
+from services.prediction_writer import prediction_writer
+import models.student_model as student_model
+import models.async_student_model as async_student_model
+import models.async_skill_model as skill_model
 
 load_dotenv()
+startup.state.record("imports", time.perf_counter() - _imports_started)
+
+# Keep in-memory state in sync with writes to `students`
+student_model.add_listener(invalidate_cached_predictions)
+student_model.add_listener(aggregates.on_student_write)
+student_model.add_listener(rankings.on_student_write)
+student_model.add_listener(feature_store.on_student_write)
+student_model.add_listener(table_versions.on_student_write)
+student_model.add_listener(skill_index.on_student_write)
+student_model.add_listener(live_feed.on_student_write)
+skill_model.add_listener(skill_index.on_skill_write)
+skill_model.add_listener(table_versions.on_skill_write)
+prediction_writer.add_listener(aggregates.on_predictions_written)
+prediction_writer.add_listener(table_versions.on_predictions_written)
+prediction_writer.add_listener(live_feed.on_predictions_written)
+rescore.runner.add_listener(aggregates.on_predictions_written)
+rescore.runner.add_listener(table_versions.on_predictions_written)
+rescore.runner.add_listener(live_feed.on_predictions_written)
+
+
+async def reconcile_in_memory_state_periodically():
+    while True:
+        await asyncio.sleep(aggregates.AGGREGATE_RECONCILE_SECONDS)
+        try:
+            await run_in_threadpool(aggregates.store.reconcile)
+        except Exception as e:
+            print(f"❌ Aggregate reconciliation failed: {e}")
+        try:
+            await run_in_threadpool(rankings.store.reload)
+        except Exception as e:
+            print(f"❌ Ranking reload failed: {e}")
+        try:
+            await run_in_threadpool(feature_store.store.reload)
+        except Exception as e:
+            print(f"❌ Feature store reload failed: {e}")
+        try:
+            await skill_index.index.reload()
+        except Exception as e:
+            print(f"❌ Skill index reload failed: {e}")
+        # Pick up writes made outside this process
+        table_versions.versions.bump_all()
+        live_feed.feed.notify()
+
 
-# ✅ Startup check for MySQL connection
+# ✅ Warm everything up in the background; /readyz flips to 200 when done
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("🔄 Checking MySQL connection...")
-    conn = get_connection()
-    if conn and conn.is_connected():
-        print("✅ Connected to MySQL.")
-        conn.close()
+    print("🔄 Warming up: DB pools, placement model, in-memory indexes...")
+    startup_task = asyncio.create_task(startup.run())
+    reconcile_task = asyncio.create_task(reconcile_in_memory_state_periodically())
+    live_feed_task = asyncio.create_task(live_feed.feed.run())
+    prediction_writer.start()
     yield
+    startup_task.cancel()
+    reconcile_task.cancel()
+    live_feed_task.cancel()
+    live_feed.feed.close()
+    if await run_in_threadpool(rescore.runner.stop, "paused"):
+        print(f"🔄 Paused rescoring job {rescore.runner.job_id}; resume it from its checkpoint.")
+    print("🔄 Flushing queued predictions...")
+    await run_in_threadpool(prediction_writer.stop)
+    if not predictor.use_local_model():
+        from ml.client import close_client
+        await close_client()
+    shutdown_hash_pool()
+    await close_async_pool()
+    close_pool()
 
 # ✅ Initialize app
 app = FastAPI(title="Placement Prediction API", version="1.0", lifespan=lifespan)
@@ -36,87 +117,89 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Content-Disposition"],
 )
+app.add_middleware(metrics.MetricsMiddleware)
 
 # ✅ Register routes
 app.include_router(admin_router)
 app.include_router(student_router)
 app.include_router(performance_router)
+app.include_router(prediction_router)
+app.include_router(ranking_router)
+app.include_router(skill_router)
+app.include_router(rescore_router)
+app.include_router(export_router)
+app.include_router(feature_router)
 
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Placement Prediction API is running 🚀"}
 
 
+@app.get("/healthz", include_in_schema=False)
+async def healthz():
+    """Liveness: the process is up and serving the event loop."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz", include_in_schema=False)
+async def readyz(response: Response):
+    """Readiness: 503 until the DB pools are filled and the model is warm."""
+    status = startup.state.status()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
+@app.get("/admin/db/pool", tags=["Admin"])
+async def get_pool_stats(admin=Depends(get_current_admin)):
+    return {**pool_stats(), "async": async_pool_stats()}
+
+
 # ✅ Unified prediction route
 @app.get("/predict/student/{student_id}")
-def predict_by_student_id(student_id: int):
+async def predict_by_student_id(student_id: int):
     """
-    Fetch student data by ID → send to ngrok ML API → return prediction + student info.
+    Fetch student data by ID → score with the configured model backend → return prediction + student info.
     """
     try:
         # 1️⃣ Fetch student data from the database
-        conn = get_connection()
-        if not conn:
-            raise HTTPException(status_code=500, detail="Database connection failed")
-
-        cur = conn.cursor(dictionary=True)
-        query = """
-        SELECT id, name, email, iq, prev_sem_result, cgpa, academic_performance,
-               communication_skills, extra_curricular_score, projects_completed,
-               internship_experience
-        FROM students WHERE id = %s
-        """
-        cur.execute(query, (student_id,))
-        student = cur.fetchone()
-        cur.close()
-        conn.close()
+        try:
+            student = await async_student_model.get_student_for_prediction(student_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Database connection failed: {e}")
 
         if not student:
             raise HTTPException(status_code=404, detail=f"Student with ID {student_id} not found")
 
         # 2️⃣ Check for missing fields
-        required_fields = [
-            'iq', 'prev_sem_result', 'cgpa', 'academic_performance',
-            'communication_skills', 'extra_curricular_score',
-            'projects_completed', 'internship_experience'
-        ]
-        missing_fields = [f for f in required_fields if student.get(f) is None]
-        if missing_fields:
+        missing = missing_fields(student)
+        if missing:
             return {
                 "error": "Student data incomplete",
-                "missing_fields": missing_fields,
+                "missing_fields": missing,
                 "message": "Please update student record with all required fields"
             }
 
-        # 3️⃣ Prepare payload for ML API (as a list of one object)
-        payload = [
-            {
-                "IQ": float(student['iq']),
-                "Prev_Sem_Result": float(student['prev_sem_result']),
-                "CGPA": float(student['cgpa']),
-                "Academic_Performance": float(student['academic_performance']),
-                "Extra_Curricular_Score": float(student['extra_curricular_score']),
-                "Communication_Skills": float(student['communication_skills']),
-                "Projects_Completed": int(student['projects_completed']),
-                "Internship_Experience_Yes": 1 if student['internship_experience'] else 0,
-            }
-        ]
+        # 3️⃣ Prepare the model input record
+        features = build_features(student)
 
-        # 4️⃣ Send to ML model API
+        # 4️⃣ Score locally or via the remote ML API, depending on ML_BACKEND
         try:
-            response = requests.post(
-                "https://mudfish-complete-luckily.ngrok-free.app/predict",
-                json=payload,  # ✅ send as list
-                timeout=15
-            )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            raise HTTPException(status_code=500, detail=f"ML model request failed: {e}")
-
-        ml_response = response.json()
-        prediction = ml_response.get("prediction", "Unknown")
+            prediction = await predictor.predict_student_async(student['id'], features)
+        except predictor.PredictionError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        # Record it in `predictions` in the background
+        prediction_writer.enqueue(student['id'], features, prediction)
 
         # 5️⃣ Return combined data to frontend
         return {
@@ -124,7 +207,7 @@ def predict_by_student_id(student_id: int):
             "student_name": student['name'],
             "student_email": student['email'],
             "prediction": prediction,
-            "student_data": payload[0]
+            "student_data": features
         }
 
     except Exception as e:
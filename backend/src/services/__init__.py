@@ -0,0 +1 @@
+# In-memory derived state kept in sync with MySQL (aggregates, indexes, queues)
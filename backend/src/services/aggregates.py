@@ -0,0 +1,131 @@
+# src/services/aggregates.py
+"""
+Running aggregates behind /admin/performance/summary.
+
+The store keeps sums and non-NULL counts of students.cgpa and students.iq plus
+prediction totals, so the summary is computed in O(1) instead of scanning
+`students` and `predictions` on every dashboard load. Student writes and
+prediction inserts update it incrementally; reconcile() periodically reloads
+the exact values from MySQL to correct any drift.
+"""
+import os
+import threading
+import time
+
+from db.connection import connection, timed_execute
+
+AGGREGATE_RECONCILE_SECONDS = float(os.getenv("AGGREGATE_RECONCILE_SECONDS", "300"))
+
+
+class AggregateStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.cgpa_sum = 0.0
+        self.cgpa_count = 0
+        self.iq_sum = 0.0
+        self.iq_count = 0
+        self.predictions_total = 0
+        self.predictions_placed = 0
+        self.last_reconciled_at = None
+        # Bumped on every incremental change; reconcile() uses it to detect
+        # writes that raced with its queries
+        self._generation = 0
+
+    # ---------- incremental updates ----------
+
+    def _apply_student(self, row: dict, sign: int):
+        cgpa = row.get("cgpa")
+        if cgpa is not None:
+            self.cgpa_sum += sign * float(cgpa)
+            self.cgpa_count += sign
+        iq = row.get("iq")
+        if iq is not None:
+            self.iq_sum += sign * float(iq)
+            self.iq_count += sign
+
+    def on_student_write(self, op: str, student_id: int, before, after):
+        """student_model write listener."""
+        with self._lock:
+            if before:
+                self._apply_student(before, -1)
+            if after:
+                self._apply_student(after, +1)
+            self._generation += 1
+
+    def on_predictions_inserted(self, statuses: list):
+        """Call after prediction rows are committed, with their predicted_status values."""
+        with self._lock:
+            self.predictions_total += len(statuses)
+            self.predictions_placed += sum(1 for s in statuses if s == "Yes")
+            self._generation += 1
+
+    # ---------- reconciliation ----------
+
+    def reconcile(self, attempts: int = 3) -> bool:
+        """Reload exact aggregates from MySQL. Returns True once a consistent snapshot is applied."""
+        for _ in range(attempts):
+            with self._lock:
+                generation = self._generation
+            with connection() as conn:
+                cur = conn.cursor(dictionary=True)
+                try:
+                    students = timed_execute(
+                        cur, "aggregates.students",
+                        "SELECT SUM(cgpa) AS cgpa_sum, COUNT(cgpa) AS cgpa_count, "
+                        "SUM(iq) AS iq_sum, COUNT(iq) AS iq_count FROM students",
+                        fetch="one",
+                    )
+                    try:
+                        predictions = timed_execute(
+                            cur, "aggregates.predictions",
+                            "SELECT COUNT(*) AS total, "
+                            "SUM(CASE WHEN predicted_status='Yes' THEN 1 ELSE 0 END) AS placed "
+                            "FROM predictions",
+                            fetch="one",
+                        )
+                    except Exception:
+                        # predictions table doesn't exist yet
+                        predictions = None
+                finally:
+                    cur.close()
+            with self._lock:
+                if generation != self._generation:
+                    continue  # a write landed mid-reconcile; take a fresh snapshot
+                self.cgpa_sum = float(students["cgpa_sum"] or 0)
+                self.cgpa_count = int(students["cgpa_count"] or 0)
+                self.iq_sum = float(students["iq_sum"] or 0)
+                self.iq_count = int(students["iq_count"] or 0)
+                self.predictions_total = int((predictions or {}).get("total") or 0)
+                self.predictions_placed = int((predictions or {}).get("placed") or 0)
+                self.loaded = True
+                self.last_reconciled_at = time.time()
+                return True
+        return False
+
+    # ---------- reads ----------
+
+    def summary(self) -> dict:
+        with self._lock:
+            avg_cgpa = self.cgpa_sum / self.cgpa_count if self.cgpa_count else None
+            avg_iq = self.iq_sum / self.iq_count if self.iq_count else None
+            placement_rate = 0
+            if self.predictions_total > 0:
+                placement_rate = round(self.predictions_placed / self.predictions_total * 100, 2)
+        return {
+            "average_cgpa": round(avg_cgpa, 2) if avg_cgpa else 0,
+            "average_iq": round(avg_iq, 2) if avg_iq else 0,
+            "placement_rate": placement_rate,
+        }
+
+
+store = AggregateStore()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    store.on_student_write(op, student_id, before, after)
+
+
+def on_predictions_written(rows: list):
+    """prediction_writer listener."""
+    store.on_predictions_inserted([r["predicted_status"] for r in rows])
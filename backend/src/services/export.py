@@ -0,0 +1,199 @@
+# src/services/export.py
+"""
+Streaming export of students joined with their latest prediction.
+
+Rows are read through a server-side cursor (student_model.stream_query) and
+encoded one fixed-size batch at a time, so memory stays flat however many
+students there are:
+
+    csv       header, then one CSV chunk per batch
+    arrow     Arrow IPC stream, one record batch per batch
+    parquet   Parquet file, one row group per batch
+
+Arrow and Parquet need pyarrow, which is optional; without it they raise
+ExportUnavailable and CSV still works.
+"""
+import csv
+import io
+import os
+
+from models.student_model import stream_query
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "10000"))
+
+FORMATS = {
+    # format: (media type, file extension)
+    "csv": ("text/csv", "csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# (column, arrow type name) in output order
+COLUMNS = [
+    ("id", "int64"),
+    ("name", "string"),
+    ("email", "string"),
+    ("cgpa", "float64"),
+    ("iq", "float64"),
+    ("prev_sem_result", "float64"),
+    ("academic_performance", "float64"),
+    ("communication_skills", "float64"),
+    ("extra_curricular_score", "float64"),
+    ("projects_completed", "int64"),
+    ("internship_experience", "bool"),
+    ("created_at", "timestamp"),
+    ("updated_at", "timestamp"),
+    ("prediction_id", "int64"),
+    ("predicted_status", "string"),
+    ("predicted_at", "timestamp"),
+]
+
+# The latest prediction per student comes straight off
+# idx_predictions_student_created (student_id, created_at). Timestamps are
+# converted by MySQL ({ts}), which is much cheaper than building and formatting
+# a Python datetime per value.
+EXPORT_SQL = """
+    SELECT s.id, s.name, s.email, s.cgpa, s.iq, s.prev_sem_result, s.academic_performance,
+           s.communication_skills, s.extra_curricular_score, s.projects_completed,
+           s.internship_experience, {created_at}, {updated_at},
+           p.id, p.predicted_status, {predicted_at}
+    FROM students s
+    LEFT JOIN predictions p ON p.id = (
+        SELECT p2.id FROM predictions p2
+        WHERE p2.student_id = s.id
+        ORDER BY p2.created_at DESC, p2.id DESC
+        LIMIT 1
+    )
+    ORDER BY s.id
+    """
+
+# CSV gets "YYYY-MM-DD HH:MM:SS" text; Arrow and Parquet get epoch seconds
+TIMESTAMP_SQL = {"csv": "CAST({} AS CHAR)", "epoch": "UNIX_TIMESTAMP({})"}
+
+
+class ExportUnavailable(Exception):
+    """The requested format needs an optional dependency that isn't installed."""
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401  (loads the pyarrow.parquet submodule)
+    except ImportError:
+        raise ExportUnavailable("Arrow and Parquet export need pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def check_format(fmt: str):
+    """Raise ExportUnavailable now rather than halfway through a response."""
+    if fmt in ("arrow", "parquet"):
+        _pyarrow()
+
+
+def export_sql(timestamps: str) -> str:
+    ts = TIMESTAMP_SQL[timestamps]
+    return EXPORT_SQL.format(
+        created_at=ts.format("s.created_at"),
+        updated_at=ts.format("s.updated_at"),
+        predicted_at=ts.format("p.created_at"),
+    )
+
+
+def iter_batches(timestamps: str, batch_size: int = EXPORT_BATCH_SIZE):
+    """Lists of at most `batch_size` export rows (tuples in COLUMNS order), in id order."""
+    batch = []
+    rows = stream_query(
+        export_sql(timestamps), batch_size=batch_size, name="students.export", dictionary=False
+    )
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_chunks(batches):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([name for name, _ in COLUMNS])
+    yield buf.getvalue().encode()
+    for batch in batches:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(batch)
+        yield buf.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last take()."""
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buf += data
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._pos
+
+    def take(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+def _arrow_schema(pa):
+    types = {
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("s", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in COLUMNS])
+
+
+def _record_batch(pa, schema, batch: list):
+    arrays = []
+    for field, values in zip(schema, zip(*batch)):
+        if field.type == pa.bool_():
+            # MySQL BOOLEAN comes back as 0/1
+            arrays.append(pa.array(values, type=pa.int8()).cast(field.type))
+        elif pa.types.is_timestamp(field.type):
+            arrays.append(pa.array(values, type=pa.int64()).cast(field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _arrow_chunks(batches, fmt: str):
+    pa = _pyarrow()
+    schema = _arrow_schema(pa)
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(sink, schema, compression="snappy")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    try:
+        for batch in batches:
+            writer.write_batch(_record_batch(pa, schema, batch))
+            yield sink.take()
+    finally:
+        # Writes the Parquet footer / Arrow end-of-stream marker
+        writer.close()
+    yield sink.take()
+
+
+def export_chunks(fmt: str, batch_size: int = EXPORT_BATCH_SIZE):
+    """Encoded bytes of the whole export in `fmt`, one chunk per batch."""
+    if fmt == "csv":
+        return _csv_chunks(iter_batches("csv", batch_size))
+    return _arrow_chunks(iter_batches("epoch", batch_size), fmt)
@@ -0,0 +1,266 @@
+# src/services/feature_store.py
+"""
+Columnar in-memory copy of every student's model features.
+
+Three parallel NumPy arrays, in ascending id order:
+
+    ids     int64, the student ids (AUTO_INCREMENT, so inserts append)
+    X       float64 (n, 8), the features in FEATURE_COLUMNS order, NaN if NULL
+    alive   bool, False for deleted rows until the next compaction
+
+A student's row is found with np.searchsorted on `ids`; rows without a NaN are
+the ones the model can score. That's about 75 bytes
+per student, against well over a kilobyte for a dict per row, and a whole
+cohort can be sliced straight into predict_matrix().
+
+Loaded at startup and on the reconcile schedule; kept current by the
+student_model write listener. numpy is imported on first use, like the other
+matrix helpers, so importing this module stays cheap.
+"""
+import threading
+import time
+
+from ml.features import FEATURE_COLUMNS, FEATURE_FIELDS, REQUIRED_FIELDS
+from models.student_model import stream_query
+
+_INITIAL_CAPACITY = 1024
+
+
+class FeatureStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._n = 0          # rows in use, including deleted ones
+        self._dead = 0       # deleted rows not yet compacted away
+        self._ids = None
+        self._X = None
+        self._alive = None
+        self.loaded = False
+        self.last_loaded_at = None
+        # Bumped on every incremental change; reload() uses it to detect
+        # writes that raced with its scan
+        self._generation = 0
+
+    # ---------- storage ----------
+
+    def _allocate(self, capacity: int):
+        import numpy as np
+
+        ids = np.zeros(capacity, dtype=np.int64)
+        X = np.full((capacity, len(FEATURE_COLUMNS)), np.nan, dtype=np.float64)
+        alive = np.zeros(capacity, dtype=bool)
+        if self._ids is not None:
+            ids[:self._n] = self._ids[:self._n]
+            X[:self._n] = self._X[:self._n]
+            alive[:self._n] = self._alive[:self._n]
+        self._ids, self._X, self._alive = ids, X, alive
+
+    def _find(self, student_id: int):
+        """Row index of `student_id` (alive or not), or None."""
+        import numpy as np
+
+        if self._ids is None:
+            return None
+        i = int(np.searchsorted(self._ids[:self._n], student_id))
+        if i < self._n and self._ids[i] == student_id:
+            return i
+        return None
+
+    def _compact(self):
+        keep = self._alive[:self._n]
+        n = int(keep.sum())
+        self._ids[:n] = self._ids[:self._n][keep]
+        self._X[:n] = self._X[:self._n][keep]
+        self._alive[:n] = True
+        self._alive[n:self._n] = False
+        self._n, self._dead = n, 0
+
+    # ---------- incremental updates ----------
+
+    def on_student_write(self, op: str, student_id: int, before, after):
+        """student_model write listener."""
+        with self._lock:
+            if after is None:
+                self._delete(student_id)
+            else:
+                self._upsert(student_id, _feature_values(after))
+            self._generation += 1
+
+    def _upsert(self, student_id: int, values: list):
+        import numpy as np
+
+        i = self._find(student_id)
+        if i is None:
+            if self._ids is None or self._n == len(self._ids):
+                self._allocate(max(_INITIAL_CAPACITY, 2 * self._n))
+            i = int(np.searchsorted(self._ids[:self._n], student_id))
+            if i < self._n:
+                # Out-of-order id: shift the tail up one row
+                self._ids[i + 1:self._n + 1] = self._ids[i:self._n].copy()
+                self._X[i + 1:self._n + 1] = self._X[i:self._n].copy()
+                self._alive[i + 1:self._n + 1] = self._alive[i:self._n].copy()
+            self._ids[i] = student_id
+            self._n += 1
+        elif not self._alive[i]:
+            self._dead -= 1
+        self._X[i] = values
+        self._alive[i] = True
+
+    def _delete(self, student_id: int):
+        i = self._find(student_id)
+        if i is None or not self._alive[i]:
+            return
+        self._alive[i] = False
+        self._dead += 1
+        if self._dead > max(64, self._n // 4):
+            self._compact()
+
+    # ---------- reconciliation ----------
+
+    def reload(self, attempts: int = 3, batch_size: int = 5000) -> bool:
+        """Rebuild from MySQL. Returns True once a consistent snapshot is applied."""
+        import numpy as np
+
+        sql = f"SELECT id, {', '.join(FEATURE_FIELDS)} FROM students ORDER BY id"
+        for _ in range(attempts):
+            with self._lock:
+                generation = self._generation
+            blocks, batch = [], []
+            for row in stream_query(sql, batch_size=batch_size, name="students.features_stream",
+                                    dictionary=False):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    blocks.append(np.array(batch, dtype=np.float64))
+                    batch = []
+            if batch:
+                blocks.append(np.array(batch, dtype=np.float64))
+            table = np.vstack(blocks) if blocks else np.empty((0, len(FEATURE_FIELDS) + 1))
+            with self._lock:
+                if generation != self._generation:
+                    continue  # a write landed mid-scan; take a fresh snapshot
+                n = len(table)
+                self._ids = None
+                self._n, self._dead = 0, 0
+                self._allocate(max(_INITIAL_CAPACITY, n + n // 4))
+                self._ids[:n] = table[:, 0].astype(np.int64)
+                self._X[:n] = table[:, 1:]
+                self._alive[:n] = True
+                self._n = n
+                self.loaded = True
+                self.last_loaded_at = time.time()
+                return True
+        return False
+
+    # ---------- reads ----------
+
+    def snapshot(self, complete_only: bool = True) -> tuple:
+        """(ids, X) copies of every live student, or only those with all eight features."""
+        import numpy as np
+
+        with self._lock:
+            if self._ids is None:
+                return np.empty(0, dtype=np.int64), np.empty((0, len(FEATURE_COLUMNS)))
+            mask = self._alive[:self._n].copy()
+            X = self._X[:self._n]
+            if complete_only:
+                mask &= ~np.isnan(X).any(axis=1)
+            return self._ids[:self._n][mask], X[mask]
+
+    def rows_of(self, student_ids) -> tuple:
+        """(ids, X) copies for the live students among `student_ids`, in id order."""
+        import numpy as np
+
+        requested = np.unique(np.asarray(list(student_ids), dtype=np.int64))
+        with self._lock:
+            if self._ids is None or self._n == 0 or len(requested) == 0:
+                return np.empty(0, dtype=np.int64), np.empty((0, len(FEATURE_COLUMNS)))
+            ids = self._ids[:self._n]
+            pos = np.minimum(np.searchsorted(ids, requested), self._n - 1)
+            hit = (ids[pos] == requested) & self._alive[:self._n][pos]
+            return requested[hit], self._X[pos[hit]]
+
+    def features_of(self, student_id: int):
+        """One student's feature row (NaN where NULL), or None if unknown."""
+        with self._lock:
+            i = self._find(student_id)
+            if i is None or not self._alive[i]:
+                return None
+            return self._X[i].copy()
+
+    def stats(self) -> dict:
+        with self._lock:
+            capacity = 0 if self._ids is None else len(self._ids)
+            nbytes = 0 if self._ids is None else self._ids.nbytes + self._X.nbytes + self._alive.nbytes
+            return {
+                "loaded": self.loaded,
+                "last_loaded_at": self.last_loaded_at,
+                "students": self._n - self._dead,
+                "deleted_pending_compaction": self._dead,
+                "capacity": capacity,
+                "memory_bytes": nbytes,
+            }
+
+
+def summary(X) -> dict:
+    """count/mean/std/min/quartiles/max of each feature over the rows of X, ignoring NaNs."""
+    import numpy as np
+
+    result = {}
+    for j, feature in enumerate(FEATURE_COLUMNS):
+        col = X[:, j]
+        col = col[~np.isnan(col)]
+        if len(col) == 0:
+            result[feature] = {"count": 0}
+            continue
+        p25, p50, p75 = np.percentile(col, [25, 50, 75])
+        result[feature] = {
+            "count": int(len(col)),
+            "mean": round(float(col.mean()), 4),
+            "std": round(float(col.std()), 4),
+            "min": float(col.min()),
+            "p25": round(float(p25), 4),
+            "median": round(float(p50), 4),
+            "p75": round(float(p75), 4),
+            "max": float(col.max()),
+        }
+    return result
+
+
+def filter_mask(X, min_cgpa=None, max_cgpa=None, min_iq=None, max_iq=None, internship_experience=None):
+    """Rows matching the same filters as student_model.get_students_matching()."""
+    import numpy as np
+
+    cgpa = X[:, FEATURE_COLUMNS.index("CGPA")]
+    iq = X[:, FEATURE_COLUMNS.index("IQ")]
+    internship = X[:, FEATURE_COLUMNS.index("Internship_Experience_Yes")]
+    mask = np.ones(len(X), dtype=bool)
+    if min_cgpa is not None:
+        mask &= cgpa >= min_cgpa
+    if max_cgpa is not None:
+        mask &= cgpa <= max_cgpa
+    if min_iq is not None:
+        mask &= iq >= min_iq
+    if max_iq is not None:
+        mask &= iq <= max_iq
+    if internship_experience is not None:
+        mask &= internship == (1.0 if internship_experience else 0.0)
+    return mask
+
+
+def missing_fields(values) -> list:
+    """Like ml.features.missing_fields(), for a feature row with NaN where NULL."""
+    import numpy as np
+
+    nan = np.isnan(values)
+    return [f for f in REQUIRED_FIELDS if nan[FEATURE_FIELDS.index(f)]]
+
+
+def _feature_values(row: dict) -> list:
+    """A student row's features in FEATURE_COLUMNS order, NaN for NULLs."""
+    return [float("nan") if row.get(f) is None else float(row[f]) for f in FEATURE_FIELDS]
+
+
+store = FeatureStore()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    store.on_student_write(op, student_id, before, after)
@@ -0,0 +1,247 @@
+# src/services/live_feed.py
+"""
+Live dashboard feed, pushed to admins over Server-Sent Events.
+
+Write listeners (students, predictions, rescoring) only mark the feed dirty.
+A single background task waits LIVE_FEED_DEBOUNCE_SECONDS so a burst of
+writes collapses into one update, computes one snapshot of the dashboard from
+the in-memory stores, and sends every subscriber just the sections that
+changed. The work per change is the same for one watching admin as for fifty,
+and nobody polls.
+
+Each stream starts with a full "snapshot" event, followed by "delta" events
+holding only the changed sections. A subscriber that falls LIVE_FEED_QUEUE_SIZE
+events behind is disconnected rather than buffered without limit; EventSource
+reconnects on its own and starts again from a fresh snapshot.
+"""
+import asyncio
+import json
+import os
+import time
+
+from fastapi.concurrency import run_in_threadpool
+
+from db.connection import connection, timed_execute
+
+LIVE_FEED_DEBOUNCE_SECONDS = float(os.getenv("LIVE_FEED_DEBOUNCE_SECONDS", "0.5"))
+LIVE_FEED_HEARTBEAT_SECONDS = float(os.getenv("LIVE_FEED_HEARTBEAT_SECONDS", "15"))
+LIVE_FEED_QUEUE_SIZE = int(os.getenv("LIVE_FEED_QUEUE_SIZE", "16"))
+TOP_PERFORMERS = 5
+
+# Sent in place of an event to end a subscriber's stream
+_CLOSE = None
+
+
+class LiveFeed:
+    def __init__(self):
+        self._loop = None
+        self._dirty = None
+        self._subscribers = set()
+        self._snapshot = None
+        self._seq = 0
+        self.computed = 0          # snapshots computed
+        self.dropped = 0           # subscribers disconnected for falling behind
+        self.last_computed_at = None
+
+    # ---------- change notification ----------
+
+    def notify(self):
+        """Mark the dashboard stale. Safe to call from any thread."""
+        loop, dirty = self._loop, self._dirty
+        if loop is None or loop.is_closed():
+            return  # not running (scripts, tests); nothing to push to
+        try:
+            loop.call_soon_threadsafe(dirty.set)
+        except RuntimeError:
+            pass  # loop shut down between the check and the call
+
+    # ---------- subscribers ----------
+
+    def subscribe(self) -> asyncio.Queue:
+        """A queue of SSE-encoded events, starting with the current snapshot. Call on the event loop."""
+        queue = asyncio.Queue(maxsize=LIVE_FEED_QUEUE_SIZE)
+        if self._snapshot is not None:
+            queue.put_nowait(self._event("snapshot", self._snapshot))
+        elif self._dirty is not None:
+            self._dirty.set()  # nothing computed yet; the first broadcast is a snapshot
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def _send(self, queue: asyncio.Queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow to keep up: end its stream so the client reconnects
+            self._subscribers.discard(queue)
+            self.dropped += 1
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_CLOSE)
+
+    def close(self):
+        """End every open stream (shutdown)."""
+        for queue in list(self._subscribers):
+            self._subscribers.discard(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_CLOSE)
+
+    # ---------- computation ----------
+
+    def _event(self, kind: str, data: dict) -> str:
+        self._seq += 1
+        return f"id: {self._seq}\nevent: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    def _broadcast(self, snapshot: dict):
+        previous = self._snapshot
+        self._snapshot = snapshot
+        if previous is None:
+            event = self._event("snapshot", snapshot)
+        else:
+            delta = {k: v for k, v in snapshot.items() if previous.get(k) != v}
+            if not delta:
+                return
+            event = self._event("delta", delta)
+        for queue in list(self._subscribers):
+            self._send(queue, event)
+
+    async def run(self):
+        """Background task: debounce change notifications, compute once, fan out."""
+        self._loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        while True:
+            await self._dirty.wait()
+            # Changes arriving during the wait are folded into this update
+            await asyncio.sleep(LIVE_FEED_DEBOUNCE_SECONDS)
+            self._dirty.clear()
+            if not self._subscribers:
+                # Nobody is watching; the next subscriber triggers a fresh snapshot
+                self._snapshot = None
+                continue
+            try:
+                snapshot = await run_in_threadpool(compute_snapshot)
+            except Exception as e:
+                print(f"❌ Live feed update failed: {e}")
+                continue
+            self.computed += 1
+            self.last_computed_at = time.time()
+            self._broadcast(snapshot)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._loop is not None,
+            "subscribers": len(self._subscribers),
+            "snapshots_computed": self.computed,
+            "subscribers_dropped": self.dropped,
+            "last_computed_at": self.last_computed_at,
+        }
+
+
+def compute_snapshot() -> dict:
+    """Summary, top performers and counts, read from the in-memory stores when loaded."""
+    from services.aggregates import store as aggregate_store
+    from services.feature_store import store as feature_store
+    from services.rankings import store as ranking_store
+
+    if aggregate_store.loaded:
+        summary = aggregate_store.summary()
+        predictions = {
+            "total": aggregate_store.predictions_total,
+            "placed": aggregate_store.predictions_placed,
+        }
+    else:
+        summary, predictions = _query_summary()
+
+    if ranking_store.loaded:
+        top = ranking_store.top("cgpa", TOP_PERFORMERS)["students"]
+        top_performers = [{"id": s["student_id"], "name": s["name"], "CGPA": s["cgpa"]} for s in top]
+    else:
+        top_performers = _query_top_performers()
+
+    if feature_store.loaded:
+        students = feature_store.stats()["students"]
+    else:
+        students = _query_student_count()
+
+    return {
+        "summary": summary,
+        "top_performers": top_performers,
+        "counts": {
+            "students": students,
+            "predictions": predictions["total"],
+            "placed": predictions["placed"],
+        },
+    }
+
+
+# ---------- SQL fallbacks until the in-memory stores are loaded ----------
+
+def _query_summary():
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            averages = timed_execute(
+                cur, "live_feed.averages",
+                "SELECT AVG(cgpa) AS avg_cgpa, AVG(iq) AS avg_iq FROM students", fetch="one",
+            )
+            try:
+                placement = timed_execute(
+                    cur, "live_feed.placement",
+                    "SELECT COUNT(*) AS total, "
+                    "SUM(CASE WHEN predicted_status='Yes' THEN 1 ELSE 0 END) AS placed "
+                    "FROM predictions",
+                    fetch="one",
+                )
+            except Exception:
+                # predictions table doesn't exist yet
+                placement = None
+        finally:
+            cur.close()
+    total = int((placement or {}).get("total") or 0)
+    placed = int((placement or {}).get("placed") or 0)
+    summary = {
+        "average_cgpa": round(float(averages["avg_cgpa"]), 2) if averages and averages["avg_cgpa"] else 0,
+        "average_iq": round(float(averages["avg_iq"]), 2) if averages and averages["avg_iq"] else 0,
+        "placement_rate": round(placed / total * 100, 2) if total else 0,
+    }
+    return summary, {"total": total, "placed": placed}
+
+
+def _query_top_performers() -> list:
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            rows = timed_execute(
+                cur, "live_feed.top_performers",
+                "SELECT id, name, cgpa FROM students WHERE cgpa IS NOT NULL ORDER BY cgpa DESC LIMIT %s",
+                (TOP_PERFORMERS,), fetch="all",
+            )
+        finally:
+            cur.close()
+    return [{"id": r["id"], "name": r["name"], "CGPA": float(r["cgpa"])} for r in rows]
+
+
+def _query_student_count() -> int:
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            row = timed_execute(cur, "live_feed.students", "SELECT COUNT(*) AS n FROM students", fetch="one")
+        finally:
+            cur.close()
+    return int(row["n"])
+
+
+feed = LiveFeed()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    """student_model write listener."""
+    feed.notify()
+
+
+def on_predictions_written(rows: list):
+    """prediction_writer listener."""
+    feed.notify()
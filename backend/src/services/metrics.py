@@ -0,0 +1,86 @@
+# src/services/metrics.py
+"""
+HTTP request metrics and the Prometheus exposition behind GET /metrics.
+
+MetricsMiddleware records latency, in-flight requests and status codes per
+route template (e.g. /admin/students/{student_id}), so the label set stays
+bounded no matter which ids are requested. Query, model and bcrypt timings are
+registered next to the code they measure (db.connection, ml.predictor,
+auth.hashing) and end up in the same default registry.
+"""
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from starlette.routing import Match
+
+from db.async_connection import async_pool_stats
+from db.connection import pool_stats
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status", ["method", "route", "status"]
+)
+HTTP_SECONDS = Histogram(
+    "http_request_duration_seconds", "Time until the response body was fully sent", ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests currently being handled", ["method", "route"]
+)
+POOL_CONNECTIONS = Gauge("db_pool_connections", "Connection pool state at scrape time", ["pool", "state"])
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(scope) -> str:
+    app = scope.get("app")
+    routes = getattr(getattr(app, "router", None), "routes", ())
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streamed responses are timed until their last chunk."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = _route_template(scope)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        in_progress = HTTP_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_SECONDS.labels(method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route, str(status["code"])).inc()
+            in_progress.dec()
+
+
+def render():
+    """Return (body, content_type) for the /metrics response."""
+    try:
+        stats = pool_stats()
+        for state in ("open", "idle", "checked_out", "waiting"):
+            POOL_CONNECTIONS.labels("sync", state).set(stats[state])
+        stats = async_pool_stats()
+        for state in ("open", "idle", "checked_out"):
+            POOL_CONNECTIONS.labels("async", state).set(stats[state])
+    except Exception as e:
+        print(f"⚠️  Could not read pool stats for metrics: {e}")
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,232 @@
+# src/services/prediction_writer.py
+"""
+Write-behind persistence of predictions.
+
+Request handlers call enqueue(), which only appends to an in-memory queue. A
+background thread drains the queue into `predictions` with multi-row INSERTs,
+flushing once PREDICTION_FLUSH_SIZE rows are waiting or PREDICTION_FLUSH_INTERVAL
+seconds have passed. When the queue is full, new rows are dropped and counted
+rather than slowing down the request.
+
+Connection trouble, lock waits and deadlocks retry the whole batch. A bad row
+(e.g. its student was deleted after the prediction was queued) fails the
+multi-row INSERT, so the batch is then written row by row and only the rows
+that fail are dropped.
+"""
+import os
+import queue
+import threading
+import time
+
+from mysql.connector import errors as mysql_errors
+
+from db.connection import connection, timed_execute, timed_executemany
+from db.pool import PoolTimeout
+
+PREDICTION_QUEUE_MAX = int(os.getenv("PREDICTION_QUEUE_MAX", "10000"))
+PREDICTION_FLUSH_SIZE = int(os.getenv("PREDICTION_FLUSH_SIZE", "200"))
+PREDICTION_FLUSH_INTERVAL = float(os.getenv("PREDICTION_FLUSH_INTERVAL", "1.0"))
+PREDICTION_FLUSH_RETRIES = 3
+
+INSERT_PREDICTION_SQL = """
+    INSERT INTO predictions
+    (student_id, IQ, Prev_Sem_Result, CGPA, Academic_Performance, Extra_Curricular_Score,
+     Communication_Skills, Projects_Completed, Internship_Experience_Yes, predicted_status)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    """
+
+
+# Lock wait timeout, deadlock, server gone away, lost connection
+_TRANSIENT_ERRNOS = {1205, 1213, 2006, 2013, 2055}
+# Incorrect value for a column (reported as a plain DatabaseError)
+_ROW_ERRNOS = {1366}
+
+
+def _is_transient(e: Exception) -> bool:
+    """A connection or server problem: the same batch may well succeed on a retry."""
+    if isinstance(e, (PoolTimeout, mysql_errors.OperationalError, mysql_errors.InterfaceError)):
+        return True
+    return getattr(e, "errno", None) in _TRANSIENT_ERRNOS
+
+
+def _is_row_error(e: Exception) -> bool:
+    """A problem with the values in some row (foreign key, duplicate, bad data)."""
+    if isinstance(e, (mysql_errors.IntegrityError, mysql_errors.DataError)):
+        return True
+    return getattr(e, "errno", None) in _ROW_ERRNOS
+
+
+def _row_params(row: dict):
+    f = row["features"]
+    return (
+        row["student_id"], f["IQ"], f["Prev_Sem_Result"], f["CGPA"], f["Academic_Performance"],
+        f["Extra_Curricular_Score"], f["Communication_Skills"], f["Projects_Completed"],
+        f["Internship_Experience_Yes"], row["predicted_status"],
+    )
+
+
+class PredictionWriter:
+    def __init__(
+        self,
+        max_queue: int = PREDICTION_QUEUE_MAX,
+        flush_size: int = PREDICTION_FLUSH_SIZE,
+        flush_interval: float = PREDICTION_FLUSH_INTERVAL,
+    ):
+        self._queue = queue.Queue(maxsize=max_queue)
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._thread = None
+        # Called as listener(rows) after each committed flush
+        self._listeners = []
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+        self.last_flush_at = None
+
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    # ---------- producer side ----------
+
+    def enqueue(self, student_id, features: dict, predicted_status: str) -> bool:
+        """Queue one prediction for persistence. Never blocks; returns False if dropped."""
+        try:
+            self._queue.put_nowait({
+                "student_id": student_id,
+                "features": features,
+                "predicted_status": predicted_status,
+            })
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.enqueued += 1
+        return True
+
+    # ---------- consumer side ----------
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="prediction-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Flush everything still queued and stop the background thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                batch.append(self._queue.get(timeout=min(timeout, 0.25)))
+            except queue.Empty:
+                pass
+            stopping = self._stop.is_set()
+            if len(batch) >= self.flush_size or time.monotonic() >= deadline or stopping:
+                if stopping:
+                    # Drain whatever is left before exiting
+                    while True:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                for i in range(0, len(batch), self.flush_size):
+                    self._flush(batch[i:i + self.flush_size])
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+                if stopping:
+                    return
+
+    def _insert_batch(self, rows: list):
+        with connection() as conn:
+            cur = conn.cursor()
+            try:
+                timed_executemany(
+                    cur, "predictions.insert_bulk", INSERT_PREDICTION_SQL,
+                    [_row_params(r) for r in rows],
+                )
+                conn.commit()
+            finally:
+                cur.close()
+
+    def _insert_each(self, rows: list) -> list:
+        """Insert rows one transaction each after a bad row failed the batch; returns those written."""
+        written, handled = [], 0
+        try:
+            with connection() as conn:
+                cur = conn.cursor()
+                try:
+                    for row in rows:
+                        try:
+                            timed_execute(cur, "predictions.insert_one", INSERT_PREDICTION_SQL, _row_params(row))
+                            conn.commit()
+                        except Exception as e:
+                            if not _is_row_error(e):
+                                raise
+                            conn.rollback()
+                            print(f"⚠️  Dropping prediction for student {row['student_id']}: {e}")
+                            self.dropped += 1
+                        else:
+                            written.append(row)
+                        handled += 1
+                finally:
+                    cur.close()
+        except Exception as e:
+            lost = len(rows) - handled
+            print(f"❌ Dropping {lost} predictions after a failed write: {e}")
+            self.failed_batches += 1
+            self.dropped += lost
+        return written
+
+    def _flush(self, rows: list):
+        if not rows:
+            return
+        for attempt in range(1, PREDICTION_FLUSH_RETRIES + 1):
+            try:
+                self._insert_batch(rows)
+                written = rows
+                break
+            except Exception as e:
+                if _is_row_error(e):
+                    written = self._insert_each(rows)
+                    break
+                if not _is_transient(e) or attempt == PREDICTION_FLUSH_RETRIES:
+                    print(f"❌ Dropping {len(rows)} predictions after {attempt} failed writes: {e}")
+                    self.failed_batches += 1
+                    self.dropped += len(rows)
+                    return
+                time.sleep(0.2 * attempt)
+        if not written:
+            return
+        self.written += len(written)
+        self.last_flush_at = time.time()
+        for listener in self._listeners:
+            try:
+                listener(written)
+            except Exception as e:
+                print(f"❌ Prediction write listener failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_max": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches,
+            "last_flush_at": self.last_flush_at,
+            "running": bool(self._thread and self._thread.is_alive()),
+        }
+
+
+prediction_writer = PredictionWriter()
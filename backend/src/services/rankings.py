@@ -0,0 +1,178 @@
+# src/services/rankings.py
+"""
+In-memory rank and percentile index over student metrics.
+
+Each ranked metric keeps a sorted list of (-value, student_id) keys, so rank 1
+is the highest value and ties are broken by the lower id. Rank, percentile
+and the start of a rank range are found with bisect in O(log n); inserts and
+deletes shift the list, which is a memmove and cheap at this table's size.
+Students with a NULL metric are left out of that metric's ranking.
+
+The index is loaded at startup, kept current by student_model write
+listeners, and rebuilt by reload() on the same schedule as the aggregates.
+"""
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+
+from models.student_model import iter_students
+
+RANKED_METRICS = (
+    "cgpa", "iq", "prev_sem_result", "academic_performance",
+    "communication_skills", "extra_curricular_score", "projects_completed",
+)
+
+_LOWEST_ID = float("-inf")
+_HIGHEST_ID = float("inf")
+
+
+class RankIndex:
+    """Order-statistic index for one metric. Not thread-safe; RankingStore locks around it."""
+
+    def __init__(self):
+        self._keys = []     # sorted (-value, student_id)
+        self._values = {}   # student_id -> value
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, student_id: int, value):
+        self.remove(student_id)
+        if value is None:
+            return
+        value = float(value)
+        self._values[student_id] = value
+        insort(self._keys, (-value, student_id))
+
+    def remove(self, student_id: int):
+        value = self._values.pop(student_id, None)
+        if value is None:
+            return
+        i = bisect_left(self._keys, (-value, student_id))
+        del self._keys[i]
+
+    def value_of(self, student_id: int):
+        return self._values.get(student_id)
+
+    def slice(self, offset: int, limit: int) -> list:
+        """[(position, student_id, value)] for positions offset+1 .. offset+limit."""
+        return [
+            (offset + i + 1, student_id, -neg)
+            for i, (neg, student_id) in enumerate(self._keys[offset:offset + limit])
+        ]
+
+    def count_above(self, value: float) -> int:
+        return bisect_left(self._keys, (-value, _LOWEST_ID))
+
+    def count_at_or_above(self, value: float) -> int:
+        return bisect_right(self._keys, (-value, _HIGHEST_ID))
+
+    def rank(self, value: float) -> int:
+        """Competition rank ("1224"): one more than the number of strictly higher values."""
+        return self.count_above(value) + 1
+
+    def percentile(self, value: float) -> float:
+        """Percentage of students below `value`, counting ties as half below."""
+        n = len(self._keys)
+        if n == 0:
+            return 0.0
+        above = self.count_above(value)
+        equal = self.count_at_or_above(value) - above
+        below = n - above - equal
+        return round((below + 0.5 * equal) / n * 100, 2)
+
+
+class RankingStore:
+    def __init__(self, metrics=RANKED_METRICS):
+        self._lock = threading.Lock()
+        self.metrics = tuple(metrics)
+        self._indexes = {m: RankIndex() for m in self.metrics}
+        self._names = {}
+        self.loaded = False
+        self.last_loaded_at = None
+        # Bumped on every incremental change; reload() uses it to detect
+        # writes that raced with its scan
+        self._generation = 0
+
+    def on_student_write(self, op: str, student_id: int, before, after):
+        """student_model write listener."""
+        with self._lock:
+            if after is None:
+                for index in self._indexes.values():
+                    index.remove(student_id)
+                self._names.pop(student_id, None)
+            else:
+                for metric, index in self._indexes.items():
+                    index.set(student_id, after.get(metric))
+                self._names[student_id] = after.get("name")
+            self._generation += 1
+
+    def reload(self, attempts: int = 3) -> bool:
+        """Rebuild every index from MySQL. Returns True once a consistent snapshot is applied."""
+        for _ in range(attempts):
+            with self._lock:
+                generation = self._generation
+            indexes = {m: RankIndex() for m in self.metrics}
+            names = {}
+            for row in iter_students(("name",) + self.metrics, batch_size=2000):
+                for metric, index in indexes.items():
+                    index.set(row["id"], row[metric])
+                names[row["id"]] = row["name"]
+            with self._lock:
+                if generation != self._generation:
+                    continue  # a write landed mid-scan; take a fresh snapshot
+                self._indexes = indexes
+                self._names = names
+                self.loaded = True
+                self.last_loaded_at = time.time()
+                return True
+        return False
+
+    # ---------- reads ----------
+
+    def _entry(self, metric: str, position: int, student_id: int, value: float) -> dict:
+        return {"rank": position, "student_id": student_id, "name": self._names.get(student_id), metric: value}
+
+    def top(self, metric: str, limit: int, offset: int = 0) -> dict:
+        """Students at rank positions offset+1 .. offset+limit, highest value first."""
+        with self._lock:
+            index = self._indexes[metric]
+            rows = [self._entry(metric, *item) for item in index.slice(offset, limit)]
+            total = len(index)
+        return {"metric": metric, "total": total, "offset": offset, "students": rows}
+
+    def student(self, metric: str, student_id: int):
+        """Rank and percentile of one student, or None if not ranked on `metric`."""
+        with self._lock:
+            index = self._indexes[metric]
+            value = index.value_of(student_id)
+            if value is None:
+                return None
+            return {
+                "metric": metric,
+                "student_id": student_id,
+                "name": self._names.get(student_id),
+                "value": value,
+                "rank": index.rank(value),
+                "percentile": index.percentile(value),
+                "total": len(index),
+            }
+
+    def percentile_of(self, metric: str, value: float) -> dict:
+        """Where an arbitrary value would fall in the current ranking."""
+        with self._lock:
+            index = self._indexes[metric]
+            return {
+                "metric": metric,
+                "value": value,
+                "rank": index.rank(value),
+                "percentile": index.percentile(value),
+                "total": len(index),
+            }
+
+
+store = RankingStore()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    store.on_student_write(op, student_id, before, after)
@@ -0,0 +1,398 @@
+# src/services/rescore.py
+"""
+Resumable re-scoring of every student (tables from migrations/0005_rescore_jobs.sql).
+
+A job covers the students that existed when it was created (id <= max_student_id)
+and walks them in id order: each chunk is one keyset query
+(WHERE id > checkpoint ORDER BY id LIMIT chunk_size) read through a server-side
+cursor. Up to `concurrency` chunks are scored at once, but they are written in
+order. Each chunk's predictions are upserted in the same transaction that
+advances `last_student_id`, so after a crash or a cancel the job resumes from
+the last committed chunk without scoring anyone twice. `rate_limit` caps
+students per second (0 = unlimited).
+
+Predictions carry the job id in `run_id`; the unique (student_id, run_id) key
+turns a repeated write into an update.
+
+A process runs at most one job. A job whose row says "running" is treated as
+owned by another process until it has gone RESCORE_LEASE_SECONDS without a
+checkpoint; after that it can be resumed here. Each claim writes a fresh
+`owner` token (migrations/0006_rescore_job_owner.sql), and checkpoints and the
+final status only apply while the row still names it, so a run that stalled
+past its lease and was taken over stops instead of double-counting.
+"""
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from db.connection import connection, timed_execute, timed_executemany
+from ml import predictor
+from ml.features import build_features, build_matrix, missing_fields
+from models.student_model import PREDICTION_COLUMNS, stream_query
+
+RESCORE_CHUNK_SIZE = int(os.getenv("RESCORE_CHUNK_SIZE", "1000"))
+RESCORE_CONCURRENCY = int(os.getenv("RESCORE_CONCURRENCY", "2"))
+RESCORE_RATE_LIMIT = float(os.getenv("RESCORE_RATE_LIMIT", "0"))
+RESCORE_LEASE_SECONDS = int(os.getenv("RESCORE_LEASE_SECONDS", "600"))
+
+FINISHED = ("completed",)
+
+JOB_COLUMNS = (
+    "id, status, model_version, chunk_size, concurrency, rate_limit, max_student_id, total, "
+    "last_student_id, scored, skipped, error, created_at, started_at, finished_at, updated_at"
+)
+
+CHUNK_SQL = (
+    f"SELECT {PREDICTION_COLUMNS} FROM students "
+    "WHERE id > %s AND id <= %s ORDER BY id LIMIT %s"
+)
+
+UPSERT_PREDICTION_SQL = """
+    INSERT INTO predictions
+    (student_id, IQ, Prev_Sem_Result, CGPA, Academic_Performance, Extra_Curricular_Score,
+     Communication_Skills, Projects_Completed, Internship_Experience_Yes, predicted_status, run_id)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE
+        IQ = VALUES(IQ), Prev_Sem_Result = VALUES(Prev_Sem_Result), CGPA = VALUES(CGPA),
+        Academic_Performance = VALUES(Academic_Performance),
+        Extra_Curricular_Score = VALUES(Extra_Curricular_Score),
+        Communication_Skills = VALUES(Communication_Skills),
+        Projects_Completed = VALUES(Projects_Completed),
+        Internship_Experience_Yes = VALUES(Internship_Experience_Yes),
+        predicted_status = VALUES(predicted_status), created_at = CURRENT_TIMESTAMP
+    """
+
+
+class JobNotFound(Exception):
+    pass
+
+
+class JobBusy(Exception):
+    """The job (or another job) is already running."""
+
+
+class JobFinished(Exception):
+    pass
+
+
+class LeaseLost(Exception):
+    """Another process claimed the job after this run's lease expired."""
+
+
+# ---------- job rows ----------
+
+def create_job(chunk_size=None, concurrency=None, rate_limit=None) -> int:
+    """Record a pending job over every current student and return its id."""
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            total, max_id = timed_execute(
+                cur, "students.rescore_extent", "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM students",
+                fetch="one",
+            )
+            timed_execute(
+                cur, "rescore_jobs.insert",
+                "INSERT INTO rescore_jobs (status, chunk_size, concurrency, rate_limit, max_student_id, total) "
+                "VALUES ('pending', %s, %s, %s, %s, %s)",
+                (
+                    max(1, chunk_size or RESCORE_CHUNK_SIZE),
+                    max(1, concurrency or RESCORE_CONCURRENCY),
+                    max(0.0, RESCORE_RATE_LIMIT if rate_limit is None else rate_limit),
+                    max_id, total,
+                ),
+            )
+            conn.commit()
+            return cur.lastrowid
+        finally:
+            cur.close()
+
+
+def get_job(job_id: int):
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            return timed_execute(
+                cur, "rescore_jobs.get", f"SELECT {JOB_COLUMNS} FROM rescore_jobs WHERE id = %s",
+                (job_id,), fetch="one",
+            )
+        finally:
+            cur.close()
+
+
+def list_jobs(limit: int = 20) -> list:
+    with connection() as conn:
+        cur = conn.cursor(dictionary=True)
+        try:
+            return timed_execute(
+                cur, "rescore_jobs.list", f"SELECT {JOB_COLUMNS} FROM rescore_jobs ORDER BY id DESC LIMIT %s",
+                (limit,), fetch="all",
+            )
+        finally:
+            cur.close()
+
+
+def latest_unfinished_job():
+    """Id of the newest job that has not completed, or None."""
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            row = timed_execute(
+                cur, "rescore_jobs.latest_unfinished",
+                "SELECT id FROM rescore_jobs WHERE status <> 'completed' ORDER BY id DESC LIMIT 1",
+                fetch="one",
+            )
+            return row[0] if row else None
+        finally:
+            cur.close()
+
+
+def _claim(job_id: int, model_version: str) -> str:
+    """Mark the job running here and return this run's owner token. Raises JobNotFound, JobFinished or JobBusy."""
+    owner = uuid.uuid4().hex
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            timed_execute(
+                cur, "rescore_jobs.claim",
+                "UPDATE rescore_jobs SET status = 'running', owner = %s, model_version = %s, error = NULL, "
+                "started_at = COALESCE(started_at, CURRENT_TIMESTAMP) "
+                "WHERE id = %s AND status <> 'completed' "
+                "AND (status <> 'running' OR updated_at < NOW() - INTERVAL %s SECOND)",
+                (owner, model_version, job_id, RESCORE_LEASE_SECONDS),
+            )
+            claimed = cur.rowcount > 0
+            conn.commit()
+        finally:
+            cur.close()
+    if claimed:
+        return owner
+    job = get_job(job_id)
+    if job is None:
+        raise JobNotFound(job_id)
+    if job["status"] in FINISHED:
+        raise JobFinished(job_id)
+    raise JobBusy(f"Job {job_id} is running in another process")
+
+
+def _finish(job_id: int, owner: str, status: str, error=None):
+    """Record the run's final status, unless another process has taken the job over."""
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            timed_execute(
+                cur, "rescore_jobs.finish",
+                "UPDATE rescore_jobs SET status = %s, error = %s, finished_at = "
+                "IF(%s = 'completed', CURRENT_TIMESTAMP, finished_at) "
+                "WHERE id = %s AND status = 'running' AND owner = %s",
+                (status, error, status, job_id, owner),
+            )
+            conn.commit()
+        finally:
+            cur.close()
+
+
+# ---------- chunks ----------
+
+def _chunks(after_id: int, max_id: int, size: int):
+    """Keyset-ordered chunks of students with ids in (after_id, max_id]."""
+    while True:
+        rows = list(stream_query(CHUNK_SQL, (after_id, max_id, size), batch_size=size,
+                                 name="students.rescore_chunk"))
+        if not rows:
+            return
+        yield rows
+        after_id = rows[-1]["id"]
+        if len(rows) < size:
+            return
+
+
+def _score(students: list) -> tuple:
+    """(predictions, skipped count, last id) for one chunk."""
+    complete = [s for s in students if not missing_fields(s)]
+    labels = predictor.predict_students_matrix(build_matrix(complete), [s["id"] for s in complete])
+    rows = [
+        {"student_id": s["id"], "features": build_features(s), "predicted_status": label}
+        for s, label in zip(complete, labels)
+    ]
+    return rows, len(students) - len(complete), students[-1]["id"]
+
+
+def _commit_chunk(job_id: int, owner: str, rows: list, skipped: int, last_id: int):
+    """
+    Upsert a chunk's predictions and advance the checkpoint in one transaction.
+    Raises LeaseLost, writing nothing, if the job is no longer running under `owner`.
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        try:
+            if rows:
+                timed_executemany(cur, "predictions.rescore_upsert", UPSERT_PREDICTION_SQL, [
+                    (
+                        r["student_id"], *(r["features"][c] for c in (
+                            "IQ", "Prev_Sem_Result", "CGPA", "Academic_Performance",
+                            "Extra_Curricular_Score", "Communication_Skills",
+                            "Projects_Completed", "Internship_Experience_Yes",
+                        )),
+                        r["predicted_status"], job_id,
+                    )
+                    for r in rows
+                ])
+            # last_student_id always advances, so a matched row is a changed row
+            timed_execute(
+                cur, "rescore_jobs.checkpoint",
+                "UPDATE rescore_jobs SET last_student_id = %s, scored = scored + %s, skipped = skipped + %s "
+                "WHERE id = %s AND status = 'running' AND owner = %s",
+                (last_id, len(rows), skipped, job_id, owner),
+            )
+            if cur.rowcount == 0:
+                raise LeaseLost(job_id)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+
+# ---------- runner ----------
+
+class RescoreRunner:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stop_status = "cancelled"
+        # Called as listener(rows) after each committed chunk, like prediction_writer's
+        self._listeners = []
+        self.job_id = None
+        self.started_at = None
+        self.scored = 0
+
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def active(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self, job_id: int):
+        """Run `job_id` on a background thread. Raises JobBusy, JobNotFound or JobFinished."""
+        with self._lock:
+            if self.active():
+                raise JobBusy(f"Job {self.job_id} is already running")
+            owner = _claim(job_id, predictor.model_version())
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run_claimed, args=(job_id, owner), name=f"rescore-{job_id}", daemon=True
+            )
+            self.job_id = job_id
+            self._thread.start()
+
+    def run(self, job_id: int) -> str:
+        """Run `job_id` on this thread until it ends; returns its final status."""
+        with self._lock:
+            if self.active():
+                raise JobBusy(f"Job {self.job_id} is already running")
+            owner = _claim(job_id, predictor.model_version())
+            self._stop.clear()
+            self.job_id = job_id
+        return self._run_claimed(job_id, owner)
+
+    def stop(self, status: str = "cancelled", timeout: float = 30.0) -> bool:
+        """
+        Ask the running job to stop after the chunks already being scored are
+        written; it is left as `status` and can be resumed. Returns False if
+        nothing was running.
+        """
+        if not self.active():
+            return False
+        self._stop_status = status
+        self._stop.set()
+        self._thread.join(timeout)
+        return True
+
+    def _run_claimed(self, job_id: int, owner: str) -> str:
+        self.started_at = time.time()
+        self.scored = 0
+        chunks = None
+        status, error = "completed", None
+        try:
+            # Inside the try so a failure here still releases the job through _finish
+            job = {**get_job(job_id), "owner": owner}
+            chunks = _chunks(job["last_student_id"], job["max_student_id"], job["chunk_size"])
+            print(f"🔄 Rescoring job {job_id}: {job['total'] - job['scored'] - job['skipped']} students left")
+            with ThreadPoolExecutor(job["concurrency"], thread_name_prefix=f"rescore-{job_id}") as pool:
+                in_flight = deque()
+                try:
+                    for chunk in chunks:
+                        if self._stop.is_set():
+                            break
+                        in_flight.append(pool.submit(_score, chunk))
+                        if len(in_flight) >= job["concurrency"]:
+                            self._write(job, in_flight.popleft().result())
+                    # Chunks already being scored are still written, in order
+                    while in_flight:
+                        self._write(job, in_flight.popleft().result())
+                except BaseException:
+                    # Nothing after a failed chunk may be checkpointed
+                    for future in in_flight:
+                        future.cancel()
+                    raise
+            if self._stop.is_set():
+                status = self._stop_status
+        except KeyboardInterrupt:
+            status = "cancelled"
+        except LeaseLost:
+            # The other process owns the row now; leave its status alone
+            print(f"⚠️  Rescoring job {job_id} was taken over by another process; stopping.")
+            return "lost"
+        except Exception as e:
+            status, error = "failed", str(e)
+            print(f"❌ Rescoring job {job_id} failed: {e}")
+        finally:
+            if chunks is not None:
+                chunks.close()
+        _finish(job_id, owner, status, error)
+        print(f"✅ Rescoring job {job_id} {status} after {self.scored} students this run.")
+        return status
+
+    def _write(self, job: dict, scored: tuple):
+        rows, skipped, last_id = scored
+        _commit_chunk(job["id"], job["owner"], rows, skipped, last_id)
+        self.scored += len(rows) + skipped
+        for listener in self._listeners:
+            try:
+                listener(rows)
+            except Exception as e:
+                print(f"❌ Rescore listener failed: {e}")
+        if job["rate_limit"] > 0:
+            # Sleep until the average rate is back under the limit
+            ahead = self.scored / job["rate_limit"] - (time.time() - self.started_at)
+            if ahead > 0:
+                self._stop.wait(ahead)
+
+    def stats(self) -> dict:
+        if not self.active():
+            return {"running": False, "job_id": None}
+        elapsed = time.time() - self.started_at
+        return {
+            "running": True,
+            "job_id": self.job_id,
+            "processed_this_run": self.scored,
+            "students_per_second": round(self.scored / elapsed, 1) if elapsed > 0 else None,
+        }
+
+
+runner = RescoreRunner()
+
+
+def job_status(job: dict) -> dict:
+    """A job row with its progress and, if it runs in this process, live stats."""
+    done = job["scored"] + job["skipped"]
+    status = {**job, "progress": round(done / job["total"], 4) if job["total"] else 1.0}
+    if runner.active() and runner.job_id == job["id"]:
+        status["live"] = runner.stats()
+    return status
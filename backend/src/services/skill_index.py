@@ -0,0 +1,192 @@
+# src/services/skill_index.py
+"""
+Bitmap index of skill membership.
+
+Each skill is a Python int used as a bitset over student ids (bit i set means
+student i has the skill), plus one bitset of every existing student. Student
+ids are dense AUTO_INCREMENT values, so a bitset costs about one bit per id
+ever issued (12.5 KB per skill at 100k students) and needs no separate
+compression. Distribution counts are popcounts, and "all of A, B but none of
+C" queries are a few AND/ANDNOT passes over machine words instead of a join
+over student_skills.
+
+Loaded at startup and on the reconcile schedule; kept current by the
+student_model and skill_model write listeners.
+"""
+import asyncio
+import threading
+import time
+
+import models.async_skill_model as skill_model
+
+
+def _popcount(bits: int) -> int:
+    if hasattr(bits, "bit_count"):  # Python 3.10+
+        return bits.bit_count()
+    return bin(bits).count("1")
+
+
+def bits_to_ids(bits: int, offset: int = 0, limit=None) -> list:
+    """Set bit positions in ascending order, skipping `offset` and returning at most `limit`."""
+    if not bits:
+        return []
+    import numpy as np
+
+    raw = np.frombuffer(bits.to_bytes((bits.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+    ids = np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+    end = None if limit is None else offset + limit
+    return ids[offset:end].tolist()
+
+
+def ids_to_bits(ids) -> int:
+    import numpy as np
+
+    ids = np.asarray(ids, dtype=np.int64)
+    if ids.size == 0:
+        return 0
+    flags = np.zeros(int(ids.max()) + 1, dtype=np.uint8)
+    flags[ids] = 1
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+class SkillIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = {}      # skill_id -> name
+        self._bitsets = {}    # skill_id -> int
+        self._students = 0    # every existing student
+        self.loaded = False
+        self.last_loaded_at = None
+        # Bumped on every incremental change; reload() uses it to detect
+        # writes that raced with its scan
+        self._generation = 0
+
+    # ---------- incremental updates ----------
+
+    def on_student_write(self, op: str, student_id: int, before, after):
+        """student_model write listener."""
+        with self._lock:
+            if op == "insert":
+                self._students |= 1 << student_id
+            elif op == "delete" and 0 <= student_id < self._students.bit_length():
+                # student_skills rows go with the student (ON DELETE CASCADE)
+                bit = 1 << student_id
+                self._students &= ~bit
+                for skill_id, bits in self._bitsets.items():
+                    if bits & bit:
+                        self._bitsets[skill_id] = bits & ~bit
+            self._generation += 1
+
+    def on_skill_write(self, op: str, skill_id: int, payload):
+        """skill_model write listener."""
+        with self._lock:
+            if op == "skill_created":
+                self._names[skill_id] = payload
+                self._bitsets[skill_id] = 0
+            elif op == "skill_deleted":
+                self._names.pop(skill_id, None)
+                self._bitsets.pop(skill_id, None)
+            elif op == "assigned":
+                self._bitsets[skill_id] = self._bitsets.get(skill_id, 0) | ids_to_bits(payload)
+            elif op == "unassigned":
+                self._bitsets[skill_id] = self._bitsets.get(skill_id, 0) & ~ids_to_bits(payload)
+            self._generation += 1
+
+    # ---------- reconciliation ----------
+
+    async def reload(self, attempts: int = 3) -> bool:
+        """Rebuild from MySQL. Returns True once a consistent snapshot is applied."""
+        for _ in range(attempts):
+            with self._lock:
+                generation = self._generation
+            names = {row["id"]: row["name"] for row in await skill_model.get_skills()}
+            members = {skill_id: [] for skill_id in names}
+            async for row in skill_model.iter_memberships():
+                members.setdefault(row["skill_id"], []).append(row["student_id"])
+            student_ids = [row["id"] async for row in skill_model.iter_student_ids()]
+            # Packing large bitsets is CPU work; keep it off the event loop
+            bitsets, students = await asyncio.get_running_loop().run_in_executor(
+                None, _build, members, student_ids
+            )
+            with self._lock:
+                if generation != self._generation:
+                    continue  # a write landed mid-scan; take a fresh snapshot
+                self._names = names
+                self._bitsets = {skill_id: bitsets.get(skill_id, 0) for skill_id in names}
+                self._students = students
+                self.loaded = True
+                self.last_loaded_at = time.time()
+                return True
+        return False
+
+    # ---------- reads ----------
+
+    def skills(self) -> list:
+        with self._lock:
+            return [{"id": skill_id, "name": name} for skill_id, name in self._names.items()]
+
+    def has_skill(self, skill_id: int) -> bool:
+        with self._lock:
+            return skill_id in self._names
+
+    def distribution(self) -> list:
+        """[{"skill", "count"}] for every skill, like the old GROUP BY query."""
+        with self._lock:
+            return [
+                {"skill": self._names[skill_id], "count": _popcount(bits)}
+                for skill_id, bits in self._bitsets.items()
+            ]
+
+    def student_skills(self, student_id: int):
+        """Skills held by a student, or None if the student does not exist."""
+        with self._lock:
+            # Ids past the highest existing student would only build a huge int to test
+            if not 0 <= student_id < self._students.bit_length():
+                return None
+            bit = 1 << student_id
+            if not self._students & bit:
+                return None
+            return [
+                {"id": skill_id, "name": self._names[skill_id]}
+                for skill_id, bits in self._bitsets.items() if bits & bit
+            ]
+
+    def query(self, all_of=(), any_of=(), none_of=(), offset: int = 0, limit: int = 100) -> dict:
+        """
+        Students holding every skill in `all_of`, at least one in `any_of` (if
+        given) and none in `none_of`. Raises KeyError for an unknown skill id.
+        """
+        with self._lock:
+            for skill_id in (*all_of, *any_of, *none_of):
+                if skill_id not in self._bitsets:
+                    raise KeyError(skill_id)
+            result = self._students
+            for skill_id in all_of:
+                result &= self._bitsets[skill_id]
+            if any_of:
+                either = 0
+                for skill_id in any_of:
+                    either |= self._bitsets[skill_id]
+                result &= either
+            for skill_id in none_of:
+                result &= ~self._bitsets[skill_id]
+        return {
+            "count": _popcount(result),
+            "offset": offset,
+            "student_ids": bits_to_ids(result, offset, limit),
+        }
+
+
+def _build(members: dict, student_ids: list):
+    return {skill_id: ids_to_bits(ids) for skill_id, ids in members.items()}, ids_to_bits(student_ids)
+
+
+index = SkillIndex()
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    index.on_student_write(op, student_id, before, after)
+
+
+def on_skill_write(op: str, skill_id: int, payload):
+    index.on_skill_write(op, skill_id, payload)
@@ -0,0 +1,140 @@
+# src/services/startup.py
+"""
+Startup pipeline and readiness state.
+
+The server starts listening as soon as the app is built, so /healthz answers
+straight away, while this pipeline opens the database pools, loads and warms
+the model, starts the password hashing workers and fills the in-memory indexes
+in the background. /readyz reports 503 until every critical phase has
+succeeded, so a load balancer only routes traffic to a process that won't make
+its first users pay for cold starts.
+
+Critical phases are retried every STARTUP_RETRY_SECONDS until they succeed;
+optional phases are attempted once after the process is ready, and otherwise
+left to the reconcile loop. Until an index is loaded its routes answer from
+MySQL.
+"""
+import asyncio
+import os
+import time
+
+from fastapi.concurrency import run_in_threadpool
+
+STARTUP_RETRY_SECONDS = float(os.getenv("STARTUP_RETRY_SECONDS", "5"))
+
+
+class StartupState:
+    def __init__(self):
+        self.ready = False
+        self.started_at = time.time()
+        self.ready_at = None
+        # name -> latest {"name", "seconds", "ok", "error", "attempts"}, in first-run order
+        self.phases = {}
+
+    def record(self, name: str, seconds: float, error=None):
+        previous = self.phases.get(name)
+        self.phases[name] = {
+            "name": name,
+            "seconds": round(seconds, 4),
+            "ok": error is None,
+            "error": None if error is None else str(error),
+            "attempts": previous["attempts"] + 1 if previous else 1,
+        }
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at,
+            "ready_at": self.ready_at,
+            "phases": list(self.phases.values()),
+        }
+
+
+state = StartupState()
+
+
+async def _phase(name: str, fn, critical: bool):
+    """Run one phase, recording how long it took. `fn` is an async callable."""
+    while True:
+        start = time.perf_counter()
+        try:
+            await fn()
+        except Exception as e:
+            state.record(name, time.perf_counter() - start, e)
+            if not critical:
+                print(f"⚠️  Startup phase {name} failed: {e}")
+                return False
+            print(f"❌ Startup phase {name} failed, retrying in {STARTUP_RETRY_SECONDS:g}s: {e}")
+            await asyncio.sleep(STARTUP_RETRY_SECONDS)
+            continue
+        seconds = time.perf_counter() - start
+        state.record(name, seconds)
+        print(f"✅ Startup phase {name} done in {seconds * 1000:.0f} ms.")
+        return True
+
+
+async def _prefill_sync_pool():
+    from db.connection import prefill_pool
+    await run_in_threadpool(prefill_pool)
+
+
+async def _open_async_pool():
+    from db.async_connection import get_async_pool
+    await get_async_pool()
+
+
+async def _warm_model():
+    from ml import predictor
+    await predictor.warm_up()
+
+
+async def _warm_hash_pool():
+    from auth.hashing import warm_hash_pool
+    await warm_hash_pool()
+
+
+async def _load_aggregates():
+    from services import aggregates
+    await run_in_threadpool(aggregates.store.reconcile)
+
+
+async def _load_rankings():
+    from services import rankings
+    await run_in_threadpool(rankings.store.reload)
+
+
+async def _load_feature_store():
+    from services import feature_store
+    await run_in_threadpool(feature_store.store.reload)
+
+
+async def _load_skill_index():
+    from services import skill_index
+    await skill_index.index.reload()
+
+
+CRITICAL_PHASES = [
+    ("db_pool", _prefill_sync_pool),
+    ("async_db_pool", _open_async_pool),
+    ("model", _warm_model),
+    ("hash_pool", _warm_hash_pool),
+]
+
+OPTIONAL_PHASES = [
+    ("aggregates", _load_aggregates),
+    ("rankings", _load_rankings),
+    ("feature_store", _load_feature_store),
+    ("skill_index", _load_skill_index),
+]
+
+
+async def run():
+    """Run the critical phases, mark the process ready, then load the optional indexes."""
+    total = time.perf_counter()
+    for name, fn in CRITICAL_PHASES:
+        await _phase(name, fn, critical=True)
+    state.ready = True
+    state.ready_at = time.time()
+    print(f"🚀 Ready after {time.perf_counter() - total:.2f}s of startup work.")
+    for name, fn in OPTIONAL_PHASES:
+        await _phase(name, fn, critical=False)
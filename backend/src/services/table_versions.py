@@ -0,0 +1,90 @@
+# src/services/table_versions.py
+"""
+Per-table version counters and ETag helpers for conditional GETs.
+
+Every committed write bumps the version of the table it touched. A GET
+response's ETag is derived from the versions of the tables it reads plus the
+request path and query, so a matching If-None-Match can be answered with 304
+before any query runs. The ETag also carries a per-process epoch: counters
+restart at zero with the process, and other workers count independently, so
+tags from another process never match.
+
+Writes made outside this process (other workers, scripts, manual SQL) are not
+seen until bump_all() runs, which the periodic reconciliation does.
+"""
+import hashlib
+import secrets
+import threading
+
+from fastapi import Request, Response
+
+EPOCH = secrets.token_hex(4)
+
+
+class TableVersions:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+
+    def bump(self, table: str):
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def bump_all(self):
+        self.bump("*")
+
+    def get(self, table: str) -> int:
+        with self._lock:
+            # "*" is folded in so bump_all() also changes tables never written here
+            return self._versions.get(table, 0) + self._versions.get("*", 0)
+
+
+versions = TableVersions()
+
+
+def etag_for(request: Request, *tables: str) -> str:
+    """Strong ETag for `request` given the current versions of `tables`."""
+    state = ".".join(f"{t}{versions.get(t)}" for t in tables)
+    variant = hashlib.sha1(
+        f"{request.url.path}?{sorted(request.query_params.multi_items())}".encode("utf-8")
+    ).hexdigest()[:12]
+    return f'"{EPOCH}-{state}-{variant}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = (t.strip() for t in if_none_match.split(","))
+    return any((t[2:] if t.startswith("W/") else t) == etag for t in candidates)
+
+
+def conditional_get(request: Request, response: Response, *tables: str):
+    """
+    Call before running a GET handler's queries. Returns a 304 Response when the
+    client's If-None-Match is current; otherwise sets ETag on `response` and
+    returns None. Take the tag before querying, so a concurrent write can only
+    make it older than the data, never newer.
+    """
+    etag = etag_for(request, *tables)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def on_student_write(op: str, student_id: int, before, after):
+    """student_model write listener."""
+    versions.bump("students")
+
+
+def on_skill_write(op: str, skill_id: int, payload):
+    """skill_model write listener."""
+    versions.bump("skills" if op in ("skill_created", "skill_deleted") else "student_skills")
+
+
+def on_predictions_written(rows: list):
+    """prediction_writer listener."""
+    versions.bump("predictions")
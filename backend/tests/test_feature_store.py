@@ -0,0 +1,130 @@
+"""
+FeatureStore: incremental upserts and deletes, compaction, and the reads the
+prediction routes use (snapshot, rows_of, features_of). No database needed.
+
+    python -m unittest discover tests      (or: python -m pytest tests)
+"""
+import math
+import os
+import sys
+import unittest
+from unittest import mock
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BACKEND, "src"))
+
+from ml.features import FEATURE_FIELDS
+from services.feature_store import FeatureStore, missing_fields
+
+
+def _student(cgpa, **overrides) -> dict:
+    row = {
+        "iq": 100, "prev_sem_result": 7.0, "cgpa": cgpa, "academic_performance": 7,
+        "extra_curricular_score": 5, "communication_skills": 6, "projects_completed": 2,
+        "internship_experience": 1,
+    }
+    row.update(overrides)
+    return row
+
+
+def _cgpa(X) -> list:
+    return [float(v) for v in X[:, FEATURE_FIELDS.index("cgpa")]]
+
+
+class FeatureStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = FeatureStore()
+
+    def _insert(self, student_id, cgpa, **overrides):
+        self.store.on_student_write("insert", student_id, None, _student(cgpa, **overrides))
+
+    def _delete(self, student_id):
+        self.store.on_student_write("delete", student_id, {"id": student_id}, None)
+
+    def test_out_of_order_upserts_stay_sorted(self):
+        for student_id in (5, 1, 9, 3):
+            self._insert(student_id, float(student_id))
+        ids, X = self.store.snapshot()
+        self.assertEqual(list(ids), [1, 3, 5, 9])
+        self.assertEqual(_cgpa(X), [1.0, 3.0, 5.0, 9.0])
+
+        # Updating an existing id replaces its row in place
+        self.store.on_student_write("update", 3, None, _student(8.5))
+        ids, X = self.store.snapshot()
+        self.assertEqual(list(ids), [1, 3, 5, 9])
+        self.assertEqual(_cgpa(X), [1.0, 8.5, 5.0, 9.0])
+
+    def test_grows_past_initial_capacity(self):
+        for student_id in range(3000, 0, -1):
+            self._insert(student_id, 7.0)
+        ids, _ = self.store.snapshot()
+        self.assertEqual(list(ids), list(range(1, 3001)))
+
+    def test_delete_and_compaction(self):
+        for student_id in range(1, 201):
+            self._insert(student_id, 7.0)
+        self._delete(10)
+        self.assertEqual(self.store.stats()["deleted_pending_compaction"], 1)
+        self.assertIsNone(self.store.features_of(10))
+        self.assertNotIn(10, list(self.store.snapshot()[0]))
+
+        # Enough deletes trigger a compaction; survivors keep their rows
+        for student_id in range(11, 101):
+            self._delete(student_id)
+        stats = self.store.stats()
+        self.assertEqual(stats["students"], 109)
+        self.assertLess(stats["deleted_pending_compaction"], 65)
+        ids, X = self.store.snapshot()
+        self.assertEqual(list(ids), list(range(1, 10)) + list(range(101, 201)))
+        self.assertEqual(len(X), 109)
+
+        # A deleted id can come back
+        self._insert(10, 9.5)
+        self.assertEqual(_cgpa(self.store.rows_of([10])[1]), [9.5])
+
+    def test_snapshot_complete_only(self):
+        self._insert(1, 7.0)
+        self._insert(2, None)
+        self.assertEqual(list(self.store.snapshot()[0]), [1])
+        ids, X = self.store.snapshot(complete_only=False)
+        self.assertEqual(list(ids), [1, 2])
+        self.assertTrue(math.isnan(_cgpa(X)[1]))
+        self.assertEqual(missing_fields(X[1]), ["cgpa"])
+
+    def test_rows_of_missing_and_duplicate_ids(self):
+        for student_id in (2, 4, 6):
+            self._insert(student_id, float(student_id))
+        self._delete(4)
+        ids, X = self.store.rows_of([6, 1, 4, 2, 7, 6])
+        self.assertEqual(list(ids), [2, 6])
+        self.assertEqual(_cgpa(X), [2.0, 6.0])
+        self.assertEqual(len(self.store.rows_of([])[0]), 0)
+
+    def test_empty_store(self):
+        # Never loaded
+        ids, X = self.store.rows_of([1, 2])
+        self.assertEqual((len(ids), X.shape), (0, (0, 8)))
+        self.assertEqual(len(self.store.snapshot()[0]), 0)
+        self.assertIsNone(self.store.features_of(1))
+
+        # Loaded from an empty table
+        with mock.patch("services.feature_store.stream_query", return_value=iter([])):
+            self.assertTrue(self.store.reload())
+        self.assertTrue(self.store.loaded)
+        ids, X = self.store.rows_of([1, 2])
+        self.assertEqual((len(ids), X.shape), (0, (0, 8)))
+        self.assertEqual(len(self.store.snapshot()[0]), 0)
+
+        # Every student deleted; the last delete compacts the store to zero rows
+        for student_id in range(1, 66):
+            self._insert(student_id, 7.0)
+        for student_id in range(1, 66):
+            self._delete(student_id)
+        self.assertEqual(self.store.stats()["deleted_pending_compaction"], 0)
+        ids, X = self.store.rows_of([1, 5, 1000])
+        self.assertEqual((len(ids), X.shape), (0, (0, 8)))
+        self.assertEqual(len(self.store.snapshot()[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
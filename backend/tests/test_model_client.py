@@ -0,0 +1,158 @@
+"""
+AsyncModelClient and the remote predict_matrix() path against
+scripts/stub_model_server.py, served in-process.
+
+    python -m unittest discover tests      (or: python -m pytest tests)
+"""
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BACKEND, "src"))
+sys.path.append(os.path.join(BACKEND, "scripts"))
+
+import uvicorn
+
+import numpy as np
+
+import stub_model_server as stub
+from ml import predictor
+from ml.client import AsyncModelClient
+
+_server = None
+_thread = None
+URL = None
+
+
+def _record(cgpa: float) -> dict:
+    return {"CGPA": cgpa, "Communication_Skills": 6}
+
+
+def _matrix(cgpas: list):
+    """Feature rows whose only deciding columns are CGPA and Communication_Skills."""
+    return np.array([[100, 7, c, 7, 5, 6, 3, 1] for c in cgpas], dtype=np.float64)
+
+
+def setUpModule():
+    global _server, _thread, URL
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    URL = f"http://127.0.0.1:{port}/predict"
+    _server = uvicorn.Server(uvicorn.Config(stub.app, host="127.0.0.1", port=port, log_level="warning"))
+    _thread = threading.Thread(target=_server.run, daemon=True)
+    _thread.start()
+    deadline = time.time() + 10
+    while not _server.started:
+        if time.time() > deadline:
+            raise RuntimeError("stub model server did not start")
+        time.sleep(0.01)
+
+
+def tearDownModule():
+    _server.should_exit = True
+    _thread.join(5)
+
+
+def _reset_stub():
+    stub.app.state.requests = 0
+    stub.app.state.records = 0
+    stub.app.state.singular = False
+    stub.app.state.drop = 0
+
+
+class ModelClientTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        _reset_stub()
+        self.url = URL
+
+    async def test_concurrent_calls_share_requests(self):
+        client = AsyncModelClient(url=self.url, max_batch_size=16, max_wait_ms=20)
+        try:
+            cgpas = [6.0 + (i % 4) for i in range(64)]
+            labels = await asyncio.gather(*(client.predict_one(_record(c)) for c in cgpas))
+        finally:
+            await client.aclose()
+        self.assertEqual(labels, ["Yes" if c >= 7.5 else "No" for c in cgpas])
+        self.assertEqual(stub.app.state.records, 64)
+        self.assertLessEqual(stub.app.state.requests, 8)
+
+    async def test_length_mismatch_fails_every_caller(self):
+        stub.app.state.drop = 1
+        client = AsyncModelClient(url=self.url, max_batch_size=4, max_wait_ms=20)
+        try:
+            results = await asyncio.gather(
+                *(client.predict_one(_record(8.0)) for _ in range(4)), return_exceptions=True
+            )
+        finally:
+            await client.aclose()
+        self.assertEqual(len(results), 4)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+            self.assertIn("3 predictions for 4 records", str(result))
+
+    async def test_close_drains_pending_records(self):
+        # A wait far longer than the test: only aclose() can send these
+        client = AsyncModelClient(url=self.url, max_batch_size=100, max_wait_ms=60_000)
+        tasks = [asyncio.ensure_future(client.predict_one(_record(9.0))) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        self.assertEqual(stub.app.state.requests, 0)
+        await asyncio.wait_for(client.aclose(), 5)
+        self.assertEqual([t.result() for t in tasks], ["Yes"] * 5)
+        self.assertEqual(stub.app.state.requests, 1)
+
+    async def test_singular_response_shape(self):
+        # The original API answers {"prediction": label} for the first record only
+        stub.app.state.singular = True
+        client = AsyncModelClient(url=self.url, max_batch_size=8, max_wait_ms=20)
+        try:
+            self.assertEqual(await client.predict_one(_record(9.0)), "Yes")
+            cgpas = [6.0, 8.0, 9.0, 7.0]
+            labels = await asyncio.gather(*(client.predict_one(_record(c)) for c in cgpas))
+            self.assertTrue(client.stats()["singular"])
+        finally:
+            await client.aclose()
+        self.assertEqual(labels, ["No", "Yes", "Yes", "No"])
+
+
+
+class RemotePredictMatrixTest(unittest.TestCase):
+    def setUp(self):
+        _reset_stub()
+        self._saved = (predictor.ML_BACKEND, predictor.ML_API_URL)
+        predictor.ML_BACKEND = "remote"
+        predictor.ML_API_URL = URL
+        predictor._remote_singular = False
+
+    def tearDown(self):
+        predictor.ML_BACKEND, predictor.ML_API_URL = self._saved
+        predictor._remote_singular = False
+
+    def test_one_request_per_matrix(self):
+        cgpas = [6.0, 8.0, 9.0, 7.0]
+        self.assertEqual(predictor.predict_matrix(_matrix(cgpas)), ["No", "Yes", "Yes", "No"])
+        self.assertEqual(stub.app.state.requests, 1)
+
+    def test_length_mismatch_raises(self):
+        stub.app.state.drop = 1
+        with self.assertRaisesRegex(predictor.PredictionError, "3 predictions for 4 records"):
+            predictor.predict_matrix(_matrix([6.0, 8.0, 9.0, 7.0]))
+
+    def test_singular_response_shape(self):
+        stub.app.state.singular = True
+        cgpas = [6.0, 8.0, 9.0, 7.0]
+        self.assertEqual(predictor.predict_matrix(_matrix(cgpas)), ["No", "Yes", "Yes", "No"])
+        self.assertTrue(predictor._remote_singular)
+        # Later calls go straight to one record per request
+        stub.app.state.requests = 0
+        self.assertEqual(predictor.predict_matrix(_matrix([9.0, 6.0])), ["Yes", "No"])
+        self.assertEqual(stub.app.state.requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Bulk student import: batching and validation of uploads, and (with a local
+MySQL from DB_HOST/DB_USER/DB_PASS/DB_NAME, migrations applied) the import
+route and async bulk insert end to end. The MySQL tests skip when it can't
+be reached.
+
+    python -m unittest discover tests      (or: python -m pytest tests)
+"""
+import asyncio
+import io
+import os
+import sys
+import unittest
+import uuid
+from contextlib import asynccontextmanager
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BACKEND, "src"))
+
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+import auth.deps
+from routes import student_routes
+from routes.student_routes import _ImportReport, _iter_upload_rows, _next_batch
+
+HEADER = "name,email,cgpa,iq,projects_completed,internship_experience\n"
+
+
+def _upload(body: bytes, filename: str = "students.csv") -> UploadFile:
+    return UploadFile(file=io.BytesIO(body), filename=filename)
+
+
+def _mysql_available() -> bool:
+    try:
+        import mysql.connector
+        conn = mysql.connector.connect(
+            host=os.getenv("DB_HOST", "localhost"),
+            user=os.getenv("DB_USER", "root"),
+            password=os.getenv("DB_PASS", "root"),
+            database=os.getenv("DB_NAME", "student_placement"),
+            connection_timeout=2,
+        )
+    except Exception:
+        return False
+    conn.close()
+    return True
+
+
+class NextBatchTest(unittest.TestCase):
+    def test_batches_and_reports_invalid_rows(self):
+        body = HEADER + "".join(
+            f"Student {i},s{i}@example.com,8.{i},100,2,true\n" for i in range(5)
+        ) + "No Email,not-an-email,7.0,,,\n"
+        rows = _iter_upload_rows(_upload(body.encode()), "csv")
+        report = _ImportReport()
+
+        batch, done = _next_batch(rows, 2, report)
+        self.assertEqual([n for n, _ in batch], [1, 2])
+        self.assertFalse(done)
+        self.assertEqual(batch[0][1]["cgpa"], 8.0)
+        self.assertIs(batch[0][1]["internship_experience"], True)
+
+        sizes = []
+        while not done:
+            batch, done = _next_batch(rows, 2, report)
+            sizes.append(len(batch))
+        self.assertEqual(sizes, [2, 1])
+        self.assertEqual(report.total, 6)
+        self.assertEqual(report.failed, 1)
+        self.assertEqual(report.errors[0]["row"], 6)
+        self.assertIn("email", report.errors[0]["errors"][0])
+
+    def test_ndjson_parse_errors(self):
+        body = b'{"name": "A", "email": "a@example.com"}\n\nnot json\n[1, 2]\n'
+        report = _ImportReport()
+        batch, done = _next_batch(_iter_upload_rows(_upload(body, "s.ndjson"), "ndjson"), 10, report)
+        self.assertTrue(done)
+        self.assertEqual([n for n, _ in batch], [1])
+        self.assertEqual([e["row"] for e in report.errors], [3, 4])
+        self.assertIn("Invalid JSON", report.errors[0]["errors"][0])
+
+    def test_unreadable_file_stops_with_error(self):
+        report = _ImportReport()
+        body = HEADER.encode() + b"Caf\xe9,c@example.com,8,100,1,false\n"
+        batch, done = _next_batch(_iter_upload_rows(_upload(body), "csv"), 10, report)
+        self.assertTrue(done)
+        self.assertEqual(batch, [])
+        self.assertIn("Could not read file", report.errors[0]["errors"][0])
+
+
+@unittest.skipUnless(_mysql_available(), "MySQL not available")
+class ImportWithMySQLTest(unittest.TestCase):
+    def setUp(self):
+        self.tag = uuid.uuid4().hex[:12]
+
+    def tearDown(self):
+        from db.connection import connection
+        with connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute("DELETE FROM students WHERE email LIKE %s", (f"%{self.tag}%",))
+                conn.commit()
+            finally:
+                cur.close()
+
+    def _count(self) -> int:
+        from db.connection import connection
+        with connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute("SELECT COUNT(*) FROM students WHERE email LIKE %s", (f"%{self.tag}%",))
+                return cur.fetchone()[0]
+            finally:
+                cur.close()
+
+    def test_import_route(self):
+        from db.async_connection import close_async_pool
+
+        @asynccontextmanager
+        async def lifespan(app):
+            yield
+            await close_async_pool()
+
+        app = FastAPI(lifespan=lifespan)
+        app.include_router(student_routes.router)
+        app.dependency_overrides[auth.deps.get_current_admin] = lambda: {"username": "test"}
+        body = HEADER + "".join(
+            f"Student {i},s{i}.{self.tag}@example.com,7.5,105,1,false\n" for i in range(7)
+        ) + f"Bad Row,bad.{self.tag},x,,,\n"
+        with TestClient(app) as client:
+            response = client.post(
+                "/admin/students/import?batch_size=3",
+                files={"file": ("students.csv", body.encode(), "text/csv")},
+            )
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual(report["total_rows"], 8)
+        self.assertEqual(report["inserted"], 7)
+        self.assertEqual(report["failed"], 1)
+        self.assertEqual(report["errors"][0]["row"], 8)
+        self.assertEqual(self._count(), 7)
+
+    def test_async_bulk_insert(self):
+        import models.async_student_model as student_model
+        from db.async_connection import close_async_pool
+
+        students = [
+            student_routes.StudentIn(name=f"Bulk {i}", email=f"b{i}.{self.tag}@example.com", cgpa=8.0).dict()
+            for i in range(4)
+        ]
+
+        async def run():
+            try:
+                inserted = await student_model.add_students_bulk(students)
+                single = await student_model.add_student(
+                    student_routes.StudentIn(name="One", email=f"one.{self.tag}@example.com").dict()
+                )
+                return inserted, single
+            finally:
+                await close_async_pool()
+
+        inserted, single = asyncio.run(run())
+        self.assertEqual(inserted, 4)
+        self.assertGreater(single, 0)
+        self.assertEqual(self._count(), 5)
+
+    def test_bulk_insert_notifies_stored_ids(self):
+        # ~1.7 MB of VALUES: aiomysql sends this as several INSERT statements
+        import models.async_student_model as async_student_model
+        from db.async_connection import close_async_pool
+        from db.connection import connection
+        from models import student_model
+
+        padding = "x" * 180
+        students = [
+            {"name": "N" * 100, "email": f"{padding}.{i}.{self.tag}@example.com", "cgpa": 7.0}
+            for i in range(5000)
+        ]
+        notified = {}
+
+        def listener(op, student_id, before, after):
+            if self.tag in after["email"]:
+                notified[after["email"]] = student_id
+
+        async def run():
+            try:
+                return await async_student_model.add_students_bulk(students)
+            finally:
+                await close_async_pool()
+
+        student_model.add_listener(listener)
+        try:
+            self.assertEqual(asyncio.run(run()), 5000)
+        finally:
+            student_model._listeners.remove(listener)
+
+        with connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute("SELECT email, id FROM students WHERE email LIKE %s", (f"%{self.tag}%",))
+                stored = dict(cur.fetchall())
+            finally:
+                cur.close()
+        self.assertEqual(len(stored), 5000)
+        self.assertEqual(notified, stored)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,3 +73,94 @@ export async function getSkillDistribution(): Promise<SkillDistributionResponse>
   return await response.json();
 }
 
+
+export type DashboardCounts = {
+  students: number;
+  predictions: number;
+  placed: number;
+};
+
+export type DashboardSnapshot = {
+  summary: PerformanceSummary;
+  top_performers: TopPerformer[];
+  counts: DashboardCounts;
+};
+
+export type DashboardSubscription = {
+  close: () => void;
+};
+
+const STREAM_RETRY_MS = 3000;
+
+// One-time ticket for the stream: EventSource can't send the Authorization
+// header, and the access token must not end up in a URL.
+export async function getStreamTicket(): Promise<string> {
+  const response = await fetch(`${BASE_URL}/admin/performance/stream/ticket`, {
+    method: "POST",
+    headers: getAuthHeaders(),
+  });
+
+  if (!response.ok) {
+    throw new Error("Failed to get a stream ticket");
+  }
+
+  return (await response.json()).ticket;
+}
+
+// Live dashboard feed: `onUpdate` gets the full snapshot first, then only the
+// sections that changed. Tickets work once, so after an error the stream is
+// reopened with a fresh ticket (and the server re-sends a snapshot); callers
+// only need to close it on unmount.
+export function subscribeDashboard(
+  onUpdate: (update: Partial<DashboardSnapshot>) => void,
+  onError?: () => void
+): DashboardSubscription {
+  let source: EventSource | null = null;
+  let retry: ReturnType<typeof setTimeout> | null = null;
+  let closed = false;
+
+  const handle = (event: MessageEvent) => onUpdate(JSON.parse(event.data));
+
+  const reconnect = () => {
+    if (!closed) {
+      retry = setTimeout(connect, STREAM_RETRY_MS);
+    }
+  };
+
+  async function connect() {
+    let ticket: string;
+    try {
+      ticket = await getStreamTicket();
+    } catch {
+      onError?.();
+      reconnect();
+      return;
+    }
+    if (closed) {
+      return;
+    }
+    source = new EventSource(
+      `${BASE_URL}/admin/performance/stream?ticket=${encodeURIComponent(ticket)}`
+    );
+    source.addEventListener("snapshot", handle as EventListener);
+    source.addEventListener("delta", handle as EventListener);
+    source.onerror = () => {
+      source?.close();
+      source = null;
+      onError?.();
+      reconnect();
+    };
+  }
+
+  connect();
+
+  return {
+    close: () => {
+      closed = true;
+      if (retry) {
+        clearTimeout(retry);
+      }
+      source?.close();
+    },
+  };
+}
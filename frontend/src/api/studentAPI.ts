@@ -29,16 +29,26 @@ function getAuthHeaders() {
 }
 
 export async function getStudents(): Promise<Student[]> {
-  const response = await fetch(`${BASE_URL}/admin/students`, {
-    method: "GET",
-    headers: getAuthHeaders(),
-  });
-
-  if (!response.ok) {
-    throw new Error("Failed to fetch students");
-  }
-
-  return await response.json();
+  // The list endpoint is paginated; follow X-Next-Cursor until the last page
+  const students: Student[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const query: string = cursor ? `?limit=1000&cursor=${cursor}` : "?limit=1000";
+    const response: Response = await fetch(`${BASE_URL}/admin/students${query}`, {
+      method: "GET",
+      headers: getAuthHeaders(),
+    });
+
+    if (!response.ok) {
+      throw new Error("Failed to fetch students");
+    }
+
+    students.push(...(await response.json()));
+    cursor = response.headers.get("X-Next-Cursor");
+  } while (cursor);
+
+  return students;
 }
 
 export async function getStudentById(studentId: number): Promise<Student> {
@@ -3,7 +3,7 @@ import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { getDashboard } from "../api/adminAPI";
 import { getStudents } from "../api/studentAPI";
-import { getPerformanceSummary } from "../api/performanceAPI";
+import { getPerformanceSummary, subscribeDashboard } from "../api/performanceAPI";
 import Sidebar from "../components/Sidebar";
 import { Users, BookOpen, CheckCircle2, Brain, GraduationCap, Zap, Server, Activity, TrendingUp } from "lucide-react";
 
@@ -18,6 +18,13 @@ const AdminDashboard: React.FC = () => {
 
   useEffect(() => {
     fetchData();
+    if (!token) return;
+    // Keep the stats cards current from the live feed instead of re-polling
+    const source = subscribeDashboard((update) => {
+      if (update.summary) setPerformance(update.summary);
+      if (update.counts) setTotalStudents(update.counts.students);
+    });
+    return () => source.close();
   }, [token]);
 
   const fetchData = async () => {
@@ -6,6 +6,7 @@ import {
   getPerformanceSummary,
   getTopPerformers,
   getSkillDistribution,
+  subscribeDashboard,
 } from "../api/performanceAPI";
 import Sidebar from "../components/Sidebar";
 import { 
@@ -31,6 +32,12 @@ const PerformanceSummary: React.FC = () => {
 
   useEffect(() => {
     fetchPerformanceData();
+    // Summary and top performers are then pushed by the server as they change
+    const source = subscribeDashboard((update) => {
+      if (update.summary) setSummary(update.summary);
+      if (update.top_performers) setTopPerformers(update.top_performers);
+    });
+    return () => source.close();
   }, []);
 
   const fetchPerformanceData = async () => {